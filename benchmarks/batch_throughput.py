@@ -0,0 +1,96 @@
+"""
+Throughput of batched window decoding against batch size.
+
+Usage (from the project root):
+    python -m benchmarks.batch_throughput --audio lecture.mp3
+    python -m benchmarks.batch_throughput --models tiny base --batch-sizes 1 4 16
+
+Without --audio a synthetic recording is used: the encoder cost is realistic,
+decoder cost is not (it produces little text), so prefer real speech.
+"""
+import sys
+import json
+import time
+import argparse
+import numpy as np
+from typing import Any, Dict, List
+
+
+from src.utils.transcripting.convert_audio import ConvertAudio
+from src.utils.transcripting.set_model import SetModel
+from src.utils.transcripting.window_decoder import WindowDecoder
+
+
+
+def synthetic_audio(seconds: float, sample_rate: int = 16000) -> np.ndarray:
+    """Noise bursts separated by pauses, so windows are cut at silences."""
+    rng = np.random.default_rng(0)
+    audio = rng.normal(0, 0.1, int(seconds * sample_rate)).astype(np.float32)
+    envelope = (np.arange(len(audio)) // (sample_rate * 4)) % 3 != 2  # 8 s on, 4 s off
+    return audio * envelope
+
+
+def run(models: List[str], batch_sizes: List[int], audio: np.ndarray) -> List[Dict[str, Any]]:
+    duration = len(audio) / 16000
+    rows = []
+
+    for model_size in models:
+        model = SetModel().load(model_size)
+
+        for batch_size in batch_sizes:
+            decoder = WindowDecoder(model, batch_size)
+            decoder.transcribe(audio[: 16000 * 30], language="en")  # Warm-up
+
+            start = time.time()
+            decoder.transcribe(audio, language="en")
+            elapsed = time.time() - start
+
+            rows.append(
+                {
+                    "model": model_size,
+                    "batch_size": batch_size,
+                    "windows": decoder.stats["windows"],
+                    "seconds": round(elapsed, 2),
+                    "windows_per_second": round(decoder.stats["windows"] / elapsed, 3),
+                    "realtime_factor": round(elapsed / duration, 4),
+                    "encode_time": round(decoder.stats["encode_time"], 2),
+                    "decode_time": round(decoder.stats["decode_time"], 2),
+                }
+            )
+            print(json.dumps(rows[-1]), file=sys.stderr)
+
+    return rows
+
+
+def to_markdown(rows: List[Dict[str, Any]]) -> str:
+    headers = list(rows[0].keys()) if rows else []
+    lines = ["| " + " | ".join(headers) + " |", "|" + "---|" * len(headers)]
+    lines += ["| " + " | ".join(str(row[h]) for h in headers) + " |" for row in rows]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--audio", help="Audio/video file to decode")
+    parser.add_argument("--seconds", type=float, default=300.0, help="Synthetic audio length")
+    parser.add_argument("--models", nargs="+", default=["tiny", "base", "small"])
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--json", help="Also write the rows to this JSON file")
+    args = parser.parse_args()
+
+    if args.audio:
+        converter = ConvertAudio()
+        audio, _ = converter.convert(converter.validate_input(args.audio))
+    else:
+        audio = synthetic_audio(args.seconds)
+
+    rows = run(args.models, args.batch_sizes, audio)
+    print(to_markdown(rows))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
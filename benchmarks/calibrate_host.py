@@ -0,0 +1,130 @@
+"""
+Calibrate MODEL_SPEEDS / SETUP_TIMES for the current host.
+
+Usage (from the project root):
+    python -m benchmarks.calibrate_host --audio lecture.mp3
+    python -m benchmarks.calibrate_host --audio lecture.mp3 --models tiny base small
+
+Each model size is loaded and timed in a fresh process: the load gives its
+setup time, the transcription of the fixture its speed, converted to the
+words per second TimeEstimator works with (TimeEstimator.WORDS_PER_SECOND_MEAN
+words per audio second). The profile is saved under CACHE_DIR/profiles for
+this host and picked up automatically by TimeEstimator and ModelSelector.
+Only the sizes measured are saved; the others keep the built-in values.
+
+The fixture must be real speech (a few minutes of a typical recording):
+synthetic audio decodes to almost no text and would overstate the speed.
+Checkpoints missing locally are downloaded before the timed load.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import multiprocessing
+import numpy as np
+from typing import Any, Dict, List
+
+
+from benchmarks.batch_throughput import to_markdown
+from src.utils.models import MODELS, MODEL_SPEEDS, SETUP_TIMES
+from src.utils.transcripting.convert_audio import ConvertAudio
+from src.utils.transcripting.estimator import TimeEstimator
+from src.utils.transcripting.host_profile import HostProfile
+
+
+SAMPLE_RATE = 16000
+WARMUP_SECONDS = 30.0  # Decoded once before the timed run
+
+
+
+def time_model(model_size: str, audio: np.ndarray) -> Dict[str, Any]:
+    """Setup and transcription time of one model size; meant to run in its own process."""
+    from src.utils.transcripting.backends import WhisperBackend
+    from src.utils.transcripting.set_model import SetModel
+
+    loader = SetModel()
+    if not os.path.isfile(loader.checkpoint_path(model_size)):
+        loader.load(model_size)  # Download (and hash) outside the timed load
+
+    start = time.time()
+    backend = WhisperBackend()
+    backend.load(model_size)
+    setup_time = time.time() - start
+
+    options = {"language": "en", "temperature": 0.0}
+    backend.transcribe(audio[: int(WARMUP_SECONDS * SAMPLE_RATE)], **options)
+
+    start = time.time()
+    backend.transcribe(audio, **options)
+    elapsed = time.time() - start
+
+    return {
+        "setup_time": round(setup_time, 2),
+        "seconds": round(elapsed, 2),
+        "realtime_factor": round(elapsed / (len(audio) / SAMPLE_RATE), 4),
+        "device": str(backend.model.device),
+    }
+
+
+def calibrate(models: List[str], audio: np.ndarray, fixture: str) -> HostProfile:
+    context = multiprocessing.get_context("spawn")  # Cold load per model, like a fresh app
+    duration = len(audio) / SAMPLE_RATE
+    speeds, setups, rows = {}, {}, []
+
+    for model_size in models:
+        with context.Pool(1) as pool:
+            stats = pool.apply(time_model, (model_size, audio))
+
+        speeds[model_size] = round(
+            TimeEstimator.WORDS_PER_SECOND_MEAN * duration / max(stats["seconds"], 1e-9), 2
+        )
+        setups[model_size] = stats["setup_time"]
+        rows.append({"model": model_size, "words_per_second": speeds[model_size], **stats})
+        print(json.dumps(rows[-1]), file=sys.stderr)
+
+    details = {
+        "host": HostProfile.host_id(),
+        "cpus": os.cpu_count(),
+        "processor": platform.processor(),
+        "fixture": fixture,
+        "fixture_seconds": round(duration, 1),
+        "measured_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "rows": rows,
+    }
+    return HostProfile(speeds, setups, details=details)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--audio", required=True, help="Audio/video file of real speech")
+    parser.add_argument("--models", nargs="+", default=list(MODELS))
+    parser.add_argument("--output", help="Profile path (default: this host's profile)")
+    args = parser.parse_args()
+
+    converter = ConvertAudio()
+    audio, _ = converter.convert(converter.validate_input(args.audio))
+
+    profile = calibrate(args.models, audio, args.audio)
+    path = profile.save(args.output)
+
+    print(
+        to_markdown(
+            [
+                {
+                    "model": model_size,
+                    "words_per_second": profile.model_speeds[model_size],
+                    "built_in_wps": MODEL_SPEEDS[model_size],
+                    "setup_time": profile.setup_times[model_size],
+                    "built_in_setup": SETUP_TIMES[model_size],
+                }
+                for model_size in args.models
+            ]
+        )
+    )
+    print(f"\nProfile saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Speed/accuracy sweep across model sizes, beam sizes and precisions.
+
+Usage (from the project root):
+    python -m benchmarks.model_sweep --fixtures fixtures/
+    python -m benchmarks.model_sweep --fixtures fixtures/ --models tiny base --beam-sizes 1 5
+
+A fixture is an audio/video file with its reference transcript next to it
+(lecture.mp3 + lecture.txt). Every configuration runs in a fresh process,
+so peak RSS and setup time are its own. The output lists real-time factor,
+words per second, peak RSS and WER per configuration, marks the Pareto
+front (lower RTF and lower WER), and suggests MODEL_SPEEDS / SETUP_TIMES
+for src/utils/models.py measured on this host.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import multiprocessing
+from typing import Any, Dict, List, Optional, Tuple
+
+
+from benchmarks.batch_throughput import to_markdown
+from src.utils.models import MODELS
+from src.utils.transcripting.convert_audio import ConvertAudio
+from src.utils.transcripting.segments import normalize_text
+
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac", ".ogg", ".mp4", ".mkv", ".webm")
+
+
+
+def load_fixtures(folder: str) -> List[Tuple[str, str]]:
+    """(audio path, reference text) for every audio file with a .txt next to it."""
+    fixtures = []
+    for name in sorted(os.listdir(folder)):
+        base, extension = os.path.splitext(name)
+        reference = os.path.join(folder, f"{base}.txt")
+        if extension.lower() in AUDIO_EXTENSIONS and os.path.isfile(reference):
+            with open(reference, encoding="utf-8") as f:
+                fixtures.append((os.path.join(folder, name), f.read()))
+
+    return fixtures
+
+
+def word_error_rate(reference: str, hypothesis: str) -> Tuple[int, int]:
+    """(word edits, reference words) after lowercasing and dropping punctuation."""
+    ref, hyp = normalize_text(reference).split(), normalize_text(hypothesis).split()
+    previous = list(range(len(hyp) + 1))
+
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,  # Deletion
+                current[j - 1] + 1,  # Insertion
+                previous[j - 1] + (ref_word != hyp_word),  # Substitution
+            )
+        previous = current
+
+    return previous[-1], len(ref)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_config(
+    model_size: str, beam_size: int, precision: str, fixtures: List[Tuple[str, str]]
+) -> Dict[str, Any]:
+    """One configuration over every fixture; meant to run in its own process."""
+    import torch
+    from src.utils.transcripting.backends import WhisperBackend
+
+    if precision == "fp16" and not torch.cuda.is_available():
+        return {"skipped": "fp16 needs a CUDA device"}  # Before paying for the model load
+
+    start = time.time()
+    backend = WhisperBackend()
+    backend.load(model_size)
+    setup_time = time.time() - start
+
+    options: Dict[str, Any] = {"language": "en", "temperature": 0.0, "fp16": precision == "fp16"}
+    if beam_size > 1:
+        options["beam_size"] = beam_size
+
+    converter = ConvertAudio()
+    audio_seconds = elapsed = 0.0
+    edits = words = 0
+    for path, reference in fixtures:
+        audio, duration = converter.convert(converter.validate_input(path))
+
+        start = time.time()
+        result = backend.transcribe(audio, **options)
+        elapsed += time.time() - start
+
+        audio_seconds += duration
+        fixture_edits, fixture_words = word_error_rate(reference, result.get("text", ""))
+        edits += fixture_edits
+        words += fixture_words
+
+    return {
+        "setup_time": round(setup_time, 2),
+        "seconds": round(elapsed, 2),
+        "realtime_factor": round(elapsed / max(audio_seconds, 1e-9), 4),
+        "words_per_second": round(words / max(elapsed, 1e-9), 2),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "wer": round(edits / max(words, 1), 4),
+    }
+
+
+def sweep(
+    fixtures: List[Tuple[str, str]],
+    models: List[str],
+    beam_sizes: List[int],
+    precisions: List[str],
+) -> List[Dict[str, Any]]:
+    context = multiprocessing.get_context("spawn")  # Fresh RSS and model load per row
+    rows = []
+
+    for model_size in models:
+        for beam_size in beam_sizes:
+            for precision in precisions:
+                with context.Pool(1) as pool:
+                    stats = pool.apply(run_config, (model_size, beam_size, precision, fixtures))
+
+                row = {"model": model_size, "beam_size": beam_size, "precision": precision, **stats}
+                print(json.dumps(row), file=sys.stderr)
+                if "skipped" not in row:
+                    rows.append(row)
+
+    return mark_pareto(rows)
+
+
+def mark_pareto(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flag rows no other row beats on both real-time factor and WER."""
+    for row in rows:
+        row["pareto"] = not any(
+            other["realtime_factor"] <= row["realtime_factor"]
+            and other["wer"] <= row["wer"]
+            and (other["realtime_factor"], other["wer"]) != (row["realtime_factor"], row["wer"])
+            for other in rows
+        )
+
+    return sorted(rows, key=lambda r: (r["realtime_factor"], r["wer"]))
+
+
+def suggested_constants(
+    rows: List[Dict[str, Any]], beam_size: int = 1, precision: Optional[str] = None
+) -> Dict[str, Dict[str, float]]:
+    """MODEL_SPEEDS / SETUP_TIMES from the rows matching the default decode settings."""
+    speeds, setups = {}, {}
+    for row in rows:
+        if row["beam_size"] == beam_size and (precision is None or row["precision"] == precision):
+            speeds.setdefault(row["model"], row["words_per_second"])
+            setups.setdefault(row["model"], row["setup_time"])
+
+    return {"MODEL_SPEEDS": speeds, "SETUP_TIMES": setups}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixtures", required=True, help="Folder of audio files + .txt references")
+    parser.add_argument("--models", nargs="+", default=list(MODELS))
+    parser.add_argument("--beam-sizes", nargs="+", type=int, default=[1, 5])
+    parser.add_argument("--precisions", nargs="+", default=["fp32", "fp16"])
+    parser.add_argument("--output", default="model_sweep", help="Writes <output>.json and .md")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        parser.error(f"No audio files with a .txt reference in {args.fixtures}")
+
+    rows = sweep(fixtures, args.models, args.beam_sizes, args.precisions)
+    constants = suggested_constants(rows, beam_size=1)
+    table = to_markdown(rows)
+    print(table)
+
+    with open(f"{args.output}.json", "w", encoding="utf-8") as f:
+        json.dump({"rows": rows, "constants": constants}, f, indent=2)
+
+    with open(f"{args.output}.md", "w", encoding="utf-8") as f:
+        f.write(f"# Model sweep ({len(fixtures)} fixtures)\n\n{table}\n\n")
+        f.write("## Suggested constants (beam size 1)\n\n")
+        f.write(f"```python\n{json.dumps(constants, indent=4)}\n```\n")
+
+
+if __name__ == "__main__":
+    main()
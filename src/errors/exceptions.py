@@ -247,6 +247,35 @@ class TranscriptionError(AppError):
             }
         )
     
+    @classmethod
+    def invalid_encoder_mode(cls, mode: str) -> "TranscriptionError":
+        return cls(
+            code=ErrorCode.INVALID_INPUT,
+            message=f"Invalid encoder mode: '{mode}'",
+            context={
+                "mode": mode
+            }
+        )
+
+    @classmethod
+    def invalid_backend(cls, name: str, available: list[str]) -> "TranscriptionError":
+        return cls(
+            code=ErrorCode.INVALID_INPUT,
+            message=f"Unknown transcription backend: '{name}'",
+            context={
+                "backend": name,
+                "available": available
+            }
+        )
+
+    @classmethod
+    def backend_unavailable(cls, name: str, error: Exception) -> "TranscriptionError":
+        return cls(
+            code=ErrorCode.SERVICE_UNAVAILABLE,
+            message=f"Transcription backend '{name}' is not installed",
+            context={"original_error": str(error)}
+        )
+
     @classmethod
     def sentence_split_failed(cls, original_exception: Exception) -> "TranscriptionError":
         return cls(
@@ -4,6 +4,7 @@ from .theme import configure_theme
 from .url_opener import open_browser
 from .warning_popup import WarningPopup
 from .async_processor import AsyncTaskManager
+from .pipeline_worker import PipelineWorker
 from .styles_manager import StyleManager
 from .widgets import Header, ButtonsPanel, MainWindow
 
@@ -15,6 +16,7 @@ __all__ = [
     "WarningPopup",
     "configure_theme",
     "AsyncTaskManager",
+    "PipelineWorker",
     "Header",
     "ButtonsPanel",
     "StyleManager",
@@ -1,6 +1,10 @@
+import sys
 import threading
+from queue import Queue
 
 
+from .pipeline_worker import PipelineWorker
+from src.utils.file_handler import ask_save_path
 from src.errors.debug import debug
 
 
@@ -14,15 +18,38 @@ class AsyncTaskManager:
         interface: Reference to the Interface instance (main Tkinter window), used for error reporting
                    and accessing the flow object that handles the actual video processing.
         completion_callback: Function to call on the main thread when processing finishes.
+        worker: PipelineWorker running EndFlow in its own process, used when the
+                interface has no in-process flow.
     """
 
     def __init__(self, gui_queue, interface, completion_callback):
         self.gui_queue = gui_queue
         self.interface = interface
         self.completion_callback = completion_callback
+        self.worker = PipelineWorker() if interface.flow is None else None
+
+    def start(self):
+        """Start the worker process early, so the model loads while the user picks a file."""
+        if self.worker:
+            self.worker.start()
+
+    def cancel(self):
+        """Stop the running job (worker process only)."""
+        if self.worker:
+            print("⏹️ Cancelling...")
+            self.worker.cancel()
+
+    def shutdown(self):
+        if self.worker:
+            self.worker.shutdown()
 
     def get_busy(
-        self, path, config_params=None, quick_script=False, progress_handler=None
+        self,
+        path,
+        config_params=None,
+        quick_script=False,
+        progress_handler=None,
+        segment_handler=None,
     ):
         """
         Launches video processing in a separate thread to avoid freezing the GUI.
@@ -32,13 +59,19 @@ class AsyncTaskManager:
             config_params (ContentType, optional): Configuration parameters for processing.
             quick_script (bool, optional): If True, output a simplified txt file.
             progress_handler (callable, optional): Callback function to report progress updates.
+            segment_handler (callable, optional): Receives each transcript segment as soon
+                as it is decoded (enables the streaming transcription path).
 
         Notes:
-            - The actual processing is delegated to `self.interface.flow.process_video`.
+            - The actual processing is delegated to `EndFlow.process_video`, in the
+              worker process, or on a thread when the interface was given a flow.
             - GUI updates (completion feedback or errors) are queued via `self.gui_queue`
               to ensure thread-safe interaction with Tkinter widgets.
             - Exceptions are caught and forwarded to the interface's `show_error` method.
         """
+        if self.worker:
+            self._submit(path, config_params, quick_script, progress_handler, segment_handler)
+            return
 
         def task():
             """
@@ -57,6 +90,7 @@ class AsyncTaskManager:
                     config_params=config_params,
                     quick_script=quick_script,
                     progress_callback=progress_handler,
+                    segment_handler=segment_handler,
                 )
 
                 debug.dprint(f"Processing completed for: {path}")
@@ -70,3 +104,29 @@ class AsyncTaskManager:
 
         # Launch async thread; daemon ensures it exits with app
         threading.Thread(target=task, daemon=True).start()
+
+    def _submit(self, path, config_params, quick_script, progress_handler, segment_handler):
+        """Hand the job to the worker process; its events come back on the listener thread."""
+
+        def ask_path(initial_file, extension):
+            # Dialogs belong to the Tk thread; the worker waits for the answer
+            reply = Queue()
+            self.gui_queue.put(lambda: reply.put(ask_save_path(initial_file, extension)))
+            return reply.get()
+
+        self.worker.submit(
+            {
+                "path": path,
+                "config_params": config_params,
+                "quick_script": quick_script,
+                "segments": segment_handler is not None,
+                "dev_logs": debug.is_dev_logs_enabled(),
+            },
+            on_log=sys.stdout.write,  # Interface.LogRedirector queues it for the Tk thread
+            on_progress=progress_handler,
+            on_segment=segment_handler,
+            on_save_path=ask_path,
+            on_done=lambda result: self.gui_queue.put(lambda: self.completion_callback(result)),
+            on_error=lambda message: self.gui_queue.put(lambda: self.interface.show_error(message)),
+            on_cancelled=lambda: self.gui_queue.put(lambda: self.completion_callback(None)),
+        )
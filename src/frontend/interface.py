@@ -36,9 +36,9 @@ class Interface(tk.Tk):
             pass
 
     # --------------------- Base Variables ---------------------
-    def __init__(self, flow):
+    def __init__(self, flow=None):
         super().__init__()
-        self.flow = flow  # Gets called in AsyncTaskManager
+        self.flow = flow  # In-process EndFlow; None runs the pipeline in a worker process
         self.running = False
         self._alive = True
         self.current_theme = "default"
@@ -61,6 +61,7 @@ class Interface(tk.Tk):
         sys.stdout = self.LogRedirector(self.gui_queue, self.log_text)
         sys.stderr = self.LogRedirector(self.gui_queue, self.log_text)
 
+        self.async_mgr.start()  # Worker process loads the model in the background
         self.after(100, lambda: WarningPopup.show(self, title="Important Notice"))
 
     # --------------------- Window Configuration ---------------------
@@ -154,7 +155,10 @@ class Interface(tk.Tk):
 
         # Buttons panel
         self.buttons_panel = ButtonsPanel(
-            main_frame, self._start_processing, lambda: open_browser(BUG_REPORTS_GT)
+            main_frame,
+            self._start_processing,
+            lambda: open_browser(BUG_REPORTS_GT),
+            cancel_handler=self._cancel_processing,
         )
         self.buttons_panel.pack(pady=(0, 2))
 
@@ -367,9 +371,22 @@ class Interface(tk.Tk):
 
             self.running = True
             self.async_mgr.get_busy(
-                path, config_params=config, quick_script=quick_script
+                path,
+                config_params=config,
+                quick_script=quick_script,
+                segment_handler=self._show_segment,
             )
 
+    def _cancel_processing(self):
+        """Stop the running transcription"""
+        if self.running:
+            self.async_mgr.cancel()
+
+    def _show_segment(self, segment):
+        """Print a partial transcript line as soon as it is decoded (listener thread)"""
+        minutes, seconds = divmod(int(segment.get("start", 0)), 60)
+        print(f"📝 [{minutes:02}:{seconds:02}] {segment.get('text', '').strip()}")
+
     # --------------------- System Operations ---------------------
     def _bind_cleanup(self):
         """Configure shutdown handlers"""
@@ -399,10 +416,11 @@ class Interface(tk.Tk):
         """Ensure clean application termination"""
         self._alive = False
         self.gui_queue.queue.clear()
+        self.async_mgr.shutdown()
         self.destroy()
 
     # --------------------- Async Completion Handler ---------------------
-    def _complete_processing(self):
-        """Handle completion of async processing"""
+    def _complete_processing(self, result=None):
+        """Handle completion of async processing (result is None when cancelled)"""
         self.running = False
-        self.show_feedback("✓ Processing complete!")
+        self.show_feedback("✓ Processing complete!" if result else "⏹️ Processing cancelled")
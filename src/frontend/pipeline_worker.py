@@ -0,0 +1,233 @@
+import os
+import sys
+import time
+import signal
+import threading
+import multiprocessing
+from queue import Empty
+from typing import Any, Callable, Dict, Optional
+
+
+from src.errors.debug import debug
+
+
+
+class JobCancelled(Exception):
+    """Raised inside the worker process once the GUI cancels the running job."""
+
+
+class _EventWriter:
+    """stdout/stderr of the worker process, forwarded to the GUI console"""
+
+    def __init__(self, events):
+        self.events = events
+
+    def write(self, text):
+        if text:
+            self.events.put(("log", text))
+
+    def flush(self):
+        pass
+
+
+def _run_worker(jobs, events, answers, cancel) -> None:
+    """
+    Worker process loop: one EndFlow (model loaded once), one job at a time.
+
+    Every message to the GUI is a tuple on `events`:
+        ("log", text) / ("progress", pct) / ("segment", segment)
+        ("save_path", initial_file, extension)  -> the GUI answers on `answers`
+        ("done", output_path) / ("error", message) / ("cancelled",)
+    """
+    sys.stdout = sys.stderr = _EventWriter(events)
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()  # Own process group, so terminating it also stops ParallelTranscriber's pool
+
+    import src.utils.models  # noqa: F401  Cache locations torch reads, before torch loads
+    from src.utils.end_flow import EndFlow  # Model and pipeline live in this process only
+
+    flow = EndFlow()
+
+    def ask_save_path(initial_file: str, extension: str) -> str:
+        events.put(("save_path", initial_file, extension))
+        return answers.get()
+
+    flow.ask_save_path = ask_save_path
+
+    while (job := jobs.get()) is not None:
+        if job["dev_logs"]:  # Mirror the GUI checkbox, the flag is per process
+            debug.enable_dev_logs()
+        else:
+            debug.disable_dev_logs()
+
+        def progress(pct: float) -> None:
+            if cancel.is_set():
+                raise JobCancelled()
+            events.put(("progress", pct))
+
+        def segment(seg: Dict[str, Any]) -> None:
+            if cancel.is_set():
+                raise JobCancelled()
+            events.put(("segment", seg))
+
+        try:
+            output = flow.process_video(
+                job["path"],
+                config_params=job["config_params"],
+                quick_script=job["quick_script"],
+                progress_callback=progress,
+                segment_handler=segment if job["segments"] else None,
+            )
+            events.put(("cancelled",) if cancel.is_set() else ("done", output))
+
+        except Exception as e:  # EndFlow wraps JobCancelled like any other error
+            events.put(("cancelled",) if cancel.is_set() else ("error", str(e)))
+
+
+class PipelineWorker:
+    """
+    EndFlow running in a dedicated process, driven from the GUI process.
+
+    Summary:
+        The pipeline (model, audio decoding, PDF export) runs in a spawned
+        process, so its Python work never competes with the Tk event loop
+        for the GIL. Jobs go in over a queue; progress, log lines,
+        segments, save-path requests and the outcome come back as events
+        that a listener thread turns into handler calls. Cancelling asks
+        the worker to stop at its next progress or segment report, and
+        terminates it if it has not stopped after `CANCEL_GRACE_SECONDS`;
+        a new worker is started for the next job.
+    """
+
+    CANCEL_GRACE_SECONDS = 10.0
+    POLL_SECONDS = 0.2  # Listener wake-up to notice a dead worker
+
+    def __init__(self):
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._jobs = self._events = self._answers = self._cancel = None
+        self._handlers: Dict[str, Callable[..., Any]] = {}
+        self._job_running = False
+        self._cancel_deadline: Optional[float] = None
+        self._listener: Optional[threading.Thread] = None
+
+    # --------------------- Public API ---------------------
+    def start(self) -> None:
+        """Spawn the worker (loads the model) unless it is already running."""
+        if self._process is not None and self._process.is_alive():
+            return
+
+        self._jobs = self._context.Queue()
+        self._events = self._context.Queue()
+        self._answers = self._context.Queue()
+        self._cancel = self._context.Event()
+        # Not a daemon: ParallelTranscriber starts its own worker processes
+        self._process = self._context.Process(
+            target=_run_worker,
+            args=(self._jobs, self._events, self._answers, self._cancel),
+            name="transcriptor-pipeline",
+        )
+        self._process.start()
+
+        self._listener = threading.Thread(
+            target=self._listen,
+            args=(self._process, self._events, self._answers),
+            daemon=True,
+        )
+        self._listener.start()
+        debug.dprint(f"Pipeline worker started: pid={self._process.pid}")
+
+    def submit(self, job: Dict[str, Any], **handlers: Callable[..., Any]) -> None:
+        """
+        Run one job in the worker.
+
+        Args:
+            job: path, config_params, quick_script, segments (bool), dev_logs (bool)
+            **handlers: on_log, on_progress, on_segment, on_save_path (returns
+                the path), on_done, on_error, on_cancelled. Called on the
+                listener thread.
+        """
+        self.start()
+        self._handlers = handlers
+        self._job_running = True
+        self._cancel_deadline = None
+        self._cancel.clear()
+        self._jobs.put(job)
+
+    def cancel(self) -> None:
+        """Ask the running job to stop; it is terminated after the grace period."""
+        if self._job_running and self._cancel_deadline is None:
+            self._cancel.set()
+            self._cancel_deadline = time.time() + self.CANCEL_GRACE_SECONDS
+            debug.dprint("Pipeline worker: cancellation requested")
+
+    def shutdown(self) -> None:
+        """Stop the worker process (the running job, if any, is abandoned)."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        if self._job_running:
+            self._terminate(process)
+        else:
+            self._jobs.put(None)
+
+        process.join(timeout=self.CANCEL_GRACE_SECONDS)
+        if process.is_alive():
+            self._terminate(process)
+
+    # --------------------- Internals ---------------------
+    @staticmethod
+    def _terminate(process) -> None:
+        """Stop the worker together with the pool processes it started."""
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(process.pid, signal.SIGTERM)  # The worker leads its own group
+                return
+            except OSError:  # Group not created yet, or already gone
+                pass
+
+        process.terminate()
+
+    def _listen(self, process, events, answers) -> None:
+        """Turn worker events into handler calls until that worker is gone."""
+        while True:
+            if self._cancel_deadline and time.time() > self._cancel_deadline:
+                self._terminate(process)  # No cancellation point reached in time
+                if self._process is process:
+                    self._process = None  # The next job starts a fresh worker
+                self._finish("on_cancelled")
+                return
+
+            try:
+                event = events.get(timeout=self.POLL_SECONDS)
+
+            except Empty:
+                if not process.is_alive():
+                    if self._job_running:
+                        self._finish("on_error", "Pipeline worker exited unexpectedly")
+                    return
+                continue
+
+            self._dispatch(event, answers)
+
+    def _dispatch(self, event: tuple, answers) -> None:
+        kind, *args = event
+        if kind == "save_path":
+            handler = self._handlers.get("on_save_path")
+            answers.put(handler(*args) if handler else "")
+
+        elif kind in ("done", "error", "cancelled"):
+            self._finish(f"on_{kind}", *args)
+
+        elif kind in ("log", "progress", "segment"):
+            handler = self._handlers.get(f"on_{kind}")
+            if handler:
+                handler(*args)
+
+    def _finish(self, name: str, *args: Any) -> None:
+        self._job_running = False
+        self._cancel_deadline = None
+        handler = self._handlers.get(name)
+        if handler:
+            handler(*args)
@@ -9,9 +9,9 @@ from src.errors.debug import debug
 class ButtonsPanel(ttk.Frame):
     """Interactive controls container with Pretty Notes option"""
 
-    BUTTONS = ["SELECT VIDEO", "OPEN ISSUE", "ONLY TRANSCRIPTION", "ENABLE DEV LOGS"]
+    BUTTONS = ["SELECT VIDEO", "OPEN ISSUE", "ONLY TRANSCRIPTION", "ENABLE DEV LOGS", "CANCEL"]
 
-    def __init__(self, parent, select_handler, github_handler):
+    def __init__(self, parent, select_handler, github_handler, cancel_handler=None):
         super().__init__(parent)
         self.quick_script_fl = tk.BooleanVar(value=False)
         self.dev_logs_fl = tk.BooleanVar(value=False)
@@ -23,9 +23,9 @@ class ButtonsPanel(ttk.Frame):
                 else debug.disable_dev_logs()
             ),
         )
-        self._create_widgets(select_handler, github_handler)
+        self._create_widgets(select_handler, github_handler, cancel_handler)
 
-    def _create_widgets(self, select_handler, github_handler):
+    def _create_widgets(self, select_handler, github_handler, cancel_handler=None):
         style = ttk.Style()
         style.configure("OnlyScript.TCheckbutton", padding=5)
         style.configure("DevLogs.TCheckbutton", padding=5)
@@ -52,6 +52,10 @@ class ButtonsPanel(ttk.Frame):
         self.quick_script_cb.pack(side=tk.LEFT, padx=(0, 15))
         self.dev_logs_cb.pack(side=tk.LEFT, padx=(0, 15))
 
+        if cancel_handler:  # Stops the running job
+            self.cancel_btn = ttk.Button(self, text=self.BUTTONS[4], command=cancel_handler)
+            self.cancel_btn.pack(side=tk.LEFT, padx=(0, 15))
+
     def get_quick_script_flag(self):
         """Returns the current state of the Pretty Notes checkbox"""
         debug.dprint(
@@ -1,11 +1,32 @@
-from src.utils.audio_processor import check_ffmpeg, extract_audio, clean_audio
-from src.utils.file_handler import save_transcription
-from src.utils.pdf_maker import PDFExporter
-from src.utils.transcripting.textify import Textify
-from src.utils.end_flow import EndFlow
-from src.utils.text.language import Language
-from src.utils.text.content_type import ContentType
-from src.utils.models import MODELS, MODEL_SPEEDS, SETUP_TIMES
+import importlib
+
+# Public name -> defining module. Imported on first access, so importing a light
+# submodule (file_handler, text.content_type) from the GUI process does not load
+# torch and whisper through EndFlow / Textify.
+_EXPORTS = {
+    "check_ffmpeg": "src.utils.audio_processor",
+    "extract_audio": "src.utils.audio_processor",
+    "clean_audio": "src.utils.audio_processor",
+    "save_transcription": "src.utils.file_handler",
+    "PDFExporter": "src.utils.pdf_maker",
+    "Textify": "src.utils.transcripting.textify",
+    "EndFlow": "src.utils.end_flow",
+    "Language": "src.utils.text.language",
+    "ContentType": "src.utils.text.content_type",
+    "MODELS": "src.utils.models",
+    "MODEL_SPEEDS": "src.utils.models",
+    "SETUP_TIMES": "src.utils.models",
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
 
 __all__ = [
     "check_ffmpeg",
@@ -20,4 +41,4 @@ __all__ = [
     "MODEL_SPEEDS", 
     "SETUP_TIMES", 
     "Language"
-]
\ No newline at end of file
+]
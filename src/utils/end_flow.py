@@ -1,6 +1,5 @@
 import os
-from tkinter import filedialog
-from typing import Dict, List, Optional, Union, Any
+from typing import Callable, Dict, List, Optional, Union, Any
 
 
 from src.errors.debug import debug
@@ -13,11 +12,15 @@ from src.utils.text.text_reviser import TextReviser
 from src.utils.text.notes_generator import NotesGenerator
 from src.utils.transcripting.sanitize_prompt import SanitizePrompt
 from src.utils.transcripting.textify import Textify
+from src.utils.transcripting.model_server import ModelServer
+from src.utils.transcripting.info_dump import InfoDump
+from src.utils.transcripting.model_selector import ModelSelector
+from src.utils.transcripting.thread_settings import ThreadSettings
 from src.utils.pdf_maker import PDFExporter
-from src.utils.file_handler import save_transcription
+from src.utils.file_handler import ask_save_path, save_transcription
 from src.utils.audio_cleaner import clean_audio
 from src.utils.audio_processor import extract_audio
-from src.utils.models import MODELS
+from src.utils.models import MODELS, DEFAULT_BACKEND
 
 
 
@@ -25,19 +28,78 @@ class EndFlow:
     """Pipeline: audio → text → PDF"""
 
     model_size = str(MODELS[1])  # Default model [will be 3 | using a weaker for testing]
+    encoder_mode = "eager"  # "trace" or "compile" to speed up the audio encoder
+    backend = DEFAULT_BACKEND  # Transcription engine, see transcripting.backends
+    thread_settings = ThreadSettings()  # torch threads / CPU affinity for this worker
+    parallel_workers = 1  # > 1 splits long audio across worker processes
+    batch_size = 1  # > 1 encodes/decodes that many 30 s windows per forward pass
+    reuse_encoder_features = False  # Cache encoder output; re-runs with new words only decode
+    reuse_mel_features = False  # Keep log-mel spectrograms on disk; re-runs skip extraction
+    share_model = False  # One model per size for all jobs in this process, windows batched across jobs
+    refine_model = None  # e.g. "medium": draft with model_size, re-decode weak segments only
+    fallback_policy = None  # FallbackPolicy(): temperature ladder and retry budgets (changes output)
+    repetition_guard = False  # Close looping windows early, drop repeats (per-token CPU cost)
+    adaptive_beam = True  # With beam_size set, only windows failing greedy checks use beam
+    prompt_token_budget = SanitizePrompt.DEFAULT_TOKEN_BUDGET  # Custom-term prompt size in tokens
+    align_note_words = True  # Word times for note questions only, not the whole run
+    language_hint = None  # Whisper code (e.g. "pt") to skip detection; None detects once
+    transcript_cache = True  # Reuse results for audio already transcribed with same settings
+    checkpoint_long_jobs = False  # Decode 10+ min jobs in resumable 5 min spans (changes output)
+    time_budget = None  # Seconds; picks the most accurate model expected to finish in time
+    budget_confidence = 0.9  # Probability the chosen model meets time_budget
 
     def __init__(self) -> None:
         """Initialize with dependency injection-ready components."""
-        self.transcriber = Textify(EndFlow.model_size)
+        self.transcriber = self._build_transcriber(EndFlow.model_size)
+        self.model_selector = ModelSelector(confidence=EndFlow.budget_confidence)
         self.language = Language()
         self.reviser = TextReviser(language=self.language)
         self.content_config = ContentType(words=None, has_odd_names=True)
         self.pdf_exporter = PDFExporter()
-        self.sanitized = SanitizePrompt()
+        self.sanitized = SanitizePrompt(
+            token_budget=EndFlow.prompt_token_budget,
+            multilingual=self._is_multilingual(EndFlow.model_size),
+        )
+        self.ask_save_path: Optional[Callable[[str, str], str]] = None  # Replaces the dialog
         self.notes_generator = NotesGenerator(
             language=self.language, config=self.content_config
         )
 
+    def _build_transcriber(self, model_size: str) -> Textify:
+        return Textify(
+            model_size,
+            EndFlow.encoder_mode,
+            backend=EndFlow.backend,
+            thread_settings=EndFlow.thread_settings,
+            cache=EndFlow.transcript_cache,
+            refine_model=EndFlow.refine_model,
+            feature_cache=EndFlow.reuse_encoder_features,
+            mel_cache=EndFlow.reuse_mel_features,
+            model_server=ModelServer.default() if EndFlow.share_model else None,
+        )
+
+    @staticmethod
+    def _is_multilingual(model_size: str) -> bool:
+        return not model_size.endswith(".en")  # English-only models use the GPT-2 tokenizer
+
+    def _fit_model_to_budget(self, audio: Any) -> None:
+        """Swap to the most accurate model expected to meet EndFlow.time_budget"""
+        if not EndFlow.time_budget:
+            return
+
+        words = self.content_config.words
+        model_size, rationale = self.model_selector.select(
+            audio_duration=len(audio) / 1000,  # AudioSegment length is in ms
+            budget_seconds=EndFlow.time_budget,
+            custom_word_count=len(words) if words else 0,
+            loaded_model=self.transcriber.model_size,
+        )
+        InfoDump(model_size).log_model_choice(rationale)
+
+        if model_size != self.transcriber.model_size:
+            self.transcriber.shutdown()
+            self.transcriber = self._build_transcriber(model_size)
+
     # -------------------- Content Configuration ---------------------
     def configure_content(
         self, config_params: Optional[Union[Dict[str, Any], ContentType]] = None
@@ -123,9 +185,14 @@ class EndFlow:
             cleaned_audio = clean_audio(audio)
             debug.dprint(f"Audio cleaned: length={len(cleaned_audio) if cleaned_audio else 0}")
 
-            # Transcription
+            # Transcription (the prompt is fitted to the tokenizer of the model in use)
+            self._fit_model_to_budget(cleaned_audio)
+            self.sanitized.multilingual = self._is_multilingual(self.transcriber.model_size)
             context_prompt = self.sanitized.generate_content_prompt(self.content_config)
+            if self.sanitized.last_fit.dropped:
+                InfoDump(self.transcriber.model_size).log_prompt_fit(self.sanitized.last_fit)
             result = self._transcribe_audio(cleaned_audio, context_prompt, **kwargs)
+            self.language.process_whisper_output(result)  # Word lists follow the audio
 
             # Post-processing
             revised_text = self.reviser.revise_text(result["text"])
@@ -145,10 +212,22 @@ class EndFlow:
         self, audio: Any, context_prompt: str, **kwargs
     ) -> Dict[str, Any]:
         """Execute transcription with proper error context."""
+        kwargs.setdefault("parallel_workers", EndFlow.parallel_workers)
+        kwargs.setdefault("batch_size", EndFlow.batch_size)
+        kwargs.setdefault("repetition_guard", EndFlow.repetition_guard)
+        kwargs.setdefault("adaptive_beam", EndFlow.adaptive_beam)
+        kwargs.setdefault("checkpoint", EndFlow.checkpoint_long_jobs)
+        if EndFlow.fallback_policy is None:  # The policy's ladder replaces a single temperature
+            kwargs.setdefault("temperature", 0.2 if self.content_config.types else 0.5)
+        else:
+            kwargs.setdefault("fallback_policy", EndFlow.fallback_policy)
+        if EndFlow.language_hint:
+            kwargs.setdefault("language", EndFlow.language_hint)
+        if "progress_callback" in kwargs:  # GUI name for Textify's progress_handler
+            kwargs["progress_handler"] = kwargs.pop("progress_callback")
         return self.transcriber.transcribe(
             audio,
             initial_prompt=context_prompt,
-            temperature=0.2 if self.content_config.types else 0.5,
             **kwargs,
         )
 
@@ -174,29 +253,30 @@ class EndFlow:
                 self.reviser.odd_words if hasattr(self.reviser, "odd_words") else {},
                 language=self.language,
                 config=self.content_config,
+                word_aligner=self._word_aligner(result),
             )
         else:
             save_transcription(revised_text, save_path)
 
         return os.path.abspath(save_path)
 
+    def _word_aligner(self, result: Dict[str, Any]) -> Optional[Callable[[List], List]]:
+        """Word times for the few segments the notes link to, from the same audio"""
+        if not EndFlow.align_note_words:
+            return None
+
+        return lambda segments: self.transcriber.align_words(
+            segments, language=result.get("language")
+        )
+
     # ----------------------- File Management ----------------------
     def _get_save_path(self, base_name: str, extension: str) -> str:
         """Improved path handling with better fallbacks."""
         try:
-            file_types = (
-                [("PDF Files", "*.pdf")]
-                if extension == ".pdf"
-                else [("Text Files", "*.txt")]
-            )
             initial_file = f"{base_name}_transcription{extension}"
+            ask = self.ask_save_path or ask_save_path  # Worker process: the GUI asks
 
-            if path := filedialog.asksaveasfilename(
-                title="Save transcription",
-                defaultextension=extension,
-                initialfile=initial_file,
-                filetypes=file_types,
-            ):
+            if path := ask(initial_file, extension):
                 return path
 
         except Exception:
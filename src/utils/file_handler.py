@@ -1,6 +1,7 @@
 import os
 import textwrap
 from pathlib import Path
+from tkinter import filedialog
 from typing import Optional
 from datetime import datetime
 
@@ -45,4 +46,23 @@ def save_transcription(text: str, save_path: Optional[str] = None) -> str:
         raise FileError.save_failed(error=err) from err
     
     except Exception as err:
-        raise FileError.save_failed(error=err) from err
\ No newline at end of file
+        raise FileError.save_failed(error=err) from err
+
+
+def ask_save_path(initial_file: str, extension: str) -> str:
+    """Native "Save as" dialog for a .pdf or .txt output; empty string if dismissed.
+
+    Args:
+        initial_file: File name suggested in the dialog
+        extension: ".pdf" or ".txt"
+
+    Returns:
+        The chosen path, or "" when the user cancelled
+    """
+    file_types = [("PDF Files", "*.pdf")] if extension == ".pdf" else [("Text Files", "*.txt")]
+    return filedialog.asksaveasfilename(
+        title="Save transcription",
+        defaultextension=extension,
+        initialfile=initial_file,
+        filetypes=file_types,
+    )
@@ -1,4 +1,6 @@
-from typing import List, Dict
+import os
+from typing import List, Dict, Optional
+from dotenv import load_dotenv
 
 
 from src.errors.exceptions import TranscriptionError
@@ -27,6 +29,8 @@ MODELS: List[str] = [
 MODEL_SPEEDS: Dict[str, float] = {
     # Words per second based on mid-range GPU benchmarks
     # Used to estimate transcription time: wall_time ≈ word_count / wps
+    # Re-measure on a host with: python -m benchmarks.model_sweep --fixtures <dir>
+    # python -m benchmarks.calibrate_host saves a per-host profile used instead (HostProfile)
     "tiny": 40.0,  # Ultra-fast, minimal resource use
     "base": 30.0,  # Fast, lightweight
     "small": 18.0,  # Balanced performance
@@ -43,6 +47,43 @@ SETUP_TIMES: Dict[str, float] = {
     "large": 20.0,
 }
 
+# --------------------- Constants From Environment ---------------------
+# Values can be set in the shell or in a .env file at the project root
+load_dotenv()
+
+DEFAULT_BACKEND: str = os.getenv(
+    "TRANSCRIPTOR_BACKEND", "whisper"  # Key in transcripting.backends.BACKENDS
+)
+
+MODEL_DIR: Optional[str] = os.getenv(
+    "TRANSCRIPTOR_MODEL_DIR"  # Local Whisper checkpoints, defaults to whisper's cache
+)
+
+HOST_PROFILE: Optional[str] = os.getenv(
+    "TRANSCRIPTOR_HOST_PROFILE"  # Speed profile JSON, defaults to this host's calibration
+)
+
+STANDIN_REALTIME_FACTOR: float = float(
+    os.getenv("TRANSCRIPTOR_STANDIN_RTF", "0.0")  # Seconds slept per audio second
+)
+
+# --------------------- Constants For Caching ---------------------
+CACHE_DIR: str = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "transcriptor",
+)
+
+# torch.compile artifacts of the encoder; inductor reads the variable, so it is
+# set here, before anything in the pipeline process imports torch
+INDUCTOR_CACHE_DIR: str = os.path.join(CACHE_DIR, "encoders", "inductor")
+os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", INDUCTOR_CACHE_DIR)
+
+ENCODER_MODES: List[str] = [
+    "eager",  # Plain PyTorch modules (default)
+    "trace",  # TorchScript trace, persisted to CACHE_DIR
+    "compile",  # torch.compile, inductor cache persisted to CACHE_DIR
+]
+
 # --------------------- Error Check ---------------------
 for model in MODELS:  # Ensure all models have speed and setup entries
     if model not in MODEL_SPEEDS:
@@ -78,11 +78,14 @@ class PDFExporter:
         odd_words: Optional[dict] = None,
         language=None,
         config=None,
+        word_aligner=None,
     ) -> None:
         """Handle PDF export with normalization and validation."""
         from src.utils.text.notes_generator import NotesGenerator
 
-        notes_generator = NotesGenerator(language=language, config=config)
+        notes_generator = NotesGenerator(
+            language=language, config=config, word_aligner=word_aligner
+        )
         notes_dict = notes_generator.create_notes(
             {"text": text, "segments": result.get("segments", [])}
         )
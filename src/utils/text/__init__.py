@@ -1,11 +1,26 @@
-from src.utils.text.content_type import ContentType
-from src.utils.text.notes_generator import NotesGenerator
-from src.utils.text.text_reviser import TextReviser
-from src.utils.text.language import Language
+import importlib
+
+# Public name -> defining module, imported on first access (see src/utils/__init__.py)
+_EXPORTS = {
+    "ContentType": "src.utils.text.content_type",
+    "NotesGenerator": "src.utils.text.notes_generator",
+    "TextReviser": "src.utils.text.text_reviser",
+    "Language": "src.utils.text.language",
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
 
 __all__ = [
     "ContentType",
     "NotesGenerator",
     "TextReviser",
     "Language"
-]
\ No newline at end of file
+]
@@ -5,12 +5,25 @@ from dataclasses import dataclass, field
 from src.errors.debug import debug
 
 
+# Whisper language codes for the languages with word lists
+LANGUAGE_CODES: Dict[str, str] = {
+    "en": "english",
+    "pt": "portuguese",
+    "es": "spanish",
+    "it": "italian",
+    "fr": "french",
+    "ro": "romanian",
+}
+
+
 @dataclass
 class LanguageConfig:
     """Configuration for language processing"""
     default_language: str = "portuguese"
     supported_languages: List[str] = field(
-        default_factory=lambda: ["english", "portuguese", "spanish", "italian", "romanian"]
+        default_factory=lambda: [
+            "english", "portuguese", "spanish", "italian", "french", "romanian"
+        ]
     )
     fallback_patterns: str = "default"
 
@@ -30,19 +43,21 @@ class Language:
         if not lang_code or not isinstance(lang_code, str):
             return
 
+        self.set_language(lang_code)
+
+    def set_language(self, lang_code: str) -> None:
+        """
+        Use `lang_code` for the word lists ("pt", "pt-BR" or "portuguese").
+
+        Unsupported languages reset to the default, so a previous job's
+        language is never carried over.
+        """
         # Clean and extract base language code
         lang = lang_code.lower().split("-")[0]
+        lang = LANGUAGE_CODES.get(lang, lang)
 
-        # Validate against supported languages
-        if lang in self.config.supported_languages:
-            self.detected_language = lang
-        else:
-            # Try matching first 2 letters (en, pt, es, etc.)
-            base_code = lang[:2]
-            for supported_lang in self.config.supported_languages:
-                if supported_lang.startswith(base_code):
-                    self.detected_language = supported_lang
-                    break
+        self.detected_language = lang if lang in self.config.supported_languages else None
+        debug.dprint(f"Language set from '{lang_code}': {self.detected_language}")
 
     def get_language(self) -> str:
         """Get the detected language or fallback to default"""
@@ -51,7 +66,9 @@ class Language:
 
     def get_language_code(self) -> str:
         """Get 2-letter language code"""
-        return self.get_language()[:2]
+        language = self.get_language()
+        codes = {name: code for code, name in LANGUAGE_CODES.items()}
+        return codes.get(language, language[:2])
 
     def is_supported_language(self, lang_code: str) -> bool:
         """Check if a language code is supported"""
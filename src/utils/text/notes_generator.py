@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional
 
 
 
@@ -13,9 +13,15 @@ from src.utils.text.language import Language
 
 
 class NotesGenerator:
-    def __init__(self, language, config):
-        self.language = Language()
+    def __init__(
+        self,
+        language,
+        config,
+        word_aligner: Optional[Callable[[List[Dict]], List[Dict]]] = None,
+    ):
+        self.language = language or Language()  # Shared with EndFlow, set per job
         self.config = config
+        self.word_aligner = word_aligner  # e.g. Textify.align_words: word times on demand
         self.pdf_exporter = PDFExporter()
 
         debug.dprint(f"NotesGenerator initialized with config: {config}, language: {language}")
@@ -116,23 +122,41 @@ class NotesGenerator:
         return sorted(terms)[:8]
 
     def _extract_questions(self, segments: List[Dict]) -> List[Dict]:
-        qs = []
-        lang = self.language.get_language_code()
+        lang = self.language.get_language()
         question_words = set(QUESTION_WRD.get(lang, QUESTION_WRD["default"]))
 
+        found = []
         for seg in segments:
             t = seg.get("text", "").strip()
             if t.endswith("?") or any(
                 t.lower().startswith(qw) for qw in question_words
             ):
-                qs.append(
-                    {
-                        "text": t,
-                        "timestamp": self._format_timestamp(seg.get("start", 0)),
-                    }
-                )
+                found.append(seg)
+
+        found = found[:5]
+        if self.word_aligner and found:  # Only these segments pay for word alignment
+            found = self.word_aligner(found)
+
+        qs = [
+            {
+                "text": seg.get("text", "").strip(),
+                "timestamp": self._format_timestamp(self._question_start(seg)),
+            }
+            for seg in found
+        ]
         debug.dprint(f"Detected questions: {len(qs[-1])}" if qs else "No questions detected")
-        return qs[:5]
+        return qs
+
+    def _question_start(self, seg: Dict) -> float:
+        """Time of the question's first word, or the segment start without word times."""
+        words = seg.get("words")
+        if not words:
+            return seg.get("start", 0)
+
+        # The question is the segment's last sentence, e.g. "Right. So why does it fail?"
+        sentence = re.split(r"(?<=[.!])\s+", seg.get("text", "").strip())[-1]
+        index = max(0, len(words) - len(sentence.split()))
+        return words[index].get("start", seg.get("start", 0))
 
     def _get_important_timestamps(self, segments: List[Dict]) -> List[Dict]:
         out = []
@@ -1,17 +1,58 @@
 from .textify import Textify
-from .loader import Loader
+from .loader import Loader, DecodeProgress
 from .info_dump import InfoDump
 from .convert_audio import ConvertAudio
-from .sanitize_prompt import SanitizePrompt
+from .sanitize_prompt import SanitizePrompt, PromptFit
 from .set_model import SetModel
+from .model_verifier import ModelVerifier
 from .estimator import TimeEstimator
+from .host_profile import HostProfile
+from .model_selector import ModelSelector
+from .encoder_compiler import EncoderCompiler
+from .thread_settings import ThreadSettings, ThreadScope
+from .parallel_transcriber import ParallelTranscriber
+from .window_decoder import WindowDecoder
+from .model_server import ModelServer, SharedWindowDecoder
+from .cascade import CascadeTranscriber
+from .fallback import FallbackPolicy, FallbackTracker
+from .repetition_guard import RepetitionGuard
+from .adaptive_beam import AdaptiveBeam
+from .transcript_cache import TranscriptCache
+from .transcript_checkpoint import TranscriptCheckpoint
+from .feature_cache import FeatureCache
+from .mel_frontend import MelFrontend
+from .backends import TranscriptionBackend, BACKENDS, get_backend
 
 __all__ = [
     "Textify",
     "ConvertAudio",
     "SanitizePrompt",
+    "PromptFit",
     "SetModel",
+    "ModelVerifier",
     "InfoDump",
     "TimeEstimator",
-    "Loader"
+    "HostProfile",
+    "ModelSelector",
+    "EncoderCompiler",
+    "ThreadSettings",
+    "ThreadScope",
+    "ParallelTranscriber",
+    "WindowDecoder",
+    "ModelServer",
+    "SharedWindowDecoder",
+    "CascadeTranscriber",
+    "FallbackPolicy",
+    "FallbackTracker",
+    "RepetitionGuard",
+    "AdaptiveBeam",
+    "TranscriptCache",
+    "TranscriptCheckpoint",
+    "FeatureCache",
+    "MelFrontend",
+    "TranscriptionBackend",
+    "BACKENDS",
+    "get_backend",
+    "Loader",
+    "DecodeProgress",
 ]
\ No newline at end of file
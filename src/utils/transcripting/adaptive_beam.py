@@ -0,0 +1,101 @@
+from typing import Any, Dict, List, Optional
+
+
+
+class AdaptiveBeam:
+    """
+    Greedy first, beam search only on the windows that fail quality checks.
+
+    Summary:
+        Every window is decoded greedily. A window whose average
+        log-probability is too low or whose text compresses too well (the
+        checks whisper.transcribe uses for its temperature fallback) is
+        decoded again with beam search, so the beam cost is only paid where
+        greedy decoding went wrong. Runners record each window here; the
+        counters go into the result metadata.
+    """
+
+    LOGPROB_THRESHOLD = -1.0  # Same defaults as whisper.transcribe
+    COMPRESSION_THRESHOLD = 2.4
+    NO_SPEECH_THRESHOLD = 0.6
+
+    def __init__(
+        self,
+        beam_size: int,
+        patience: Optional[float] = None,
+        logprob_threshold: float = LOGPROB_THRESHOLD,
+        compression_ratio_threshold: float = COMPRESSION_THRESHOLD,
+        no_speech_threshold: float = NO_SPEECH_THRESHOLD,
+    ):
+        self.beam_size = beam_size
+        self.patience = patience
+        self.logprob_threshold = logprob_threshold
+        self.compression_ratio_threshold = compression_ratio_threshold
+        self.no_speech_threshold = no_speech_threshold
+        self.offset = 0.0  # Seconds added to window times (span being decoded)
+        self.windows = 0
+        self.beam_windows: List[Dict[str, Any]] = []
+        self.greedy_time = 0.0
+        self.beam_time = 0.0
+
+    def use_options(self, options: Dict[str, Any]) -> None:
+        """Take the thresholds of whisper-style decode options (keys missing or None are kept)."""
+        for name in ("logprob_threshold", "compression_ratio_threshold", "no_speech_threshold"):
+            if options.get(name) is not None:
+                setattr(self, name, options[name])
+
+    def needs_beam(self, result: Any) -> bool:
+        """Whether a greedy DecodingResult fails the log-probability or compression check."""
+        if (
+            result.no_speech_prob > self.no_speech_threshold
+            and result.avg_logprob < self.logprob_threshold
+        ):
+            return False  # Silent window, skipped anyway
+
+        return (
+            result.avg_logprob < self.logprob_threshold
+            or result.compression_ratio > self.compression_ratio_threshold
+        )
+
+    def record_greedy(self, windows: int, seconds: float) -> None:
+        self.windows += windows
+        self.greedy_time += seconds
+
+    def record_beam(
+        self, seconds: float, start: Optional[float] = None, end: Optional[float] = None
+    ) -> None:
+        """One window re-decoded with beam search; times relative to the current span."""
+        self.beam_time += seconds
+        window: Dict[str, Any] = {"seconds": round(seconds, 3)}
+        if start is not None and end is not None:  # Unknown on the whisper.transcribe path
+            window.update(start=round(self.offset + start, 3), end=round(self.offset + end, 3))
+        self.beam_windows.append(window)
+
+    def fork(self, offset: float) -> "AdaptiveBeam":
+        """Empty counters with the same settings, for a part of the job decoded elsewhere."""
+        forked = AdaptiveBeam(
+            self.beam_size,
+            self.patience,
+            self.logprob_threshold,
+            self.compression_ratio_threshold,
+            self.no_speech_threshold,
+        )
+        forked.offset = self.offset + offset
+        return forked
+
+    def merge(self, other: "AdaptiveBeam") -> None:
+        self.windows += other.windows
+        self.beam_windows.extend(other.beam_windows)
+        self.greedy_time += other.greedy_time
+        self.beam_time += other.beam_time
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "beam_size": self.beam_size,
+            "windows": self.windows,
+            "beam_windows": len(self.beam_windows),
+            "beam_fraction": len(self.beam_windows) / self.windows if self.windows else 0.0,
+            "greedy_time": self.greedy_time,
+            "beam_time": self.beam_time,
+            "per_window": self.beam_windows,
+        }
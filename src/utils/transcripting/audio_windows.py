@@ -0,0 +1,112 @@
+import numpy as np
+from typing import List, Tuple
+
+
+SAMPLE_RATE = 16000  # Whisper's required rate
+FRAME_SECONDS = 0.03  # Energy frame used to locate pauses
+SPEECH_FLOOR_RMS = 0.01  # Below this a frame is treated as silence
+
+
+
+def frame_energy(audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """RMS energy per FRAME_SECONDS frame (last partial frame dropped)."""
+    frame = max(1, int(FRAME_SECONDS * sample_rate))
+    usable = len(audio) - len(audio) % frame
+    if usable == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    frames = audio[:usable].reshape(-1, frame)
+    return np.sqrt(np.mean(frames.astype(np.float32) ** 2, axis=1))
+
+
+def quietest_point(
+    energy: np.ndarray,
+    target: int,
+    search: int,
+    lower: int,
+    upper: int,
+    sample_rate: int = SAMPLE_RATE,
+) -> int:
+    """
+    Sample index of the quietest frame within `search` samples of `target`.
+
+    The search range is clamped to [lower, upper] so callers can keep chunk
+    lengths within limits.
+    """
+    frame = max(1, int(FRAME_SECONDS * sample_rate))
+    first = max(lower, target - search) // frame
+    last = min(upper, target + search) // frame
+
+    if last <= first or first >= len(energy):
+        return min(max(target, lower), upper)
+
+    best = first + int(np.argmin(energy[first : min(last, len(energy))]))
+    return best * frame + frame // 2
+
+
+def silence_cuts(
+    audio: np.ndarray,
+    chunk_seconds: float,
+    search_seconds: float,
+    sample_rate: int = SAMPLE_RATE,
+) -> List[int]:
+    """
+    Cut points (sample indices) about every `chunk_seconds`, moved to pauses.
+
+    Returns the boundaries including 0 and len(audio), so consecutive pairs
+    are chunk spans. No chunk is longer than chunk_seconds + search_seconds.
+    """
+    total = len(audio)
+    chunk = int(chunk_seconds * sample_rate)
+    search = int(search_seconds * sample_rate)
+    energy = frame_energy(audio, sample_rate)
+
+    cuts = [0]
+    while total - cuts[-1] > chunk + search:
+        target = cuts[-1] + chunk
+        cut = quietest_point(
+            energy, target, search, cuts[-1] + chunk // 2, target + search, sample_rate
+        )
+        cuts.append(cut)
+
+    cuts.append(total)
+    return cuts
+
+
+def split_on_silence(
+    audio: np.ndarray,
+    max_seconds: float = 30.0,
+    search_seconds: float = 5.0,
+    sample_rate: int = SAMPLE_RATE,
+) -> List[Tuple[int, int]]:
+    """Spans of at most `max_seconds`, each ending at the quietest nearby pause."""
+    cuts = silence_cuts(
+        audio, max_seconds - search_seconds, search_seconds, sample_rate
+    )
+    return list(zip(cuts[:-1], cuts[1:]))
+
+
+def first_speech_offset(
+    audio: np.ndarray,
+    relative_threshold: float = 0.1,
+    lead_in_seconds: float = 0.2,
+    sample_rate: int = SAMPLE_RATE,
+) -> int:
+    """
+    Sample index where speech starts (0 if the whole file is quiet).
+
+    A frame counts as speech when its energy passes both SPEECH_FLOOR_RMS and
+    `relative_threshold` times the loud end (95th percentile) of the file.
+    The offset is moved back by `lead_in_seconds` to keep the first syllable.
+    """
+    energy = frame_energy(audio, sample_rate)
+    if not len(energy):
+        return 0
+
+    threshold = max(SPEECH_FLOOR_RMS, relative_threshold * float(np.percentile(energy, 95)))
+    loud = np.flatnonzero(energy >= threshold)
+    if not len(loud):
+        return 0
+
+    frame = max(1, int(FRAME_SECONDS * sample_rate))
+    return max(0, int(loud[0]) * frame - int(lead_in_seconds * sample_rate))
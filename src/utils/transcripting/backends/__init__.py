@@ -0,0 +1,32 @@
+from typing import Any, Dict, Type
+
+
+from .base import TranscriptionBackend
+from .whisper_backend import WhisperBackend
+from .onnx_backend import OnnxBackend
+from .standin_backend import StandInBackend
+from src.errors.exceptions import TranscriptionError
+
+BACKENDS: Dict[str, Type[TranscriptionBackend]] = {
+    WhisperBackend.name: WhisperBackend,
+    OnnxBackend.name: OnnxBackend,
+    StandInBackend.name: StandInBackend,
+}
+
+
+def get_backend(name: str, **options: Any) -> TranscriptionBackend:
+    """Instantiate a registered backend by name (model not loaded yet)."""
+    if name not in BACKENDS:
+        raise TranscriptionError.invalid_backend(name, list(BACKENDS))
+
+    return BACKENDS[name](**options)
+
+
+__all__ = [
+    "TranscriptionBackend",
+    "WhisperBackend",
+    "OnnxBackend",
+    "StandInBackend",
+    "BACKENDS",
+    "get_backend",
+]
@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+
+class TranscriptionBackend(ABC):
+    """
+    Contract every transcription engine implements for Textify.
+
+    Summary:
+        A backend owns its model, turns a 16 kHz mono float32 array into a
+        Whisper-style result dict and optionally reports progress while it
+        decodes. Textify only talks to this interface, so engines can be
+        swapped per host without touching EndFlow.
+
+    Result format:
+        {"text": str, "language": str, "segments": [{"id", "start", "end",
+        "text", "avg_logprob", "compression_ratio", "no_speech_prob"}, ...]}
+    """
+
+    name = "base"
+    sample_rate = 16000  # Every backend consumes Whisper's sample rate
+
+    def __init__(self):
+        self.model_size: Optional[str] = None
+        self.model: Any = None
+
+    @abstractmethod
+    def load(self, model_size: str) -> None:
+        """Load (or attach to) the model for `model_size`."""
+
+    @abstractmethod
+    def transcribe(
+        self,
+        audio: Any,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        """
+        Transcribe a whole array.
+
+        Args:
+            audio: Mono float32 samples at `sample_rate`
+            progress_handler: Optional callback receiving 0-100 percentages
+            **options: Whisper decode options (language, task, temperature,
+                initial_prompt, beam_size, ...). Unsupported ones are ignored.
+        """
+
+    @property
+    def supports_progress(self) -> bool:
+        """Whether `transcribe` calls `progress_handler` with real progress."""
+        return False
+
+    def detect_language(self, audio: Any) -> Optional[str]:
+        """
+        Most likely language code of a short (up to 30 s) window.
+
+        Returns:
+            A Whisper language code, or None when the engine cannot tell
+        """
+        return None
+
+    def align_words(
+        self, audio: Any, segments: List[Dict[str, Any]], language: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Word-level timestamps for already transcribed segments.
+
+        Args:
+            audio: The whole array the segments were transcribed from
+            segments: Segments to align (absolute start/end times)
+            language: Language of the segments, if known
+
+        Returns:
+            Copies of `segments` with a "words" list ({"word", "start", "end",
+            "probability"}), or None when the engine cannot align
+        """
+        return None
+
+    @property
+    def precision(self) -> str:
+        """Numeric precision used for inference (part of cache keys)."""
+        return "fp32"
+
+    def transcribe_stream(
+        self,
+        audio: Any,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        **options: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield segments as they become available.
+
+        The default implementation runs a full `transcribe` and yields its
+        segments, so every backend can be consumed as a stream.
+        """
+        result = self.transcribe(audio, progress_handler, **options)
+        yield from result.get("segments", [])
+
+    @staticmethod
+    def build_result(segments: List[Dict[str, Any]], language: Optional[str]) -> Dict[str, Any]:
+        """Assemble the Whisper-style result dict from ordered segments."""
+        for index, segment in enumerate(segments):
+            segment["id"] = index
+
+        return {
+            "text": "".join(seg.get("text", "") for seg in segments),
+            "segments": segments,
+            "language": language,
+        }
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} model={self.model_size}>"
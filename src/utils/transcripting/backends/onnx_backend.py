@@ -0,0 +1,515 @@
+import os
+import torch
+import whisper
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from whisper.audio import HOP_LENGTH, N_FRAMES, N_SAMPLES, SAMPLE_RATE
+from whisper.model import disable_sdpa
+from whisper.tokenizer import Tokenizer, get_tokenizer
+
+
+from .base import TranscriptionBackend
+from ..mel_frontend import MelFrontend
+from ..repetition_guard import RepetitionGuard
+from ..segments import split_timestamped_tokens
+from src.utils.models import CACHE_DIR
+from src.errors.exceptions import TranscriptionError
+from src.errors.debug import debug
+
+
+
+class OnnxBackend(TranscriptionBackend):
+    """
+    CPU backend running exported Whisper encoder/decoder graphs with ONNX Runtime.
+
+    Expected layout (see `export`):
+        <model_dir>/<model_size>/encoder.onnx
+            input  mel            float32 (batch, n_mels, 3000)
+            output audio_features float32 (batch, n_audio_ctx, n_audio_state)
+        <model_dir>/<model_size>/decoder.onnx
+            input  tokens         int64   (batch, n_tokens)
+            input  audio_features float32 (batch, n_audio_ctx, n_audio_state)
+            output logits         float32 (batch, n_tokens, n_vocab)
+        <model_dir>/<model_size>/cross_kv.onnx          (optional, with decoder_cached)
+            input  audio_features float32 (batch, n_audio_ctx, n_audio_state)
+            output cross_kv       float32 (2 * n_layer, batch, n_audio_ctx, n_state)
+        <model_dir>/<model_size>/decoder_cached.onnx    (optional, with cross_kv)
+            input  tokens         int64   (batch, n_new)
+            input  cross_kv       float32 (2 * n_layer, batch, n_audio_ctx, n_state)
+            input  self_kv        float32 (2 * n_layer, batch, n_past, n_state)
+            output logits         float32 (batch, n_new, n_vocab)
+            output new_self_kv    float32 (2 * n_layer, batch, n_past + n_new, n_state)
+
+    Decoding is greedy with Whisper's timestamp rules, window by window.
+    With the cached graphs each step feeds only the new token and reuses
+    the keys/values of the earlier ones; without them (graphs exported by
+    older versions) every step re-runs the whole prefix through decoder.onnx.
+    """
+
+    name = "onnx"
+    ENCODER_FILE = "encoder.onnx"
+    DECODER_FILE = "decoder.onnx"
+    CROSS_KV_FILE = "cross_kv.onnx"
+    CACHED_DECODER_FILE = "decoder_cached.onnx"
+    N_TEXT_CTX = 448  # Decoder positions (prompt + SOT sequence + sampled tokens)
+    SAMPLE_LEN = 224  # Max generated tokens per window (n_text_ctx // 2)
+    TIME_PRECISION = 0.02  # Seconds per timestamp token
+    MAX_INITIAL_TIMESTAMP = 1.0  # Seconds, same default as Whisper
+
+    def __init__(
+        self,
+        model_dir: Optional[str] = None,
+        num_threads: Optional[int] = None,
+        persist_mel: bool = False,
+    ):
+        super().__init__()
+        self.model_dir = model_dir or os.path.join(CACHE_DIR, "onnx")
+        self.num_threads = num_threads
+        self.persist_mel = persist_mel  # Keep spectrograms on disk for re-runs
+        self.mel: Optional[MelFrontend] = None
+        self.encoder = None
+        self.decoder = None
+        self.cross_kv = None  # Optional cached-decoding graphs
+        self.cached_decoder = None
+        self.n_mels = 80
+        self.num_languages = 99
+
+    # --------------------- Loading ---------------------
+    def load(self, model_size: str) -> None:
+        try:
+            import onnxruntime as ort
+
+        except ImportError as e:
+            raise TranscriptionError.backend_unavailable(self.name, e) from e
+
+        folder = os.path.join(self.model_dir, model_size)
+        paths = [os.path.join(folder, f) for f in (self.ENCODER_FILE, self.DECODER_FILE)]
+        missing = [p for p in paths if not os.path.isfile(p)]
+        if missing:
+            raise TranscriptionError.load_failed(
+                FileNotFoundError(f"Missing ONNX graphs: {', '.join(missing)}")
+            )
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if self.num_threads:
+            options.intra_op_num_threads = self.num_threads
+
+        try:
+            self.encoder, self.decoder = (
+                ort.InferenceSession(p, sess_options=options, providers=["CPUExecutionProvider"])
+                for p in paths
+            )
+
+            cached = [os.path.join(folder, f) for f in (self.CROSS_KV_FILE, self.CACHED_DECODER_FILE)]
+            if all(os.path.isfile(p) for p in cached):
+                self.cross_kv, self.cached_decoder = (
+                    ort.InferenceSession(p, sess_options=options, providers=["CPUExecutionProvider"])
+                    for p in cached
+                )
+            else:
+                debug.dprint(f"No cached decoder graphs in {folder}, decoding without KV cache")
+
+        except Exception as e:
+            raise TranscriptionError.load_failed(e) from e
+
+        self.model_size = model_size
+        self.model = (self.encoder, self.decoder)
+        self._read_dims()
+        self.mel = MelFrontend(self.n_mels, persist=self.persist_mel)
+
+        debug.dprint(
+            f"OnnxBackend loaded {model_size} from {folder} "
+            f"(n_mels={self.n_mels}, num_languages={self.num_languages})"
+        )
+
+    def _read_dims(self) -> None:
+        """Infer mel bins and vocabulary size from the graph signatures."""
+        mel_dim = self.encoder.get_inputs()[0].shape[1]
+        if isinstance(mel_dim, int):
+            self.n_mels = mel_dim
+
+        vocab_dim = self.decoder.get_outputs()[0].shape[-1]
+        if isinstance(vocab_dim, int):
+            # Same formula as whisper.model.Whisper.num_languages (multilingual)
+            self.num_languages = vocab_dim - 51765 - 1
+
+        inputs = [i.name for i in self.decoder.get_inputs()]
+        self._tokens_input = next((n for n in inputs if "token" in n), inputs[0])
+        self._features_input = next(n for n in inputs if n != self._tokens_input)
+        self._mel_input = self.encoder.get_inputs()[0].name
+
+    @property
+    def supports_progress(self) -> bool:
+        return True
+
+    # --------------------- Transcription ---------------------
+    def transcribe(
+        self,
+        audio: Any,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        mel = self.mel.spectrogram(audio, padding=N_SAMPLES).numpy()
+        content_frames = mel.shape[-1] - N_FRAMES
+
+        language = options.get("language")
+        task = options.get("task", "transcribe")
+        if language is None:
+            language = self.detect_language_from_features(self._encode(mel[:, :N_FRAMES]))
+
+        tokenizer = self._tokenizer(language, task)
+        prompt = options.get("initial_prompt")
+        prompt_tokens = tokenizer.encode(" " + prompt.strip()) if prompt else []
+
+        guard = options.get("repetition")
+        segments: List[Dict[str, Any]] = []
+        seek = 0
+        while seek < content_frames:
+            window_frames = min(N_FRAMES, content_frames - seek)
+            window = self._pad_window(mel[:, seek : seek + window_frames])
+            if guard is not None:
+                guard.windows = [
+                    (seek * HOP_LENGTH / SAMPLE_RATE, (seek + window_frames) * HOP_LENGTH / SAMPLE_RATE)
+                ]
+
+            tokens, sum_logprob, no_speech_prob = self._greedy_decode(
+                self._encode(window), tokenizer, prompt_tokens, guard
+            )
+            window_segments, covered = split_timestamped_tokens(
+                tokens,
+                tokenizer,
+                seek * HOP_LENGTH / SAMPLE_RATE,
+                window_frames * HOP_LENGTH / SAMPLE_RATE,
+            )
+
+            avg_logprob = sum_logprob / (len(tokens) + 1)
+            for segment in window_segments:
+                segment.update(
+                    temperature=0.0, avg_logprob=avg_logprob, no_speech_prob=no_speech_prob
+                )
+            if guard is not None:
+                window_segments = guard.filter_segments(window_segments)
+            segments.extend(window_segments)
+
+            # Resume from the last complete timestamp, like whisper.transcribe
+            seek += max(1, round(covered * SAMPLE_RATE / HOP_LENGTH))
+            if progress_handler:
+                progress_handler(min(100.0, 100.0 * seek / max(1, content_frames)))
+
+        return self.build_result(segments, language)
+
+    def detect_language(self, audio: Any) -> Optional[str]:
+        return self.detect_language_from_features(self._encode(self.mel.window(audio).numpy()))
+
+    def detect_language_from_features(self, features: np.ndarray) -> str:
+        """Pick the most likely language token after <|startoftranscript|>."""
+        tokenizer = self._tokenizer(None, "transcribe")
+        logits = self._decode_step([tokenizer.sot], features)[-1]
+        lang_tokens = list(tokenizer.all_language_tokens)
+        best = lang_tokens[int(np.argmax(logits[lang_tokens]))]
+
+        return tokenizer.decode([best]).strip("<|>")
+
+    # --------------------- Graph Calls ---------------------
+    def _encode(self, mel_window: np.ndarray) -> np.ndarray:
+        batch = mel_window[np.newaxis].astype(np.float32)
+        return self.encoder.run(None, {self._mel_input: batch})[0]
+
+    def _decode_step(self, tokens: List[int], features: np.ndarray) -> np.ndarray:
+        feed = {
+            self._tokens_input: np.asarray([tokens], dtype=np.int64),
+            self._features_input: features,
+        }
+        return self.decoder.run(None, feed)[0][0]
+
+    def _start_cache(self, features: np.ndarray) -> Dict[str, np.ndarray]:
+        """Cross-attention keys/values of one window and an empty self-attention cache."""
+        cross_kv = self.cross_kv.run(None, {"audio_features": features})[0]
+        n_kv, batch, _, n_state = cross_kv.shape
+        return {"cross_kv": cross_kv, "self_kv": np.zeros((n_kv, batch, 0, n_state), np.float32)}
+
+    def _decode_cached(self, new_tokens: List[int], cache: Dict[str, np.ndarray]) -> np.ndarray:
+        """Logits of `new_tokens` only; extends the self-attention cache in place."""
+        feed = {"tokens": np.asarray([new_tokens], dtype=np.int64), **cache}
+        logits, cache["self_kv"] = self.cached_decoder.run(None, feed)
+        return logits[0]
+
+    # --------------------- Decoding ---------------------
+    def _tokenizer(self, language: Optional[str], task: str) -> Tokenizer:
+        return get_tokenizer(
+            multilingual=True,
+            num_languages=self.num_languages,
+            language=language,
+            task=task,
+        )
+
+    def _greedy_decode(
+        self,
+        features: np.ndarray,
+        tokenizer: Tokenizer,
+        prompt_tokens: List[int],
+        guard: Optional[RepetitionGuard] = None,
+    ) -> Tuple[List[int], float, float]:
+        """
+        Greedy decoding of one window. Returns (tokens, sum_logprob, no_speech_prob).
+
+        With a RepetitionGuard, decoding stops as soon as the text tokens loop.
+        """
+        initial = list(tokenizer.sot_sequence)
+        if prompt_tokens:
+            initial = [tokenizer.sot_prev] + prompt_tokens[-(self.SAMPLE_LEN - 1):] + initial
+
+        sot_index = initial.index(tokenizer.sot)
+        sample_begin = len(initial)
+        suppress = self._suppressed_tokens(tokenizer)
+
+        tokens = list(initial)
+        sum_logprob = 0.0
+        no_speech_prob = 0.0
+        cache = self._start_cache(features) if self.cached_decoder is not None else None
+
+        for step in range(self.SAMPLE_LEN):
+            if len(tokens) >= self.N_TEXT_CTX:
+                break  # No positional embedding beyond the text context
+
+            if cache is None:
+                logits = self._decode_step(tokens, features)
+            else:  # Whole prefix on the first step, then one token at a time
+                logits = self._decode_cached(tokens if step == 0 else tokens[-1:], cache)
+            if step == 0:
+                no_speech_prob = float(_softmax(logits[sot_index])[tokenizer.no_speech])
+
+            last = logits[-1].astype(np.float64)
+            last[suppress] = -np.inf
+            if step == 0:
+                last[tokenizer.encode(" ") + [tokenizer.eot]] = -np.inf  # No blank start
+
+            self._apply_timestamp_rules(last, tokens[sample_begin:], tokenizer)
+
+            next_token = int(np.argmax(last))
+            sum_logprob += float(_log_softmax(last)[next_token])
+            if next_token == tokenizer.eot:
+                break
+
+            tokens.append(next_token)
+            if guard is not None:
+                text_tokens = [t for t in tokens[sample_begin:] if t < tokenizer.eot]
+                reason = guard.loop_reason(text_tokens)
+                if reason:
+                    guard.record(reason, 0, len(text_tokens))
+                    break
+
+        return tokens[sample_begin:], sum_logprob, no_speech_prob
+
+    def _suppressed_tokens(self, tokenizer: Tokenizer) -> List[int]:
+        """Same set Whisper suppresses with suppress_tokens="-1"."""
+        specials = [
+            tokenizer.transcribe,
+            tokenizer.translate,
+            tokenizer.sot,
+            tokenizer.sot_prev,
+            tokenizer.sot_lm,
+            tokenizer.no_speech,
+            tokenizer.no_timestamps,
+        ]
+        return sorted(set(tokenizer.non_speech_tokens) | set(specials))
+
+    def _apply_timestamp_rules(
+        self, logits: np.ndarray, sampled: List[int], tokenizer: Tokenizer
+    ) -> None:
+        """Port of whisper.decoding.ApplyTimestampRules for a single sequence."""
+        begin = tokenizer.timestamp_begin
+
+        if not sampled:
+            logits[:begin] = -np.inf  # Window must open with a timestamp
+            max_initial = begin + round(self.MAX_INITIAL_TIMESTAMP / self.TIME_PRECISION)
+            logits[max_initial + 1 :] = -np.inf
+
+        else:
+            last_was_timestamp = sampled[-1] >= begin
+            penultimate_was_timestamp = len(sampled) < 2 or sampled[-2] >= begin
+
+            if last_was_timestamp:
+                if penultimate_was_timestamp:  # Pair closed, text must follow
+                    logits[begin:] = -np.inf
+                else:  # Text must be closed by a timestamp (or end of text)
+                    logits[: tokenizer.eot] = -np.inf
+
+            timestamps = [t for t in sampled if t >= begin]
+            if timestamps:  # Timestamps never decrease
+                floor = timestamps[-1]
+                if not (last_was_timestamp and not penultimate_was_timestamp):
+                    floor += 1
+                logits[begin:floor] = -np.inf
+
+        # Prefer a timestamp when their total probability beats any text token
+        logprobs = _log_softmax(logits)
+        timestamp_logprob = np.logaddexp.reduce(logprobs[begin:])
+        if timestamp_logprob > logprobs[:begin].max():
+            logits[:begin] = -np.inf
+
+    @staticmethod
+    def _pad_window(window: np.ndarray) -> np.ndarray:
+        if window.shape[-1] < N_FRAMES:
+            window = np.pad(window, ((0, 0), (0, N_FRAMES - window.shape[-1])))
+        return window
+
+    # --------------------- Export ---------------------
+    @classmethod
+    def export(cls, model_size: str, model_dir: Optional[str] = None) -> str:
+        """
+        Export a Whisper checkpoint to the graph layout this backend expects.
+
+        Returns:
+            Folder containing encoder.onnx, decoder.onnx and the cached
+            decoding graphs (cross_kv.onnx, decoder_cached.onnx)
+        """
+        model = whisper.load_model(model_size, device="cpu").eval()
+        folder = os.path.join(model_dir or os.path.join(CACHE_DIR, "onnx"), model_size)
+        os.makedirs(folder, exist_ok=True)
+
+        mel = torch.zeros(1, model.dims.n_mels, N_FRAMES)
+        with torch.no_grad(), disable_sdpa():  # Plain attention: SDPA's is_causal does not export
+            features = model.encoder(mel)
+            tokens = torch.zeros(1, 4, dtype=torch.long)
+            cross_kv = _CrossKvGraph(model.decoder)(features)
+            self_kv = torch.zeros(cross_kv.shape[0], 1, 4, cross_kv.shape[-1])
+
+            torch.onnx.export(
+                model.encoder,
+                (mel,),
+                os.path.join(folder, cls.ENCODER_FILE),
+                input_names=["mel"],
+                output_names=["audio_features"],
+                dynamic_axes={"mel": {0: "batch"}, "audio_features": {0: "batch"}},
+                opset_version=17,
+            )
+            torch.onnx.export(
+                _DecoderGraph(model.decoder),
+                (tokens, features),
+                os.path.join(folder, cls.DECODER_FILE),
+                input_names=["tokens", "audio_features"],
+                output_names=["logits"],
+                dynamic_axes={
+                    "tokens": {0: "batch", 1: "n_tokens"},
+                    "audio_features": {0: "batch"},
+                    "logits": {0: "batch", 1: "n_tokens"},
+                },
+                opset_version=17,
+            )
+            torch.onnx.export(
+                _CrossKvGraph(model.decoder),
+                (features,),
+                os.path.join(folder, cls.CROSS_KV_FILE),
+                input_names=["audio_features"],
+                output_names=["cross_kv"],
+                dynamic_axes={"audio_features": {0: "batch"}, "cross_kv": {1: "batch"}},
+                opset_version=17,
+            )
+            torch.onnx.export(
+                _CachedDecoderGraph(model.decoder),
+                (tokens[:, :2], cross_kv, self_kv),  # Sizes above 1 stay dynamic
+                os.path.join(folder, cls.CACHED_DECODER_FILE),
+                input_names=["tokens", "cross_kv", "self_kv"],
+                output_names=["logits", "new_self_kv"],
+                dynamic_axes={
+                    "tokens": {0: "batch", 1: "n_new"},
+                    "cross_kv": {1: "batch"},
+                    "self_kv": {1: "batch", 2: "n_past"},
+                    "logits": {0: "batch", 1: "n_new"},
+                    "new_self_kv": {1: "batch", 2: "n_total"},
+                },
+                opset_version=17,
+            )
+
+        debug.dprint(f"Exported ONNX graphs for {model_size} to {folder}")
+        return folder
+
+
+def _log_softmax(x: np.ndarray) -> np.ndarray:
+    shifted = x - np.max(x)
+    return shifted - np.log(np.sum(np.exp(shifted)))
+
+
+def _softmax(x: np.ndarray) -> np.ndarray:
+    return np.exp(_log_softmax(x.astype(np.float64)))
+
+
+class _DecoderGraph(torch.nn.Module):
+    """Cache-free decoder wrapper with a (tokens, audio_features) signature."""
+
+    def __init__(self, decoder):
+        super().__init__()
+        self.decoder = decoder
+
+    def forward(self, tokens, audio_features):
+        return self.decoder(tokens, audio_features)
+
+
+def _attend(q, k, v, n_head: int, mask=None):
+    """whisper.model.MultiHeadAttention.qkv_attention without SDPA (exportable)."""
+    scale = (q.shape[-1] // n_head) ** -0.25
+    q = q.view(*q.shape[:2], n_head, -1).permute(0, 2, 1, 3)
+    k = k.view(*k.shape[:2], n_head, -1).permute(0, 2, 3, 1)
+    v = v.view(*v.shape[:2], n_head, -1).permute(0, 2, 1, 3)
+
+    qk = (q * scale) @ (k * scale)
+    if mask is not None:
+        qk = qk + mask
+    weights = torch.softmax(qk.float(), dim=-1).to(q.dtype)
+    return (weights @ v).permute(0, 2, 1, 3).flatten(start_dim=2)
+
+
+class _CrossKvGraph(torch.nn.Module):
+    """Cross-attention keys/values of every decoder block, computed once per window."""
+
+    def __init__(self, decoder):
+        super().__init__()
+        self.decoder = decoder
+
+    def forward(self, audio_features):
+        kv = []
+        for block in self.decoder.blocks:
+            kv += [block.cross_attn.key(audio_features), block.cross_attn.value(audio_features)]
+        return torch.stack(kv)
+
+
+class _CachedDecoderGraph(torch.nn.Module):
+    """
+    Decoder step over new tokens only, with explicit key/value caches.
+
+    Self-attention keys/values of the earlier tokens come in as `self_kv`
+    and go out extended by the new ones; positions continue from n_past.
+    """
+
+    def __init__(self, decoder):
+        super().__init__()
+        self.decoder = decoder
+
+    def forward(self, tokens, cross_kv, self_kv):
+        decoder = self.decoder
+        offset = self_kv.shape[2]
+        end = offset + tokens.shape[-1]
+
+        x = decoder.token_embedding(tokens) + decoder.positional_embedding[offset:end]
+        mask = decoder.mask[offset:end, :end]  # Causal rows of the new positions
+
+        new_kv = []
+        for i, block in enumerate(decoder.blocks):
+            h = block.attn_ln(x)
+            k = torch.cat([self_kv[2 * i], block.attn.key(h)], dim=1)
+            v = torch.cat([self_kv[2 * i + 1], block.attn.value(h)], dim=1)
+            x = x + block.attn.out(_attend(block.attn.query(h), k, v, block.attn.n_head, mask))
+            new_kv += [k, v]
+
+            h = block.cross_attn_ln(x)
+            q = block.cross_attn.query(h)
+            x = x + block.cross_attn.out(
+                _attend(q, cross_kv[2 * i], cross_kv[2 * i + 1], block.cross_attn.n_head)
+            )
+            x = x + block.mlp(block.mlp_ln(x))
+
+        x = decoder.ln(x)
+        logits = (x @ torch.transpose(decoder.token_embedding.weight.to(x.dtype), 0, 1)).float()
+        return logits, torch.stack(new_kv)
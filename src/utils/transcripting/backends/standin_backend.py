@@ -0,0 +1,134 @@
+import time
+import random
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+from .base import TranscriptionBackend
+from src.utils.models import STANDIN_REALTIME_FACTOR
+from src.utils.text.language import Language
+from src.utils.text.words.common import COMMON_WORDS
+from src.errors.debug import debug
+
+
+
+class StandInBackend(TranscriptionBackend):
+    """
+    Model-free backend producing deterministic, Whisper-shaped output.
+
+    Summary:
+        Meant for profiling and load-testing everything around the model
+        (EndFlow, NotesGenerator, PDFExporter). The same audio length always
+        yields the same segments. `realtime_factor` makes each call sleep
+        for duration * factor seconds, spread across segments, so progress
+        and streaming consumers see realistic pacing.
+    """
+
+    name = "standin"
+    WORDS_PER_SECOND = 2.5  # Same speech rate TimeEstimator assumes
+    SEGMENT_SECONDS = (2.0, 7.0)  # Min/max segment length
+    QUESTION_RATE = 0.1  # Share of segments phrased as questions
+    TERM_RATE = 0.3  # Share of segments mentioning a key term
+    TERMS = [
+        "Transformer", "Gradient", "Entropy", "Protocol",
+        "Fourier", "Lattice", "Bayesian", "Kernel",
+    ]
+
+    def __init__(self, realtime_factor: Optional[float] = None, language: str = "pt"):
+        super().__init__()
+        self.realtime_factor = (
+            STANDIN_REALTIME_FACTOR if realtime_factor is None else realtime_factor
+        )
+        self.language = language
+
+    def load(self, model_size: str) -> None:
+        self.model_size = model_size
+        self.model = self  # Nothing to load; keeps Textify.model non-empty
+
+    @property
+    def supports_progress(self) -> bool:
+        return True
+
+    def detect_language(self, audio: Any) -> Optional[str]:
+        return self.language
+
+    def transcribe(
+        self,
+        audio: Any,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        segments = list(self.transcribe_stream(audio, progress_handler, **options))
+        return self.build_result(segments, options.get("language") or self.language)
+
+    def transcribe_stream(
+        self,
+        audio: Any,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        **options: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        duration = len(audio) / self.sample_rate
+        segments = self.generate_segments(duration, options)
+
+        debug.dprint(
+            f"StandInBackend: {len(segments)} segments for {duration:.2f}s "
+            f"(realtime_factor={self.realtime_factor})"
+        )
+
+        for segment in segments:
+            if self.realtime_factor > 0:
+                time.sleep((segment["end"] - segment["start"]) * self.realtime_factor)
+
+            if progress_handler and duration > 0:
+                progress_handler(min(100.0, 100.0 * segment["end"] / duration))
+
+            yield segment
+
+    def generate_segments(self, duration: float, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build the segment list; seeded by the audio length only."""
+        rng = random.Random(round(duration * 1000))
+        lexicon = self._lexicon(options.get("language") or self.language)
+        terms = self.TERMS + self._prompt_terms(options.get("initial_prompt"))
+
+        segments = []
+        start = 0.0
+        while start < duration:
+            end = min(duration, start + rng.uniform(*self.SEGMENT_SECONDS))
+            word_count = max(1, round((end - start) * self.WORDS_PER_SECOND))
+            words = [rng.choice(lexicon) for _ in range(word_count)]
+
+            if rng.random() < self.TERM_RATE:
+                words[rng.randrange(len(words))] = rng.choice(terms)
+
+            text = " ".join(words)
+            text = text[0].upper() + text[1:]
+            text += "?" if rng.random() < self.QUESTION_RATE else "."
+
+            segments.append(
+                {
+                    "id": len(segments),
+                    "seek": int(start * 100),
+                    "start": round(start, 3),
+                    "end": round(end, 3),
+                    "text": f" {text}",
+                    "tokens": [],
+                    "temperature": options.get("temperature", 0.0),
+                    "avg_logprob": rng.uniform(-0.6, -0.1),
+                    "compression_ratio": rng.uniform(1.2, 2.0),
+                    "no_speech_prob": rng.uniform(0.0, 0.2),
+                }
+            )
+            start = end
+
+        return segments
+
+    def _lexicon(self, language_code: str) -> List[str]:
+        language = Language()
+        language.process_whisper_output({"language": language_code})
+        return COMMON_WORDS.get(language.get_language(), COMMON_WORDS["default"])
+
+    def _prompt_terms(self, prompt: Optional[str]) -> List[str]:
+        """Reuse custom vocabulary from the SanitizePrompt output, if any."""
+        if not prompt or ":" not in prompt:
+            return []
+
+        return [t.strip() for t in prompt.split(":", 1)[1].split(",") if t.strip()]
@@ -0,0 +1,349 @@
+import time
+import inspect
+import importlib
+import threading
+import torch
+import numpy as np
+from dataclasses import replace
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from whisper.audio import HOP_LENGTH, N_FRAMES, SAMPLE_RATE
+from whisper.decoding import DecodingTask
+from whisper.timing import add_word_timestamps
+from whisper.tokenizer import get_tokenizer
+
+
+from .base import TranscriptionBackend
+from ..mel_frontend import MelFrontend
+from ..set_model import SetModel
+from src.errors.debug import debug
+
+
+# Per-thread progress handler read by the patched whisper progress bar
+_frame_progress = threading.local()
+
+# Per-thread FallbackTracker (and current window) and RepetitionGuard read by the decode hook
+_decode_state = threading.local()
+
+# Per-thread MelFrontend read by the patched whisper spectrogram
+_mel_state = threading.local()
+
+# whisper.transcribe attributes replaced while at least one transcribe call runs
+_patch_lock = threading.Lock()
+_patch_users = 0
+_patch_originals: Dict[str, Any] = {}
+
+
+
+def _frame_progress_tqdm(base_module: Any) -> Any:
+    """
+    Stand-in for whisper.transcribe's `tqdm` module that reports decoded frames.
+
+    openai-whisper advances a tqdm bar by the frames each window consumes
+    (disabled unless verbose=False). The bar class is a subclass that also
+    forwards the position to the handler of the calling thread, so
+    concurrent jobs do not see each other's progress; every other
+    attribute is the real module's.
+    """
+    base = base_module.tqdm
+
+    class FrameProgress(base):
+        def __init__(self, *args: Any, **kwargs: Any):
+            super().__init__(*args, **kwargs)
+            self.frames = 0  # tqdm stops counting when disabled
+
+        def update(self, n: float = 1) -> Optional[bool]:
+            self.frames += n
+            handler = getattr(_frame_progress, "handler", None)
+            if handler and self.total:
+                handler(min(100.0, 100.0 * self.frames / self.total))
+            return super().update(n)
+
+    return SimpleNamespace(**{**vars(base_module), "tqdm": FrameProgress})
+
+
+@contextmanager
+def _whisper_patches() -> Iterator[None]:
+    """
+    Patch whisper.transcribe for the duration of our transcribe calls only.
+
+    The first concurrent call installs the patched attributes, the last one
+    to return restores the originals, so other whisper users in the process
+    (the cascade refiner, benchmarks) get stock whisper outside our calls.
+    Inside, threads without per-thread state get the stock behaviour too.
+    """
+    global _patch_users
+    module = importlib.import_module("whisper.transcribe")
+
+    with _patch_lock:
+        if _patch_users == 0:
+            _patch_originals["tqdm"] = module.tqdm
+            _patch_originals["log_mel_spectrogram"] = module.log_mel_spectrogram
+            module.tqdm = _frame_progress_tqdm(module.tqdm)
+            module.log_mel_spectrogram = _chunked_log_mel(module.log_mel_spectrogram)
+        _patch_users += 1
+
+    try:
+        yield
+
+    finally:
+        with _patch_lock:
+            _patch_users -= 1
+            if _patch_users == 0:
+                module.tqdm = _patch_originals.pop("tqdm")
+                module.log_mel_spectrogram = _patch_originals.pop("log_mel_spectrogram")
+
+
+def _chunked_log_mel(original: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Stand-in for whisper.transcribe's `log_mel_spectrogram` using the calling thread's MelFrontend.
+
+    whisper.transcribe computes the log-mel of the whole array in one call.
+    Arrays are handed to the thread's MelFrontend (chunked, optionally
+    cached); everything else keeps the original behaviour.
+    """
+
+    def log_mel_spectrogram(
+        audio: Any, n_mels: int = 80, padding: int = 0, device: Any = None
+    ) -> Any:
+        frontend = getattr(_mel_state, "frontend", None)
+        if frontend is None or frontend.n_mels != n_mels or not isinstance(audio, np.ndarray):
+            return original(audio, n_mels, padding, device)
+
+        return frontend.spectrogram(audio, padding)
+
+    return log_mel_spectrogram
+
+
+class WhisperBackend(TranscriptionBackend):
+    """Reference backend running the official openai-whisper implementation"""
+
+    name = "whisper"
+    ALIGN_PAD_SECONDS = 0.5  # Audio kept around the segments being aligned
+
+    def __init__(self, encoder_mode: str = "eager", persist_mel: bool = False):
+        super().__init__()
+        self.loader = SetModel()
+        self.persist_mel = persist_mel  # Keep spectrograms on disk for re-runs
+        self.mel: Optional[MelFrontend] = None
+        self.requested_encoder_mode = encoder_mode
+        self.encoder_mode = "eager"
+        self.use_on_progress = False
+        self.use_progress_callback = False
+
+    def load(self, model_size: str) -> None:
+        self.model_size = model_size
+        self.model = self.loader.load(model_size, self.requested_encoder_mode)
+        self.encoder_mode = self.loader.encoder_mode
+        self.mel = MelFrontend(self.model.dims.n_mels, persist=self.persist_mel)
+
+        # Detect Whisper version parameters
+        self._detect_whisper_params()
+
+    def _detect_whisper_params(self) -> None:
+        """Determine correct progress parameter name for Whisper version"""
+        transcribe_params = inspect.signature(self.model.transcribe).parameters
+        self.use_on_progress = "on_progress" in transcribe_params
+        self.use_progress_callback = "progress_callback" in transcribe_params
+
+    @property
+    def supports_progress(self) -> bool:
+        return True  # Native callback, or frame counts from the patched tqdm
+
+    def detect_language(self, audio: Any) -> Optional[str]:
+        if not self.model.is_multilingual:
+            return "en"
+
+        dtype = next(self.model.parameters()).dtype
+        mel = self.mel.window(audio).to(self.model.device, dtype=dtype)
+        _, probs = self.model.detect_language(mel)
+        return max(probs, key=probs.get)
+
+    def align_words(
+        self, audio: Any, segments: List[Dict[str, Any]], language: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Cross-attention alignment of the given segments only.
+
+        Requested segments that fit in one 30-second window are aligned
+        together, so each window costs one forward pass of the model, the
+        same work whisper.transcribe adds per window with word_timestamps.
+        """
+        audio = np.asarray(audio, dtype=np.float32)
+        tokenizer = get_tokenizer(
+            self.model.is_multilingual,
+            num_languages=self.model.num_languages,
+            language=language,
+            task="transcribe",
+        )
+        dtype = next(self.model.parameters()).dtype
+        window_seconds = N_FRAMES * HOP_LENGTH / SAMPLE_RATE
+
+        aligned = [dict(segment) for segment in sorted(segments, key=lambda s: s["start"])]
+        for segment in aligned:
+            tokens = segment.get("tokens") or tokenizer.encode(segment.get("text", ""))
+            segment["tokens"] = [t for t in tokens if t < tokenizer.eot]
+
+        groups: List[Tuple[float, List[Dict[str, Any]]]] = []  # (window start, segments)
+        for segment in aligned:
+            if groups and segment["end"] + self.ALIGN_PAD_SECONDS - groups[-1][0] <= window_seconds:
+                groups[-1][1].append(segment)
+            else:
+                groups.append((max(0.0, segment["start"] - self.ALIGN_PAD_SECONDS), [segment]))
+
+        for begin, group in groups:
+            seek = int(begin * SAMPLE_RATE) // HOP_LENGTH
+            end = min(len(audio), int((group[-1]["end"] + self.ALIGN_PAD_SECONDS) * SAMPLE_RATE))
+            window = audio[seek * HOP_LENGTH : end]
+            mel = self.mel.window(window)
+            for segment in group:
+                segment["seek"] = seek  # whisper.timing offsets word times by the seek
+
+            add_word_timestamps(
+                segments=group,
+                model=self.model,
+                tokenizer=tokenizer,
+                mel=mel.to(self.model.device, dtype=dtype),
+                num_frames=min(N_FRAMES, len(window) // HOP_LENGTH),
+                last_speech_timestamp=seek * HOP_LENGTH / SAMPLE_RATE,
+            )
+
+        debug.dprint(f"Word alignment: {len(aligned)} segments in {len(groups)} windows")
+        return aligned
+
+    @property
+    def precision(self) -> str:
+        # whisper.transcribe only runs fp16 on GPU, CPU always falls back to fp32
+        return "fp16" if self.model.device.type == "cuda" else "fp32"
+
+    def transcribe(
+        self,
+        audio: Any,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        whisper_args: Dict[str, Any] = dict(options)
+        frame_handler = None
+
+        # Safe callback assignment with handler capture
+        if progress_handler:
+            if self.use_on_progress:
+                whisper_args["on_progress"] = lambda pct: progress_handler(pct)
+
+            elif self.use_progress_callback:
+                whisper_args["progress_callback"] = lambda pct: progress_handler(pct)
+
+            else:  # Stock openai-whisper: follow its frame counter instead
+                frame_handler = progress_handler
+
+        # Explicit fallback policy: bounded ladder, retries counted per window
+        tracker = whisper_args.pop("fallback", None)
+        if tracker is not None:
+            policy = tracker.policy
+            whisper_args["temperature"] = policy.ladder()
+            whisper_args["compression_ratio_threshold"] = policy.compression_ratio_threshold
+            whisper_args["logprob_threshold"] = policy.logprob_threshold
+            whisper_args["no_speech_threshold"] = policy.no_speech_threshold
+
+        # Loop guard: closes looping windows early, drops repeated segments after
+        guard = whisper_args.pop("repetition", None)
+
+        # Adaptive beam: beam_size stays in the options, used only when greedy fails
+        beam = whisper_args.pop("beam", None)
+        if beam is not None:
+            beam.use_options(whisper_args)  # Same quality checks as whisper's own fallback
+        if tracker is not None or guard is not None or beam is not None:
+            self._install_decode_hook()
+
+        debug.dprint(f"WhisperBackend.transcribe args={whisper_args}")
+        _mel_state.frontend = self.mel
+        _frame_progress.handler = frame_handler
+        _decode_state.tracker, _decode_state.window = tracker, None
+        _decode_state.guard, _decode_state.beam = guard, beam
+        try:
+            with _whisper_patches():
+                result = self.model.transcribe(audio, **whisper_args)
+        finally:
+            _mel_state.frontend = None
+            _frame_progress.handler = None
+            _decode_state.tracker = _decode_state.window = None
+            _decode_state.guard = _decode_state.beam = None
+
+        if guard is not None:
+            result["segments"] = guard.filter_segments(result.get("segments", []))
+            result["text"] = "".join(segment["text"] for segment in result["segments"])
+
+        return result
+
+    def _install_decode_hook(self) -> None:
+        """
+        Route model.decode through the calling thread's tracker and guard.
+
+        whisper.transcribe decodes each window at the first temperature and
+        calls model.decode again for every fallback step. Each call is
+        recorded; once the window's cap or the job budget is spent, the
+        previous result is returned without decoding, which ends the ladder.
+        With a RepetitionGuard, the window is decoded by a DecodingTask
+        carrying its loop filter. With an AdaptiveBeam, the beam search call
+        at temperature 0 is first tried greedily and only runs when the
+        greedy result fails the quality checks.
+        """
+        if getattr(self.model, "decode_hooked", False):
+            return
+
+        original = self.model.decode
+
+        def guarded(mel: Any, options: Any) -> Any:
+            guard = getattr(_decode_state, "guard", None)
+            if guard is None:
+                return original(mel, options)
+
+            single = mel.ndim == 2
+            guard.windows = []  # whisper.transcribe does not expose the seek: no event times
+            with torch.no_grad():
+                results = guard.attach(DecodingTask(self.model, options)).run(
+                    mel.unsqueeze(0) if single else mel
+                )
+            return results[0] if single else results
+
+        def run(mel: Any, options: Any, **kwargs: Any) -> Any:
+            if kwargs:
+                options = replace(options, **kwargs)
+
+            beam = getattr(_decode_state, "beam", None)
+            if beam is None or not options.beam_size or options.temperature > 0:
+                return guarded(mel, options)
+
+            # whisper.transcribe decodes one window (2-D mel) per call
+            start = time.time()
+            result = guarded(mel, replace(options, beam_size=None, patience=None))
+            beam.record_greedy(1, time.time() - start)
+            if not beam.needs_beam(result):
+                return result
+
+            start = time.time()
+            result = guarded(mel, options)
+            beam.record_beam(time.time() - start)
+            return result
+
+        def decode(mel: Any, options: Any, **kwargs: Any) -> Any:
+            tracker = getattr(_decode_state, "tracker", None)
+            if tracker is None:
+                return run(mel, options, **kwargs)
+
+            window = _decode_state.window
+            if window is None or options.temperature == tracker.policy.ladder()[0]:
+                window = _decode_state.window = tracker.open_window()
+
+            elif not tracker.can_retry(window):
+                return _decode_state.last
+
+            start = time.time()
+            result = run(mel, options, **kwargs)
+            tracker.record(window, options.temperature, time.time() - start)
+            _decode_state.last = result
+            return result
+
+        self.model.decode = decode
+        self.model.decode_hooked = True
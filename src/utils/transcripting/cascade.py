@@ -0,0 +1,163 @@
+import time
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+from .audio_windows import SAMPLE_RATE
+from .backends import TranscriptionBackend
+from .segments import offset_segments
+from src.errors.debug import debug
+
+
+
+class CascadeTranscriber:
+    """
+    Fast draft with a small model, re-decoding only its weak segments.
+
+    Summary:
+        The draft runner transcribes everything. Segments whose confidence
+        signals cross Whisper's own fallback thresholds (low avg_logprob,
+        high compression_ratio or likely silence) are grouped into padded
+        spans and re-transcribed by the refiner, a larger model. Refined
+        segments replace the draft ones inside each span. `summary` reports
+        how much audio was re-decoded and the time saved compared with
+        running the refiner on everything.
+    """
+
+    LOGPROB_THRESHOLD = -1.0  # Same defaults as whisper.transcribe
+    COMPRESSION_THRESHOLD = 2.4
+    NO_SPEECH_THRESHOLD = 0.6
+    PAD_SECONDS = 0.5  # Context added around each weak segment
+    MERGE_GAP_SECONDS = 1.0  # Weak spans closer than this are decoded together
+    DRAFT_SHARE = 0.7  # Part of the progress bar given to the draft pass
+
+    def __init__(self, draft: Any, refiner: TranscriptionBackend, draft_model: str):
+        self.draft = draft
+        self.refiner = refiner
+        self.draft_model = draft_model
+        self.stats = {
+            "weak_segments": 0,
+            "segments": 0,
+            "refined_seconds": 0.0,
+            "draft_time": 0.0,
+            "refine_time": 0.0,
+        }
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        start = time.time()
+        draft = self.draft.transcribe(
+            audio,
+            progress_handler=self._scaled(progress_handler, 0.0, self.DRAFT_SHARE),
+            **options,
+        )
+        self.stats["draft_time"] += time.time() - start
+
+        segments = draft.get("segments", [])
+        language = draft.get("language") or options.get("language")
+        weak = [segment for segment in segments if self.is_weak(segment)]
+        spans = self.weak_spans(weak, len(audio) / SAMPLE_RATE)
+
+        self.stats["segments"] += len(segments)
+        self.stats["weak_segments"] += len(weak)
+        debug.dprint(f"Cascade: {len(weak)}/{len(segments)} weak segments in {len(spans)} spans")
+
+        start = time.time()
+        refine_options = {**options, "language": language} if language else options
+        refined_total = sum(end - begin for begin, end in spans) or 1.0
+        refined_done = 0.0
+
+        for begin, end in spans:
+            low = self.DRAFT_SHARE + (1 - self.DRAFT_SHARE) * refined_done / refined_total
+            refined_done += end - begin
+            high = self.DRAFT_SHARE + (1 - self.DRAFT_SHARE) * refined_done / refined_total
+
+            result = self.refiner.transcribe(
+                audio[int(begin * SAMPLE_RATE) : int(end * SAMPLE_RATE)],
+                progress_handler=self._scaled(progress_handler, low, high),
+                **refine_options,
+            )
+            segments = self.splice(
+                segments, offset_segments(result.get("segments", []), begin), begin, end
+            )
+
+        self.stats["refine_time"] += time.time() - start
+        self.stats["refined_seconds"] += sum(end - begin for begin, end in spans)
+        return TranscriptionBackend.build_result(segments, language)
+
+    # --------------------- Building Blocks ---------------------
+    def is_weak(self, segment: Dict[str, Any]) -> bool:
+        """Segment the draft model is unsure about (any threshold crossed)."""
+        return (
+            segment.get("avg_logprob", 0.0) < self.LOGPROB_THRESHOLD
+            or segment.get("compression_ratio", 0.0) > self.COMPRESSION_THRESHOLD
+            or segment.get("no_speech_prob", 0.0) > self.NO_SPEECH_THRESHOLD
+        )
+
+    def weak_spans(
+        self, weak: List[Dict[str, Any]], duration: float
+    ) -> List[Tuple[float, float]]:
+        """Padded (start, end) spans in seconds, merged when close together."""
+        spans: List[Tuple[float, float]] = []
+        for segment in sorted(weak, key=lambda s: s["start"]):
+            begin = max(0.0, segment["start"] - self.PAD_SECONDS)
+            end = min(duration, segment["end"] + self.PAD_SECONDS)
+
+            if spans and begin - spans[-1][1] <= self.MERGE_GAP_SECONDS:
+                spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+            else:
+                spans.append((begin, end))
+
+        return [(begin, end) for begin, end in spans if end > begin]
+
+    @staticmethod
+    def splice(
+        segments: List[Dict[str, Any]],
+        refined: List[Dict[str, Any]],
+        begin: float,
+        end: float,
+    ) -> List[Dict[str, Any]]:
+        """Replace the segments centred inside [begin, end) with the refined ones."""
+
+        def inside(segment: Dict[str, Any]) -> bool:
+            return begin <= (segment["start"] + segment["end"]) / 2 < end
+
+        kept = [segment for segment in segments if not inside(segment)]
+        kept.extend(segment for segment in refined if inside(segment))
+        return sorted(kept, key=lambda s: s["start"])
+
+    def summary(
+        self, duration: float, refine_model: str, full_estimate: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Re-decoded fraction and time saved versus a full refiner run.
+
+        The full-run time is extrapolated from the refiner's measured speed
+        on the spans it decoded, or `full_estimate` if nothing was refined.
+        """
+        refined = self.stats["refined_seconds"]
+        spent = self.stats["draft_time"] + self.stats["refine_time"]
+        full_time = self.stats["refine_time"] * duration / refined if refined else full_estimate
+
+        return {
+            **self.stats,
+            "draft_model": self.draft_model,
+            "refine_model": refine_model,
+            "refined_fraction": refined / duration if duration else 0.0,
+            "estimated_full_time": full_time,
+            "time_saved": full_time - spent if full_time is not None else None,
+        }
+
+    @staticmethod
+    def _scaled(
+        handler: Optional[Callable[[float], None]], low: float, high: float
+    ) -> Optional[Callable[[float], None]]:
+        """Map a pass's 0-100 progress onto [low, high] of the whole job"""
+        if handler is None:
+            return None
+
+        return lambda pct: handler(100.0 * (low + (high - low) * pct / 100))
@@ -0,0 +1,132 @@
+import os
+import torch
+from typing import Any, Optional
+
+
+from .info_dump import InfoDump
+from src.utils.models import CACHE_DIR, ENCODER_MODES
+from src.errors.exceptions import TranscriptionError
+from src.errors.debug import debug
+
+
+
+class EncoderCompiler:
+    """
+    Swaps a Whisper model's audio encoder for a compiled equivalent.
+
+    Summary:
+        The encoder runs once per 30-second window and dominates CPU time.
+        "trace" builds a TorchScript module and saves it to disk, so the
+        tracing cost is only paid once per checkpoint, torch version and
+        device. "compile" uses torch.compile with the inductor cache under
+        the same directory. Both are checked against the eager encoder on a
+        multi-window batch, like WindowDecoder sends; any failure leaves the
+        eager encoder in place.
+    """
+
+    CACHE_SUBDIR = "encoders"
+    N_FRAMES = 3000  # Mel frames in one 30-second window
+    TOLERANCE = 1e-3  # Max abs difference accepted against the eager output
+    VERIFY_BATCH = 2  # Windows in the check batch; the trace itself uses one
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = os.path.join(cache_dir or CACHE_DIR, self.CACHE_SUBDIR)
+        self.info = InfoDump()
+
+    def apply(
+        self,
+        model: Any,
+        model_size: str,
+        mode: str = "eager",
+        checkpoint_sha256: Optional[str] = None,
+    ) -> str:
+        """
+        Compile the encoder of `model` in place.
+
+        Args:
+            model: Loaded Whisper model
+            model_size: Name of the Whisper model size (part of the cache key)
+            mode: One of ENCODER_MODES
+            checkpoint_sha256: Digest of the loaded checkpoint (part of the cache key)
+
+        Returns:
+            The mode actually in use ("eager" when compilation fell back)
+        """
+        if mode not in ENCODER_MODES:
+            raise TranscriptionError.invalid_encoder_mode(mode)
+
+        if mode == "eager":
+            return mode
+
+        eager_encoder = model.encoder
+        try:
+            if mode == "trace":
+                model.encoder = self._load_or_trace(model, model_size, checkpoint_sha256)
+            else:
+                model.encoder = self._compile(model)
+
+            self._verify(model, eager_encoder)
+            debug.dprint(f"Encoder compiled with mode={mode} for model={model_size}")
+            return mode
+
+        except Exception as e:
+            model.encoder = eager_encoder
+            self.info.log_compile_fallback(mode, e)
+            return "eager"
+
+    def artifact_path(
+        self, model: Any, model_size: str, checkpoint_sha256: Optional[str] = None
+    ) -> str:
+        """Cache location for a traced encoder (per checkpoint, torch version, device, dtype)."""
+        dtype = str(next(model.encoder.parameters()).dtype).replace("torch.", "")
+        checkpoint = f"{model_size}-{checkpoint_sha256[:16]}" if checkpoint_sha256 else model_size
+        name = f"{checkpoint}-torch{torch.__version__}-{model.device.type}-{dtype}.pt"
+        return os.path.join(self.cache_dir, name.replace("+", "_"))
+
+    def _example_input(self, model: Any, batch: int = 1) -> Any:
+        dtype = next(model.encoder.parameters()).dtype
+        return torch.zeros(
+            batch, model.dims.n_mels, self.N_FRAMES, dtype=dtype, device=model.device
+        )
+
+    def _load_or_trace(
+        self, model: Any, model_size: str, checkpoint_sha256: Optional[str] = None
+    ) -> Any:
+        """Reuse a persisted TorchScript encoder, tracing and saving it on a miss."""
+        path = self.artifact_path(model, model_size, checkpoint_sha256)
+        if os.path.isfile(path):
+            debug.dprint(f"Loading traced encoder from cache: {path}")
+            return torch.jit.load(path, map_location=model.device)
+
+        with torch.no_grad():
+            traced = torch.jit.trace(model.encoder, self._example_input(model))
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        torch.jit.save(traced, tmp_path)
+        os.replace(tmp_path, path)  # Never leave a half-written artifact behind
+
+        debug.dprint(f"Traced encoder saved to: {path}")
+        return traced
+
+    def _compile(self, model: Any) -> Any:
+        """Wrap the encoder with torch.compile (cache dir: models.INDUCTOR_CACHE_DIR)."""
+        try:
+            import torch._inductor.config as inductor_config
+
+            inductor_config.fx_graph_cache = True
+        except (ImportError, AttributeError):
+            pass
+
+        return torch.compile(model.encoder)  # Batch size turns dynamic after the first change
+
+    def _verify(self, model: Any, eager_encoder: Any) -> None:
+        """Run a batch of windows through both encoders; this also triggers lazy compilation."""
+        example = torch.randn_like(self._example_input(model, self.VERIFY_BATCH))
+        with torch.no_grad():
+            expected = eager_encoder(example)
+            actual = model.encoder(example)
+
+        diff = (expected.float() - actual.float()).abs().max().item()
+        if diff > self.TOLERANCE:
+            raise ValueError(f"Compiled encoder output differs by {diff:.2e}")
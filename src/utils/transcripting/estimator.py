@@ -2,7 +2,7 @@ from scipy.stats import norm
 from typing import Tuple
 
 
-from src.utils.models import MODEL_SPEEDS, SETUP_TIMES
+from .host_profile import HostProfile
 from src.errors.exceptions import TranscriptionError
 
 
@@ -23,12 +23,13 @@ class TimeEstimator:
 
         Args:
             model_size: Name of the Whisper model size
-            model_speeds: Optional custom speed dictionary
-            setup_times: Optional custom setup times dictionary
+            model_speeds: Optional custom speed dictionary (default: host profile)
+            setup_times: Optional custom setup times dictionary (default: host profile)
         """
+        profile = HostProfile.current()  # Calibrated on this host, else built-in constants
         self.model_size = model_size
-        self.model_speeds = model_speeds or MODEL_SPEEDS
-        self.setup_times = setup_times or SETUP_TIMES
+        self.model_speeds = model_speeds or profile.model_speeds
+        self.setup_times = setup_times or profile.setup_times
 
         if model_size not in self.model_speeds:
             raise TranscriptionError.invalid_model_size(model_size=model_size)
@@ -66,6 +67,27 @@ class TimeEstimator:
             ci_upper / actual_speed,
         )
 
+    def upper_bound(
+        self, audio_duration: float, confidence: float, custom_word_count: int = 0
+    ) -> float:
+        """
+        Transcription time not exceeded with probability `confidence`.
+
+        Args:
+            audio_duration: Audio duration in seconds
+            confidence: One-sided confidence level (e.g. 0.9)
+            custom_word_count: Number of custom vocabulary words
+
+        Returns:
+            Time in seconds at the `confidence` quantile of the word count
+        """
+        z_score = norm.ppf(confidence)
+        words = (
+            audio_duration * self.WORDS_PER_SECOND_MEAN
+            + z_score * audio_duration * self.WORDS_PER_SECOND_STD
+        )
+        return max(0.0, words) / self._get_adjusted_speed(custom_word_count)
+
     def get_setup_time(self) -> float:
         """
         Get the estimated setup time for the current model size.
@@ -0,0 +1,105 @@
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+
+
+@dataclass
+class FallbackPolicy:
+    """
+    Temperature fallback rules for one job.
+
+    A window whose decode looks repetitive (compression ratio) or unsure
+    (average log-probability) is decoded again at the next temperature of
+    the ladder, at most `max_retries_per_window` times, while the job has
+    retries left in `job_retry_budget`.
+    """
+
+    temperatures: Tuple[float, ...] = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+    max_retries_per_window: int = 2
+    job_retry_budget: int = 20
+    compression_ratio_threshold: float = 2.4  # Same defaults as whisper.transcribe
+    logprob_threshold: float = -1.0
+    no_speech_threshold: float = 0.6
+
+    def ladder(self) -> Tuple[float, ...]:
+        """Temperatures a single window may go through."""
+        return tuple(self.temperatures[: self.max_retries_per_window + 1])
+
+    def needs_fallback(
+        self, compression_ratio: float, avg_logprob: float, no_speech_prob: float
+    ) -> bool:
+        if no_speech_prob > self.no_speech_threshold and avg_logprob < self.logprob_threshold:
+            return False  # Silent window, skipped anyway
+
+        return (
+            compression_ratio > self.compression_ratio_threshold
+            or avg_logprob < self.logprob_threshold
+        )
+
+
+class FallbackTracker:
+    """
+    Per-job retry budget and per-window decode counters for a FallbackPolicy.
+
+    Runners open one entry per decoded window and record every decode
+    (temperature and time spent). `summary` goes into the result metadata.
+    """
+
+    def __init__(self, policy: FallbackPolicy):
+        self.policy = policy
+        self.offset = 0.0  # Seconds added to window times (span being decoded)
+        self.retries = 0
+        self.windows: List[Dict[str, Any]] = []
+
+    @property
+    def budget_left(self) -> int:
+        return max(0, self.policy.job_retry_budget - self.retries)
+
+    def open_window(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """New counter entry; times are relative to the current span (left out if unknown)."""
+        window: Dict[str, Any] = {}
+        if start is not None and end is not None:
+            window.update(start=round(self.offset + start, 3), end=round(self.offset + end, 3))
+
+        window.update(decodes=0, temperatures=[], decode_time=0.0, retry_time=0.0)
+        self.windows.append(window)
+        return window
+
+    def record(self, window: Dict[str, Any], temperature: float, seconds: float) -> None:
+        if window["decodes"]:
+            self.retries += 1
+            window["retry_time"] += seconds
+
+        window["decodes"] += 1
+        window["temperatures"].append(temperature)
+        window["decode_time"] += seconds
+
+    def can_retry(self, window: Dict[str, Any]) -> bool:
+        return window["decodes"] < len(self.policy.ladder()) and self.budget_left > 0
+
+    def next_temperature(self, window: Dict[str, Any]) -> float:
+        return self.policy.ladder()[window["decodes"]]
+
+    def fork(self, offset: float, budget: int) -> "FallbackTracker":
+        """Empty tracker for a part of the job decoded elsewhere, with `budget` retries."""
+        forked = FallbackTracker(replace(self.policy, job_retry_budget=budget))
+        forked.offset = self.offset + offset
+        return forked
+
+    def merge(self, other: "FallbackTracker") -> None:
+        """Add the windows and retries of a forked tracker."""
+        self.windows.extend(other.windows)
+        self.retries += other.retries
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "policy": asdict(self.policy),
+            "windows": len(self.windows),
+            "decodes": sum(w["decodes"] for w in self.windows),
+            "retries": self.retries,
+            "budget_left": self.budget_left,
+            "retry_time": sum(w["retry_time"] for w in self.windows),
+            "per_window": self.windows,
+        }
@@ -0,0 +1,132 @@
+import os
+import glob
+import torch
+import numpy as np
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+from src.utils.models import CACHE_DIR
+from src.errors.debug import debug
+
+
+Span = Tuple[int, int]
+
+
+
+class FeatureCache:
+    """
+    Encoder output per 30-second window, in memory and memory-mapped on disk.
+
+    Summary:
+        Keys are "<model key>-<audio fingerprint>" plus the window's sample
+        span, so a re-run of the same audio on the same model (new prompt,
+        vocabulary, temperature or task) only runs the decoder. Recent
+        windows stay in memory (LRU, `max_memory_bytes`); every window is
+        also written as .npy (in the model's dtype, which the key's
+        precision names) under CACHE_DIR/features and mapped back without
+        a copy, the oldest files being evicted past `max_disk_bytes`.
+    """
+
+    CACHE_SUBDIR = "features"
+    DEFAULT_MAX_MEMORY = 512 * 1024 * 1024  # 512 MiB
+    DEFAULT_MAX_DISK = 4 * 1024 * 1024 * 1024  # 4 GiB
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY,
+        max_disk_bytes: int = DEFAULT_MAX_DISK,
+        on_disk: bool = True,
+    ):
+        self.cache_dir = os.path.join(cache_dir or CACHE_DIR, self.CACHE_SUBDIR)
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.on_disk = on_disk
+        self._memory: "OrderedDict[str, torch.Tensor]" = OrderedDict()
+        self._memory_bytes = 0
+
+    def get(
+        self, key: str, span: Span, device: torch.device, dtype: torch.dtype
+    ) -> Optional[torch.Tensor]:
+        """Features (n_audio_ctx, n_audio_state) of one window, or None."""
+        name = self._name(key, span)
+        features = self._memory.get(name)
+        if features is not None:
+            self._memory.move_to_end(name)
+            return features.to(device, dtype=dtype)
+
+        if not self.on_disk:
+            return None
+
+        path = os.path.join(self.cache_dir, f"{name}.npy")
+        try:
+            mapped = np.load(path, mmap_mode="c")  # Copy-on-write: torch needs a writable array
+        except (OSError, ValueError):
+            return None
+
+        os.utime(path)  # Mark as recently used for eviction
+        features = torch.from_numpy(mapped).to(device, dtype=dtype)  # No copy on CPU at model dtype
+        self._remember(name, features)
+        return features
+
+    def put(self, key: str, span: Span, features: torch.Tensor) -> None:
+        name = self._name(key, span)
+        self._remember(name, features.detach())
+
+        if not self.on_disk:
+            return
+
+        path = os.path.join(self.cache_dir, f"{name}.npy")
+        tmp_path = f"{path}.tmp.npy"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            np.save(tmp_path, features.detach().cpu().numpy())
+            os.replace(tmp_path, path)
+
+        except OSError as e:
+            debug.dprint(f"Feature cache write failed: {e}")
+            return
+
+        self._evict_disk()
+
+    def clear(self) -> None:
+        """Drop every cached window, in memory and on disk."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        for path in glob.glob(os.path.join(self.cache_dir, "*.npy")):
+            os.remove(path)
+
+    # --------------------- Internals ---------------------
+    def _remember(self, name: str, features: torch.Tensor) -> None:
+        size = features.element_size() * features.nelement()
+        if size > self.max_memory_bytes:
+            return
+
+        previous = self._memory.pop(name, None)
+        if previous is not None:
+            self._memory_bytes -= previous.element_size() * previous.nelement()
+
+        self._memory[name] = features
+        self._memory_bytes += size
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, oldest = self._memory.popitem(last=False)
+            self._memory_bytes -= oldest.element_size() * oldest.nelement()
+
+    def _evict_disk(self) -> None:
+        entries = [
+            (os.path.getmtime(p), os.path.getsize(p), p)
+            for p in glob.glob(os.path.join(self.cache_dir, "*.npy"))
+        ]
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    @staticmethod
+    def _name(key: str, span: Span) -> str:
+        return f"{key}-{span[0]}-{span[1]}"
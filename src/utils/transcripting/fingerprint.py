@@ -0,0 +1,34 @@
+import json
+import hashlib
+import numpy as np
+from typing import Any, Dict
+
+
+
+def audio_fingerprint(audio: np.ndarray) -> str:
+    """SHA-256 of the decoded samples (after resampling/mono conversion)."""
+    samples = np.ascontiguousarray(audio, dtype=np.float32)
+    sha = hashlib.sha256()
+    sha.update(str(samples.shape).encode("utf-8"))
+    sha.update(memoryview(samples).cast("B"))
+    return sha.hexdigest()
+
+
+def params_fingerprint(params: Dict[str, Any]) -> str:
+    """Stable hash of a JSON-compatible parameter dict (key order ignored)."""
+    encoded = json.dumps(params, sort_keys=True, default=json_default, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def job_key(audio_fingerprint: str, params: Dict[str, Any]) -> str:
+    """Identifies one transcription job: same audio, same decode parameters."""
+    return f"{audio_fingerprint}-{params_fingerprint(params)}"
+
+
+def json_default(value: Any) -> Any:
+    """numpy scalars/arrays that end up in Whisper results and options"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
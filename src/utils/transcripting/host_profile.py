@@ -0,0 +1,106 @@
+import os
+import re
+import json
+import socket
+import platform
+from typing import Any, Dict, Optional
+
+
+from src.utils.models import CACHE_DIR, HOST_PROFILE, MODEL_SPEEDS, SETUP_TIMES
+from src.errors.debug import debug
+
+
+
+class HostProfile:
+    """
+    MODEL_SPEEDS / SETUP_TIMES measured on one machine.
+
+    Summary:
+        The built-in constants come from GPU benchmarks and are several
+        times off on CPU-only hosts. `python -m benchmarks.calibrate_host`
+        times model load and transcription of real speech for each model
+        size on the current host and saves the measured sizes as JSON
+        under CACHE_DIR/profiles, one file per host. `current()` prefers
+        that file (or the one named by TRANSCRIPTOR_HOST_PROFILE); sizes
+        it does not cover keep the built-in values. Profiles measured on
+        synthetic audio (older calibrations) are ignored: it decodes to
+        almost no text, so their speeds are far too high.
+    """
+
+    PROFILE_SUBDIR = "profiles"
+
+    _current: Optional["HostProfile"] = None
+
+    def __init__(
+        self,
+        model_speeds: Dict[str, float],
+        setup_times: Dict[str, float],
+        source: str = "built-in",
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        self.measured_speeds = dict(model_speeds)  # What the profile file holds
+        self.measured_setups = dict(setup_times)
+        self.model_speeds = {**MODEL_SPEEDS, **model_speeds}  # Lookups, built-in for the rest
+        self.setup_times = {**SETUP_TIMES, **setup_times}
+        self.source = source  # "built-in" or the profile path
+        self.details = details or {}  # Host, device, fixture, per-model measurements
+
+    @classmethod
+    def current(cls, reload: bool = False) -> "HostProfile":
+        """Profile of this host if one was calibrated, the built-in constants otherwise."""
+        if cls._current is None or reload:
+            cls._current = cls.load() or cls({}, {})
+            debug.dprint(f"Speed profile: {cls._current.source}")
+
+        return cls._current
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> Optional["HostProfile"]:
+        path = path or cls.default_path()
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            profile = cls(data["model_speeds"], data["setup_times"], path, data.get("details"))
+
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            if os.path.exists(path):
+                debug.dprint(f"Ignoring unreadable speed profile {path}: {e}")
+            return None
+
+        if profile.details.get("fixture") == "synthetic":
+            debug.dprint(f"Ignoring speed profile measured on synthetic audio: {path}")
+            return None
+
+        return profile
+
+    def save(self, path: Optional[str] = None) -> str:
+        """Write the profile (atomically) and return its path."""
+        path = path or self.default_path()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "model_speeds": self.measured_speeds,
+                    "setup_times": self.measured_setups,
+                    "details": self.details,
+                },
+                f,
+                indent=2,
+            )
+        os.replace(tmp_path, path)
+
+        self.source = path
+        return path
+
+    @classmethod
+    def default_path(cls) -> str:
+        return HOST_PROFILE or os.path.join(
+            CACHE_DIR, cls.PROFILE_SUBDIR, f"{cls.host_id()}.json"
+        )
+
+    @staticmethod
+    def host_id() -> str:
+        """File-name-safe machine identifier (host name and architecture)."""
+        return re.sub(r"[^A-Za-z0-9_.-]", "_", f"{socket.gethostname()}-{platform.machine()}")
@@ -1,6 +1,9 @@
 from typing import Optional, Union
 
 
+from .sanitize_prompt import PromptFit
+
+
 
 class InfoDump:
     """Handles all logging, progress reporting, and output formatting"""
@@ -82,3 +85,52 @@ class InfoDump:
         """Display warning when transcription is delayed"""
         print("\n\n\n⚠️ Transcription is taking longer than usual")
         print("⏳ Please be patient and DO NOT close the app\n\n")
+
+    def log_compile_fallback(self, mode: str, error: Exception):
+        """Display notice when encoder compilation fails and eager mode is kept"""
+        print(f"\n⚠️ Encoder compilation ({mode}) failed: {error}")
+        print("🐢 Falling back to the regular encoder\n")
+
+    def log_cascade(self, report: dict):
+        """Display how much audio the cascade re-decoded and the time it saved"""
+        print("\n🪜 [CASCADE REPORT]")
+        print(f"  📝 Draft / Refine: {report['draft_model']} → {report['refine_model']}")
+        print(f"  ⚠️ Weak Segments: {report['weak_segments']}/{report['segments']}")
+        print(
+            f"  🔁 Re-decoded: {report['refined_seconds']:.1f}s "
+            f"({100 * report['refined_fraction']:.1f}% of the audio)"
+        )
+
+        if report["time_saved"] is not None:
+            print(
+                f"  🚀 Time Saved: {report['time_saved']:.1f}s "
+                f"vs ~{report['estimated_full_time']:.1f}s for a full {report['refine_model']} run"
+            )
+
+    def log_model_choice(self, rationale: dict):
+        """Display the model picked for a time budget and why"""
+        print("\n⏱️ [MODEL SELECTION]")
+        print(
+            f"  🎯 Budget: {rationale['budget']:.0f}s at "
+            f"{100 * rationale['confidence']:.0f}% confidence "
+            f"for {rationale['audio_duration']:.0f}s of audio"
+        )
+
+        for candidate in rationale["candidates"]:
+            mark = "✅" if candidate["fits"] else "❌"
+            print(
+                f"  {mark} {candidate['model']}: ~{candidate['expected_time']:.0f}s "
+                f"(setup {candidate['setup_time']:.0f}s + "
+                f"transcription {candidate['transcribe_time']:.0f}s)"
+            )
+
+        if rationale["meets_budget"]:
+            print(f"  🎥 Using {rationale['chosen'].upper()}, the most accurate model in budget")
+        else:
+            print(f"  ⚠️ No model fits the budget, using the fastest: {rationale['chosen'].upper()}")
+
+    def log_prompt_fit(self, fit: PromptFit):
+        """Display the custom terms left out of the prompt's token budget"""
+        print("\n✂️ [PROMPT BUDGET]")
+        print(f"  📏 {len(fit.tokens)}/{fit.budget} tokens, {len(fit.kept)} terms kept")
+        print(f"  🗑️ Dropped ({len(fit.dropped)}): {', '.join(fit.dropped)}")
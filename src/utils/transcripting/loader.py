@@ -1,5 +1,6 @@
 import time
 import threading
+from dataclasses import dataclass
 from typing import Optional, Callable
 
 
@@ -8,61 +9,115 @@ from src.errors.exceptions import TranscriptionError
 
 
 
+@dataclass
+class DecodeProgress:
+    """Snapshot of decoder progress, measured in audio position."""
+
+    percent: float  # 0-100
+    position: float  # Seconds of audio decoded
+    total: float  # Seconds of audio in the job
+    elapsed: float  # Wall-clock seconds since the decode started
+    rate: float  # Audio seconds decoded per wall-clock second (x real-time)
+    eta: Optional[float]  # Seconds left at the current rate (None until known)
+
+
 class Loader:
     """Handles real-time progress tracking for audio transcription processes."""
     def __init__(self):
         self.active = False  # Control flag for background threads
         self.handler = None  # Optional progress callback function
+        self.update_handler = None  # Optional callback receiving DecodeProgress
         self.start_time = 0.0  # Process start timestamp
         self.current_progress = 0  # 0-100 scale
         self.info = InfoDump()  # For logging system messages
 
+        # Position-based progress (reported by the decoder)
+        self.duration = 0.0  # Audio seconds in the current job
+        self.last_update: Optional[DecodeProgress] = None
+        self.position_driven = False  # True once the decoder reported a position
+        self._lock = threading.Lock()
+
         # Timing configuration
         self.estimated_total = 1.0  # Default 1s estimate to prevent division by zero
         self._MIN_SLEEP = 0.05  # Minimum sleep interval (50ms)
         self._SAFETY_BUFFER = 1.0  # Extra time before watchdog triggers
 
     def setup(self, transcribe_estimate: float) -> None:
-        """Configure time estimates for accurate progress tracking.
+        """Configure time estimates for the fallback progress simulation.
 
         Args:
-            setup_time: Estimated initialization time in seconds
             transcribe_estimate: Expected transcription duration in seconds
         """
         self.estimated_total = max(0.1, transcribe_estimate)  # Prevent zero-division
 
     def start_transcription_progress(
-        self, handler: Optional[Callable[[int], None]] = None
+        self,
+        handler: Optional[Callable[[int], None]] = None,
+        duration: float = 0.0,
+        update_handler: Optional[Callable[[DecodeProgress], None]] = None,
     ) -> None:
-        """Begin tracking transcription progress with dynamic updates."""
+        """Begin tracking transcription progress with dynamic updates.
+
+        Args:
+            handler: Receives the integer percentage
+            duration: Audio length in seconds, turns reported percentages into positions
+            update_handler: Receives a DecodeProgress (position, rate, ETA) per update
+        """
         self.handler = handler
+        self.update_handler = update_handler
+        self.duration = max(0.0, duration)
         self.start_time = time.time()
         self.active = True
         self.current_progress = 0
+        self.last_update = None
+        self.position_driven = False
 
         # Start monitoring threads
         threading.Thread(target=self._track_progress, daemon=True).start()
         threading.Thread(target=self._watch_for_delays, daemon=True).start()
 
+    def report(self, percent: float) -> None:
+        """
+        Decoder callback: `percent` of the audio (by position) has been decoded.
+
+        The first call switches off the time-based simulation; from then on
+        the display follows the decoder, with throughput and ETA.
+        """
+        if not self.active:
+            return
+
+        self.position_driven = True
+        percent = min(100.0, max(0.0, percent))
+        elapsed = max(1e-6, time.time() - self.start_time)
+        position = self.duration * percent / 100
+        rate = position / elapsed
+        remaining = self.duration - position
+        eta = remaining / rate if rate > 0 else None
+
+        update = DecodeProgress(percent, position, self.duration, elapsed, rate, eta)
+        with self._lock:
+            self.last_update = update
+            if self.update_handler:
+                self.update_handler(update)
+            self._update_display(min(99, int(percent)) - self.current_progress)
+
     def _track_progress(self) -> None:
-        """Main progress tracking logic with dynamic update intervals."""
+        """Time-based fallback, used until (or unless) the decoder reports positions."""
         try:
-            while self.active and self.current_progress < 100:
+            while self.active and self.current_progress < 100 and not self.position_driven:
                 elapsed = time.time() - self.start_time
                 progress = min(99, (elapsed / self.estimated_total) * 100)
 
                 if progress > self.current_progress:
-                    self._update_display(progress - self.current_progress)
+                    with self._lock:
+                        if not self.position_driven:
+                            self._update_display(progress - self.current_progress)
 
                 # Calculate dynamic sleep time - faster updates near completion
                 remaining_pct = (100 - progress) / 100
                 sleep_time = max(self._MIN_SLEEP, 0.5 * remaining_pct)
                 time.sleep(sleep_time)
 
-            # Safety completion if we reach 100% naturally
-            if self.current_progress >= 99 and self.active:
-                self._update_display(100 - self.current_progress)
-        
         except Exception as e:
             raise TranscriptionError.progress_tracking(error=e) from e
 
@@ -72,7 +127,8 @@ class Loader:
         # Wait until near completion or timeout
         time.sleep(self.estimated_total + self._SAFETY_BUFFER)
 
-        if not self.active:
+        # Real positions already show the rate and ETA
+        if not self.active or self.position_driven:
             return
 
         if self.current_progress < 100:
@@ -81,21 +137,36 @@ class Loader:
             self.info.log_delay_warning()
 
             # Show elapsed time since delay began
-            while self.active:
+            while self.active and not self.position_driven:
                 elapsed = int(time.time() - delay_start)
                 print(f"Elapsed: {elapsed}ss || Still Transcripting\n", end="\r")
                 time.sleep(1)
 
     def _update_display(self, increment: float) -> None:
         """Update progress display with thread-safe increments."""
-        new_value = min(100, self.current_progress + max(1, int(increment)))
+        if increment < 1:
+            return
+
+        new_value = min(100, self.current_progress + int(increment))
         if new_value > self.current_progress:
             self.current_progress = new_value
-            print(f"Transcripting: {new_value}%\n", end="\r")
+            print(f"Transcripting: {new_value}%{self._throughput()}\n", end="\r")
 
             if self.handler:
                 self.handler(new_value)
 
+    def _throughput(self) -> str:
+        """Rate and ETA suffix, e.g. " | 2.4x real-time | ETA 01:05" (decoder-driven only)"""
+        update = self.last_update
+        if not self.position_driven or update is None or update.rate <= 0:
+            return ""
+
+        text = f" | {update.rate:.1f}x real-time"
+        if update.eta is not None:
+            minutes, seconds = divmod(int(update.eta), 60)
+            text += f" | ETA {minutes:02}:{seconds:02}"
+        return text
+
     def complete(self, result: dict, duration: float) -> dict:
         """Finalize progress tracking and return processing metrics.
 
@@ -110,13 +181,15 @@ class Loader:
         time.sleep(0.1)  # Allow final updates to complete
 
         processing_time = time.time() - self.start_time
-        self._update_display(100 - self.current_progress)
+        with self._lock:
+            self._update_display(100 - self.current_progress)
 
         result.setdefault("metadata", {}).update(
             {
                 "audio_duration": duration,
                 "processing_time": processing_time,
                 "speed_factor": duration / processing_time,
+                "progress_source": "decoder" if self.position_driven else "estimate",
             }
         )
 
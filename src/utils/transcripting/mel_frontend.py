@@ -0,0 +1,179 @@
+import os
+import glob
+import torch
+import numpy as np
+from typing import Dict, Optional
+from whisper.audio import HOP_LENGTH, N_FFT, N_SAMPLES, SAMPLE_RATE, mel_filters
+
+
+from .fingerprint import audio_fingerprint
+from src.utils.models import CACHE_DIR
+from src.errors.debug import debug
+
+
+
+class MelFrontend:
+    """
+    Whisper's log-mel spectrogram, computed chunk by chunk.
+
+    Summary:
+        whisper.audio.log_mel_spectrogram runs one STFT over the whole
+        array, so for long audio the complex spectrum and power tensors
+        (about 8x the size of the samples) are held at once. Here frames
+        are computed `CHUNK_SECONDS` at a time with the same framing and
+        reflection at the edges, into a single preallocated mel tensor;
+        the global normalisation is applied once at the end. The Hann
+        window and the filterbank are built once per device. With
+        `persist`, full spectrograms are stored as .npy under
+        CACHE_DIR/mel and a re-run of the same audio maps the file instead
+        of extracting again.
+    """
+
+    CACHE_SUBDIR = "mel"
+    CHUNK_SECONDS = 30.0  # Audio transformed per STFT call
+    DEFAULT_MAX_DISK = 2 * 1024 * 1024 * 1024  # 2 GiB
+
+    def __init__(
+        self,
+        n_mels: int = 80,
+        device: str = "cpu",
+        persist: bool = False,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK,
+    ):
+        self.n_mels = n_mels
+        self.device = torch.device(device)
+        self.persist = persist
+        self.cache_dir = os.path.join(cache_dir or CACHE_DIR, self.CACHE_SUBDIR)
+        self.max_disk_bytes = max_disk_bytes
+        self._hann_windows: Dict[torch.device, torch.Tensor] = {}  # Hann window per device
+        self._filters: Dict[torch.device, torch.Tensor] = {}  # Mel filterbank per device
+
+    # --------------------- Public API ---------------------
+    def spectrogram(self, audio: np.ndarray, padding: int = 0) -> torch.Tensor:
+        """
+        Same result as log_mel_spectrogram(audio, n_mels, padding=padding).
+
+        Args:
+            audio: Mono float32 samples at 16 kHz
+            padding: Zero samples appended (whisper.transcribe uses N_SAMPLES)
+
+        Returns:
+            (n_mels, frames) float32 tensor on the CPU
+        """
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        name = f"{audio_fingerprint(audio)}-{self.n_mels}-{padding}" if self.persist else None
+        if name is not None:
+            cached = self._load(name)
+            if cached is not None:
+                return cached
+
+        total = len(audio) + padding
+        frames = total // HOP_LENGTH  # torch.stft's last frame is dropped, as in whisper
+        mel = torch.empty(self.n_mels, frames, dtype=torch.float32)
+
+        chunk = int(self.CHUNK_SECONDS * SAMPLE_RATE) // HOP_LENGTH
+        for first in range(0, frames, chunk):
+            last = min(frames, first + chunk)
+            mel[:, first:last] = self._log_power(audio, total, first, last)
+
+        # Whisper's normalisation: 80 dB dynamic range below the global peak
+        torch.clamp_(mel, min=float(mel.max()) - 8.0)
+        mel.add_(4.0).div_(4.0)
+
+        if name is not None:
+            self._save(name, mel)
+
+        return mel
+
+    def window(self, clip: np.ndarray) -> torch.Tensor:
+        """Log-mel of one clip padded or trimmed to 30 s: (n_mels, 3000)."""
+        clip = np.asarray(clip, dtype=np.float32)[:N_SAMPLES]
+        return self._normalized(self._log_power(clip, N_SAMPLES, 0, N_SAMPLES // HOP_LENGTH))
+
+    # --------------------- Internals ---------------------
+    def _log_power(self, audio: np.ndarray, total: int, first: int, last: int) -> torch.Tensor:
+        """log10 mel power of frames [first, last) of `audio` zero-padded to `total`."""
+        half = N_FFT // 2
+        start, stop = first * HOP_LENGTH - half, (last - 1) * HOP_LENGTH + half
+        samples = self._samples(audio, total, start, stop)
+
+        signal = torch.from_numpy(samples).to(self.device)
+        stft = torch.stft(
+            signal, N_FFT, HOP_LENGTH, window=self._hann(), center=False, return_complex=True
+        )
+        power = stft.abs() ** 2
+        mel = self._filterbank() @ power
+        return torch.clamp(mel, min=1e-10).log10().cpu()
+
+    @staticmethod
+    def _samples(audio: np.ndarray, total: int, start: int, stop: int) -> np.ndarray:
+        """
+        Samples [start, stop) of `audio` zero-padded to `total`, reflected
+        past both ends like torch.stft(center=True, pad_mode="reflect").
+        """
+        index = np.arange(start, stop)
+        index = np.where(index < 0, -index, index)
+        index = np.where(index >= total, 2 * (total - 1) - index, index)
+
+        samples = np.zeros(stop - start, dtype=np.float32)
+        inside = index < len(audio)  # The rest is the zero padding
+        samples[inside] = audio[index[inside]]
+        return samples
+
+    @staticmethod
+    def _normalized(log_spec: torch.Tensor) -> torch.Tensor:
+        log_spec = torch.maximum(log_spec, log_spec.max() - 8.0)
+        return (log_spec + 4.0) / 4.0
+
+    def _hann(self) -> torch.Tensor:
+        if self.device not in self._hann_windows:
+            self._hann_windows[self.device] = torch.hann_window(N_FFT, device=self.device)
+        return self._hann_windows[self.device]
+
+    def _filterbank(self) -> torch.Tensor:
+        if self.device not in self._filters:
+            self._filters[self.device] = mel_filters(self.device, self.n_mels)
+        return self._filters[self.device]
+
+    def _load(self, name: str) -> Optional[torch.Tensor]:
+        path = os.path.join(self.cache_dir, f"{name}.npy")
+        try:
+            # Copy-on-write map: writable for torch, pages read as windows are sliced
+            mapped = np.load(path, mmap_mode="c")
+        except (OSError, ValueError):
+            return None
+
+        os.utime(path)  # Mark as recently used for eviction
+        debug.dprint(f"Mel spectrogram mapped from cache: {name[:16]}")
+        return torch.from_numpy(mapped)
+
+    def _save(self, name: str, mel: torch.Tensor) -> None:
+        path = os.path.join(self.cache_dir, f"{name}.npy")
+        tmp_path = f"{path}.tmp.npy"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            np.save(tmp_path, mel.numpy())
+            os.replace(tmp_path, path)
+
+        except OSError as e:
+            debug.dprint(f"Mel cache write failed: {e}")
+            return
+
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        entries = [
+            (os.path.getmtime(p), os.path.getsize(p), p)
+            for p in glob.glob(os.path.join(self.cache_dir, "*.npy"))
+        ]
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:  # Still mapped by a running job (Windows)
+                continue
+            total -= size
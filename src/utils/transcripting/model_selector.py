@@ -0,0 +1,85 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+
+from .estimator import TimeEstimator
+from .host_profile import HostProfile
+from src.utils.models import MODELS
+from src.errors.debug import debug
+
+
+
+class ModelSelector:
+    """
+    Picks the most accurate model expected to finish within a time budget.
+
+    Summary:
+        Every model in MODELS is checked from most to least accurate. Its
+        expected time is the TimeEstimator transcription time at the chosen
+        one-sided confidence level plus its setup time (zero for the model
+        that is already loaded). The first one that fits the budget wins;
+        if none does, the fastest model is used.
+    """
+
+    DEFAULT_CONFIDENCE = 0.9
+
+    def __init__(
+        self,
+        confidence: float = DEFAULT_CONFIDENCE,
+        model_speeds: Optional[Dict[str, float]] = None,
+        setup_times: Optional[Dict[str, float]] = None,
+    ):
+        profile = HostProfile.current()
+        self.confidence = confidence
+        self.model_speeds = model_speeds or profile.model_speeds
+        self.setup_times = setup_times or profile.setup_times
+
+    def select(
+        self,
+        audio_duration: float,
+        budget_seconds: float,
+        custom_word_count: int = 0,
+        loaded_model: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Choose a model for one job.
+
+        Args:
+            audio_duration: Audio duration in seconds
+            budget_seconds: Wall-clock time the job should finish in
+            custom_word_count: Number of custom vocabulary words
+            loaded_model: Model already in memory (no setup time)
+
+        Returns:
+            (model_size, rationale) where rationale lists the expected time
+            of every candidate and whether it met the budget
+        """
+        candidates: List[Dict[str, Any]] = []
+        for model_size in reversed(MODELS):  # Most accurate first
+            estimator = TimeEstimator(model_size, self.model_speeds, self.setup_times)
+            setup = 0.0 if model_size == loaded_model else estimator.get_setup_time()
+            transcribe = estimator.upper_bound(
+                audio_duration, self.confidence, custom_word_count
+            )
+            candidates.append(
+                {
+                    "model": model_size,
+                    "setup_time": setup,
+                    "transcribe_time": transcribe,
+                    "expected_time": setup + transcribe,
+                    "fits": setup + transcribe <= budget_seconds,
+                }
+            )
+
+        chosen = next((c for c in candidates if c["fits"]), candidates[-1])
+        rationale = {
+            "budget": budget_seconds,
+            "confidence": self.confidence,
+            "audio_duration": audio_duration,
+            "chosen": chosen["model"],
+            "speed_profile": HostProfile.current().source,
+            "meets_budget": chosen["fits"],
+            "candidates": candidates,
+        }
+
+        debug.dprint(f"ModelSelector: {rationale}")
+        return chosen["model"], rationale
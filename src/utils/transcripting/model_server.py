@@ -0,0 +1,345 @@
+import time
+import threading
+import torch
+import numpy as np
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+from whisper.decoding import DecodingOptions, DecodingResult
+
+
+from .audio_windows import SAMPLE_RATE
+from .backends import WhisperBackend
+from .repetition_guard import RepetitionGuard
+from .window_decoder import WindowDecoder
+from src.errors.exceptions import TranscriptionError
+from src.errors.debug import debug
+
+
+
+@dataclass
+class _WindowRequest:
+    """One 30-second window of one job, waiting for a shared forward pass."""
+
+    job: int
+    model: Tuple[str, str]  # ModelServer model key
+    clip: np.ndarray
+    options: DecodingOptions
+    guard: Optional[RepetitionGuard] = None  # The job's loop check, run on the shared pass
+    window: Tuple[float, float] = (0.0, 0.0)  # Seconds in the job's audio, for guard events
+    future: Future = field(default_factory=Future)
+
+
+class ModelServer:
+    """
+    One loaded Whisper model per size, shared by every job of the process.
+
+    Summary:
+        Jobs running at the same time (several Textify instances, threads)
+        get the same model instead of one copy each. Their windows are
+        queued here and a scheduler thread stacks windows of different jobs
+        into one encoder forward pass, then decodes them together, one
+        decoder pass per set of identical decode options (whisper decodes a
+        batch with a single prompt/temperature). Jobs take turns: a batch
+        holds one window per waiting job before a job gets a second slot,
+        so a long file cannot starve a short one. Per-job retries (fallback,
+        beam escalation) run on the job's thread under the same model lock.
+        While only one job is running its windows skip the queue and are
+        decoded on its own thread, so a single job pays no scheduling delay.
+    """
+
+    BATCH_SIZE = 8  # Windows per shared forward pass
+    MAX_WAIT_SECONDS = 0.02  # Time given to other jobs to fill a batch
+
+    _default: Optional["ModelServer"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, batch_size: int = BATCH_SIZE, max_wait: float = MAX_WAIT_SECONDS):
+        self.batch_size = max(1, batch_size)
+        self.max_wait = max_wait
+        self.lock = threading.RLock()  # Held for every forward pass on a shared model
+        self._backends: Dict[Tuple[str, str], WhisperBackend] = {}
+        self._decoders: Dict[Tuple[str, str], WindowDecoder] = {}
+        self._pending: Dict[int, Deque[_WindowRequest]] = {}  # Per job, in submission order
+        self._turns: Deque[int] = deque()  # Jobs with pending windows, next turn first
+        self._ready = threading.Condition()
+        self._next_job = 0
+        self._active: Set[int] = set()  # Jobs inside a transcribe call
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.stats = {"passes": 0, "windows": 0, "decode_passes": 0, "shared_passes": 0}
+
+    @classmethod
+    def default(cls) -> "ModelServer":
+        """Process-wide server, created on first use."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    # --------------------- Public API ---------------------
+    def backend(self, model_size: str, **options: Any) -> WhisperBackend:
+        """The loaded backend for `model_size` (loaded on the first request)."""
+        key = self._model_key(model_size, options)
+        with self.lock:
+            if key not in self._backends:
+                backend = WhisperBackend(**options)
+                backend.load(model_size)
+                self._backends[key] = backend
+                self._decoders[key] = WindowDecoder(backend.model, self.batch_size)
+                debug.dprint(f"ModelServer: loaded {model_size} ({len(self._backends)} models)")
+
+        return self._backends[key]
+
+    def decoder(self, model_size: str, **options: Any) -> "SharedWindowDecoder":
+        """A runner for one job: Textify uses it like a WindowDecoder."""
+        self.backend(model_size, **options)
+        return SharedWindowDecoder(self, self._model_key(model_size, options))
+
+    def new_job(self) -> int:
+        with self._ready:
+            self._next_job += 1
+            return self._next_job
+
+    def begin_job(self, job: int) -> None:
+        with self._ready:
+            self._active.add(job)
+
+    def end_job(self, job: int) -> None:
+        with self._ready:
+            self._active.discard(job)
+
+    def is_shared(self) -> bool:
+        """Whether more than one job is running, i.e. batching across jobs can pay off."""
+        with self._ready:
+            return len(self._active) > 1
+
+    def submit(
+        self,
+        job: int,
+        model: Tuple[str, str],
+        clip: np.ndarray,
+        options: DecodingOptions,
+        guard: Optional[RepetitionGuard] = None,
+        window: Tuple[float, float] = (0.0, 0.0),
+    ) -> Future:
+        """
+        Queue one window.
+
+        The future resolves to (encoder features, DecodingResult, encode
+        seconds, decode seconds), the times being this window's share of
+        the shared passes.
+
+        Args:
+            job: Id from `new_job`, used for fair scheduling
+            model: Key of a model loaded through `backend`
+            clip: Up to 30 s of 16 kHz samples
+            options: Decode options of the first pass
+            guard: The job's RepetitionGuard, if any
+            window: Start/end of the clip in seconds, for the guard's events
+        """
+        request = _WindowRequest(job, model, clip, options, guard, window)
+        with self._ready:
+            self._start()
+            if job not in self._pending:
+                self._pending[job] = deque()
+                self._turns.append(job)
+            self._pending[job].append(request)
+            self._ready.notify()
+
+        return request.future
+
+    def summary(self) -> Dict[str, Any]:
+        passes = self.stats["passes"]
+        return {
+            **self.stats,
+            "models": [size for size, _ in self._backends],
+            "mean_batch": self.stats["windows"] / passes if passes else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the scheduler; queued windows fail with TranscriptionError."""
+        with self._ready:
+            self._running = False
+            self._ready.notify_all()
+            abandoned = [r for queue in self._pending.values() for r in queue]
+            self._pending.clear()
+            self._turns.clear()
+
+        for request in abandoned:
+            request.future.set_exception(TranscriptionError.no_result())
+
+    # --------------------- Scheduler ---------------------
+    def _start(self) -> None:
+        """Start the scheduler thread (caller holds `_ready`)."""
+        if self._running:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="model-server", daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            try:
+                self._run(batch)
+            except Exception as e:
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+    def _next_batch(self) -> Optional[List[_WindowRequest]]:
+        """Wait for windows, then take up to `batch_size` of them round-robin across jobs."""
+        with self._ready:
+            while self._running and not self._turns:
+                self._ready.wait()
+            if not self._running:
+                return None
+
+            # Give concurrent jobs a moment to add their windows to this pass
+            deadline = time.time() + self.max_wait
+            while (
+                len(self._active) > 1
+                and self._queued() < self.batch_size
+                and time.time() < deadline
+            ):
+                self._ready.wait(deadline - time.time())
+
+            model = self._pending[self._turns[0]][0].model
+            batch: List[_WindowRequest] = []
+            while len(batch) < self.batch_size:
+                taken = len(batch)
+                for job in list(self._turns):
+                    queue = self._pending[job]
+                    if queue and queue[0].model == model and len(batch) < self.batch_size:
+                        batch.append(queue.popleft())
+                if len(batch) == taken:
+                    break
+
+            for job in [job for job in self._turns if not self._pending[job]]:
+                del self._pending[job]
+                self._turns.remove(job)
+            if self._turns:
+                self._turns.rotate(-1)  # The next pass starts with another job
+
+            return batch
+
+    def _queued(self) -> int:
+        return sum(len(queue) for queue in self._pending.values())
+
+    def _run(self, batch: List[_WindowRequest]) -> None:
+        """One encoder pass for the batch, one decoder pass per decode options and guard."""
+        decoder = self._decoders[batch[0].model]
+        groups: Dict[Tuple[str, int], List[int]] = {}
+        for index, request in enumerate(batch):
+            groups.setdefault((repr(request.options), id(request.guard)), []).append(index)
+
+        with self.lock:
+            start = time.time()
+            mel = torch.cat([decoder.mel_batch(r.clip, [(0, len(r.clip))]) for r in batch])
+            features = decoder.encode(mel)
+            encode_share = (time.time() - start) / len(batch)
+
+            for indexes in groups.values():
+                first = batch[indexes[0]]
+                if first.guard is not None:  # The job thread waits on these futures meanwhile
+                    first.guard.windows = [batch[index].window for index in indexes]
+                start = time.time()
+                results = decoder.decode(features[indexes], first.options, first.guard)
+                decode_share = (time.time() - start) / len(indexes)
+                for index, result in zip(indexes, results):
+                    batch[index].future.set_result(
+                        (features[index], result, encode_share, decode_share)
+                    )
+
+        self.stats["passes"] += 1
+        self.stats["windows"] += len(batch)
+        self.stats["decode_passes"] += len(groups)
+        self.stats["shared_passes"] += len({request.job for request in batch}) > 1
+
+    @staticmethod
+    def _model_key(model_size: str, options: Dict[str, Any]) -> Tuple[str, str]:
+        return model_size, repr(sorted(options.items()))
+
+
+class SharedWindowDecoder(WindowDecoder):
+    """
+    WindowDecoder for one job whose forward passes go through a ModelServer.
+
+    While other jobs are running, the first pass of every window is
+    batched with theirs by the server (decoded per job when a repetition
+    guard is set); alone, the job decodes like a plain WindowDecoder.
+    """
+
+    def __init__(self, server: ModelServer, model: Tuple[str, str]):
+        super().__init__(server._backends[model].model, server.batch_size)
+        self.server = server
+        self.model_key = model
+        self.job = server.new_job()
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        self.server.begin_job(self.job)
+        try:
+            result = super().transcribe(audio, progress_handler, **options)
+        finally:
+            self.server.end_job(self.job)
+
+        result["metadata"]["shared"] = self.server.summary()
+        return result
+
+    def detect_language(self, window: np.ndarray) -> str:
+        with self.server.lock:
+            return super().detect_language(window)
+
+    def encode_decode(
+        self,
+        audio: np.ndarray,
+        spans: List[Tuple[int, int]],
+        cache_key: Optional[str],
+        options: DecodingOptions,
+        guard: Optional[RepetitionGuard] = None,
+    ) -> Tuple[torch.Tensor, List[DecodingResult], float, float]:
+        """Queue the windows on the server and wait for the shared passes (direct when alone)."""
+        if not self.server.is_shared():
+            with self.server.lock:
+                return super().encode_decode(audio, spans, cache_key, options, guard)
+
+        futures = [
+            self.server.submit(
+                self.job,
+                self.model_key,
+                audio[begin:end],
+                options,
+                guard,
+                (begin / SAMPLE_RATE, end / SAMPLE_RATE),
+            )
+            for begin, end in spans
+        ]
+        done = [future.result() for future in futures]
+        features = torch.stack([window_features for window_features, *_ in done])
+        return (
+            features,
+            [result for _, result, _, _ in done],
+            sum(encode for _, _, encode, _ in done),
+            sum(decode for _, _, _, decode in done),
+        )
+
+    def decode(
+        self,
+        features: torch.Tensor,
+        options: DecodingOptions,
+        guard: Optional[RepetitionGuard] = None,
+    ) -> List[DecodingResult]:
+        """Retries of this job only, serialized with the server's passes."""
+        with self.server.lock:
+            return super().decode(features, options, guard)
@@ -0,0 +1,108 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+
+from src.utils.models import CACHE_DIR
+from src.errors.debug import debug
+
+
+
+class ModelVerifier:
+    """
+    Remembers which model checkpoints already passed their SHA-256 check.
+
+    Summary:
+        Hashing a large checkpoint reads the whole file (about 3 GB for
+        "large") before anything is deserialized. Entries are keyed by the
+        absolute path and invalidated as soon as the file size or mtime
+        changes, so a replaced or truncated file is always re-hashed.
+    """
+
+    CACHE_FILE = "verified_models.json"
+    CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB reads while hashing
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_path = os.path.join(cache_dir or CACHE_DIR, self.CACHE_FILE)
+        self._lock = threading.Lock()
+
+    def is_verified(self, path: str, expected_sha256: str) -> bool:
+        """True when `path` was hashed before and has not changed since."""
+        entry = self._read().get(os.path.abspath(path))
+        if not entry or not os.path.isfile(path):
+            return False
+
+        current = self._fingerprint(path)
+        return (
+            entry.get("sha256") == expected_sha256
+            and entry.get("size") == current["size"]
+            and entry.get("mtime_ns") == current["mtime_ns"]
+        )
+
+    def verify(self, path: str, expected_sha256: str) -> bool:
+        """Hash the full file; remember it on success, forget it on mismatch."""
+        start = time.time()
+        digest = self.sha256(path)
+        matches = digest == expected_sha256
+
+        debug.dprint(
+            f"Verified {os.path.basename(path)} in {time.time() - start:.1f}s: "
+            f"{'ok' if matches else 'checksum mismatch'}"
+        )
+
+        if matches:
+            self.record(path, digest)
+        else:
+            self.forget(path)
+
+        return matches
+
+    def record(self, path: str, sha256: str) -> None:
+        """Store a path as verified (e.g. right after a checked download)."""
+        entries = self._read()
+        entries[os.path.abspath(path)] = {
+            "sha256": sha256,
+            "verified_at": time.time(),
+            **self._fingerprint(path),
+        }
+        self._write(entries)
+
+    def forget(self, path: Optional[str] = None) -> None:
+        """Drop one entry, or every entry when `path` is None."""
+        entries = self._read()
+        if path is None:
+            entries.clear()
+        else:
+            entries.pop(os.path.abspath(path), None)
+        self._write(entries)
+
+    def sha256(self, path: str) -> str:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    @staticmethod
+    def _fingerprint(path: str) -> Dict[str, int]:
+        stat = os.stat(path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_path, self.cache_path)
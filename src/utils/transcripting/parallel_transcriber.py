@@ -0,0 +1,234 @@
+import os
+import signal
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+from .audio_windows import SAMPLE_RATE, silence_cuts
+from .backends import TranscriptionBackend, get_backend
+from .segments import merge_chunks, offset_segments
+from .thread_settings import ThreadScope, ThreadSettings
+from src.utils.models import DEFAULT_BACKEND
+from src.errors.exceptions import TranscriptionError
+from src.errors.debug import debug
+
+
+# Per-process state of pool workers (set once by _init_worker)
+_WORKER_BACKEND: Optional[TranscriptionBackend] = None
+_WORKER_THREADS: Optional[ThreadSettings] = None
+
+
+
+def _init_worker(
+    backend_name: str,
+    model_size: str,
+    backend_options: Dict[str, Any],
+    thread_settings: ThreadSettings,
+    started: Any,
+) -> None:
+    """Report the pid, then load one model per worker process."""
+    global _WORKER_BACKEND, _WORKER_THREADS
+    started.put(os.getpid())
+    _WORKER_THREADS = thread_settings
+    with ThreadScope(thread_settings):
+        _WORKER_BACKEND = get_backend(backend_name, **backend_options)
+        _WORKER_BACKEND.load(model_size)
+
+
+def _transcribe_chunk(
+    index: int, audio: np.ndarray, options: Dict[str, Any]
+) -> Tuple[int, Dict[str, Any], Dict[str, Any]]:
+    """Decode one chunk; the job-state trackers come back with what they recorded."""
+    with ThreadScope(_WORKER_THREADS):
+        result = _WORKER_BACKEND.transcribe(audio, **options)
+
+    states = {
+        name: options[name]
+        for name in ParallelTranscriber.JOB_STATE_OPTIONS
+        if options.get(name) is not None
+    }
+    return index, result, states
+
+
+class ParallelTranscriber:
+    """
+    Long-form transcription split across a pool of worker processes.
+
+    Summary:
+        The audio is cut at pauses into chunks of a few minutes, each chunk is
+        padded with a little overlap on both sides and decoded by a worker
+        holding its own model. Segments are re-offset to absolute time and
+        merged in order, each chunk keeping only what falls in the span it
+        owns, so words around a cut are not lost or repeated.
+    """
+
+    CHUNK_SECONDS = 180.0  # Target chunk length
+    SEARCH_SECONDS = 15.0  # How far a cut may move to reach a pause
+    OVERLAP_SECONDS = 2.0  # Extra audio decoded on each side of a cut
+    JOB_STATE_OPTIONS = ("fallback", "repetition", "beam")  # Forked per chunk, merged back after
+
+    def __init__(
+        self,
+        model_size: str,
+        workers: Optional[int] = None,
+        backend: str = DEFAULT_BACKEND,
+        backend_options: Optional[Dict[str, Any]] = None,
+        thread_settings: Optional[ThreadSettings] = None,
+    ):
+        self.model_size = model_size
+        self.workers = max(1, workers or (os.cpu_count() or 1))
+        self.backend = backend
+        self.backend_options = dict(backend_options or {})
+
+        self.job_threads = thread_settings  # As given by the job, before the split
+        # Split the job's threads (all cores by default) between workers
+        settings = thread_settings or ThreadSettings()
+        cpus = len(settings.cpu_affinity) if settings.cpu_affinity else os.cpu_count() or 1
+        self.thread_settings = replace(
+            settings,
+            num_threads=max(1, (settings.num_threads or cpus) // self.workers),
+            interop_threads=settings.interop_threads or 1,
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._context = multiprocessing.get_context("spawn")  # torch is not fork-safe
+        self._started = self._context.SimpleQueue()  # Worker pids, sent by _init_worker
+        self._pids: Set[int] = set()
+
+    def plan_chunks(self, audio: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """(owned_start, owned_end, decode_start, decode_end) sample spans."""
+        cuts = silence_cuts(audio, self.CHUNK_SECONDS, self.SEARCH_SECONDS, SAMPLE_RATE)
+        overlap = int(self.OVERLAP_SECONDS * SAMPLE_RATE)
+
+        return [
+            (start, end, max(0, start - overlap), min(len(audio), end + overlap))
+            for start, end in zip(cuts[:-1], cuts[1:])
+        ]
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        plan = self.plan_chunks(audio)
+        debug.dprint(
+            f"ParallelTranscriber: {len(plan)} chunks across {self.workers} workers"
+        )
+
+        executor = self._get_executor()
+        futures = [
+            executor.submit(_transcribe_chunk, index, audio[begin:end], chunk_options)
+            for index, ((_, _, begin, end), chunk_options) in enumerate(
+                zip(plan, self._chunk_options(plan, options))
+            )
+        ]
+
+        results: Dict[int, Dict[str, Any]] = {}
+        states: Dict[int, Dict[str, Any]] = {}
+        decoded = 0
+        try:
+            for future in as_completed(futures):
+                index, result, states[index] = future.result()
+                results[index] = result
+
+                decoded += plan[index][1] - plan[index][0]
+                if progress_handler:
+                    progress_handler(100.0 * decoded / max(1, len(audio)))
+
+        except Exception as e:  # Also a cancelled job: stop the chunks still decoding
+            self.shutdown(terminate=True)
+            raise TranscriptionError.from_whisper_error(e) from e
+
+        return self._merge(plan, results, states, options)
+
+    def _chunk_options(
+        self, plan: List[Tuple[int, int, int, int]], options: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Decode options per chunk, each with its own copy of the job-state trackers.
+
+        Workers receive pickled copies, so every chunk gets an empty fork
+        (the job's fallback retry budget is split between chunks) and
+        `_merge` adds what the forks recorded to the job's trackers.
+        """
+        tracker = options.get("fallback")
+        share, extra = divmod(tracker.budget_left, len(plan)) if tracker is not None else (0, 0)
+
+        chunk_options = []
+        for index, (_, _, begin, _) in enumerate(plan):
+            chunk = dict(options)
+            if tracker is not None:
+                chunk["fallback"] = tracker.fork(begin / SAMPLE_RATE, share + (index < extra))
+            for name in ("repetition", "beam"):
+                if options.get(name) is not None:
+                    chunk[name] = options[name].fork(begin / SAMPLE_RATE)
+            chunk_options.append(chunk)
+
+        return chunk_options
+
+    def _merge(
+        self,
+        plan: List[Tuple[int, int, int, int]],
+        results: Dict[int, Dict[str, Any]],
+        states: Dict[int, Dict[str, Any]],
+        options: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        for index in range(len(plan)):  # Chunk order, so per-window entries stay sorted
+            for name, state in states[index].items():
+                options[name].merge(state)
+
+        chunks = []
+        for index, (owned_start, owned_end, begin, _) in enumerate(plan):
+            segments = offset_segments(results[index].get("segments", []), begin / SAMPLE_RATE)
+            chunks.append(
+                (
+                    owned_start / SAMPLE_RATE if index else float("-inf"),
+                    owned_end / SAMPLE_RATE if index < len(plan) - 1 else float("inf"),
+                    segments,
+                )
+            )
+
+        languages = [r.get("language") for r in results.values() if r.get("language")]
+        language = max(set(languages), key=languages.count) if languages else None
+
+        result = TranscriptionBackend.build_result(merge_chunks(chunks), language)
+        result["metadata"] = {"parallel": {"chunks": len(plan), "workers": self.workers}}
+        return result
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Workers (and their models) are kept alive between jobs."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self._context,
+                initializer=_init_worker,
+                initargs=(
+                    self.backend,
+                    self.model_size,
+                    self.backend_options,
+                    self.thread_settings,
+                    self._started,
+                ),
+            )
+        return self._executor
+
+    def shutdown(self, terminate: bool = False) -> None:
+        """Stop the pool; `terminate` also kills workers in the middle of a chunk."""
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+        while not self._started.empty():
+            self._pids.add(self._started.get())
+        if terminate:
+            for pid in self._pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:  # Already exited
+                    pass
+        self._pids.clear()
@@ -0,0 +1,135 @@
+import zlib
+import numpy as np
+from torch import Tensor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from whisper.decoding import DecodingTask, LogitFilter
+
+
+from .segments import compression_ratio, normalize_text
+
+
+
+class RepetitionGuard:
+    """
+    Online detection of repetition / hallucination loops for one job.
+
+    Summary:
+        While a window is decoded, the sampled text tokens are checked after
+        every step: the same n-gram repeated back to back, or a recent token
+        run that compresses too well, means the decoder is looping. The
+        window is then closed (end-of-text is forced), so its decode time is
+        bounded and the transcription moves on to the next window. Once a
+        window is done, segments repeating the previous one are dropped.
+        Every intervention is recorded in `events`.
+    """
+
+    MIN_REPEATS = 4  # Back-to-back copies of an n-gram that count as a loop
+    MIN_LOOP_TOKENS = 16  # ...and the loop must span at least this many tokens
+    MAX_PERIOD = 24  # Longest n-gram checked
+    COMPRESSION_WINDOW = 64  # Recent tokens checked for compressibility
+    COMPRESSION_THRESHOLD = 2.4  # Same limit whisper applies to window text
+    MAX_SEGMENT_REPEATS = 1  # Identical consecutive segments kept after the first
+
+    def __init__(self):
+        self.offset = 0.0  # Seconds added to event times (span being decoded)
+        self.windows: List[Tuple[float, float]] = []  # Times of the rows being decoded
+        self.events: List[Dict[str, Any]] = []
+
+    # --------------------- Token Level ---------------------
+    def loop_reason(self, tokens: Sequence[int]) -> Optional[str]:
+        """Why `tokens` end in a loop ("ngram:<n>" or "compression"), or None."""
+        for period in range(1, min(self.MAX_PERIOD, len(tokens) // self.MIN_REPEATS) + 1):
+            repeats = max(self.MIN_REPEATS, -(-self.MIN_LOOP_TOKENS // period))
+            if period * repeats > len(tokens):
+                continue
+
+            tail = tokens[-period:]
+            run = tokens[-period * repeats :]
+            if all(run[i] == tail[i % period] for i in range(len(run))):
+                return f"ngram:{period}"
+
+        if len(tokens) >= self.COMPRESSION_WINDOW:
+            recent = np.asarray(tokens[-self.COMPRESSION_WINDOW :], dtype=np.uint16).tobytes()
+            if len(recent) / len(zlib.compress(recent)) > self.COMPRESSION_THRESHOLD:
+                return "compression"
+
+        return None
+
+    def attach(self, task: DecodingTask) -> DecodingTask:
+        """Add the loop check to a whisper DecodingTask before `run`."""
+        task.logit_filters.append(
+            _RepetitionFilter(self, task.sample_begin, task.tokenizer.eot, task.n_group)
+        )
+        return task
+
+    def record(self, reason: str, row: int, tokens: int) -> None:
+        """One aborted row; window times are left out when the runner does not know them."""
+        event: Dict[str, Any] = {"reason": reason}
+        if row < len(self.windows):
+            start, end = self.windows[row]
+            event.update(start=round(self.offset + start, 3), end=round(self.offset + end, 3))
+
+        event["tokens"] = tokens
+        self.events.append(event)
+
+    # --------------------- Segment Level ---------------------
+    def filter_segments(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop segments that repeat the previous one or are pure repetition."""
+        kept: List[Dict[str, Any]] = []
+        repeats = 0
+
+        for segment in segments:
+            text = normalize_text(segment.get("text", ""))
+            same = bool(kept) and text == normalize_text(kept[-1].get("text", ""))
+            repeats = repeats + 1 if same else 0
+
+            looping = len(text) > 20 and compression_ratio(text) > self.COMPRESSION_THRESHOLD
+            if repeats > self.MAX_SEGMENT_REPEATS or looping:
+                self.events.append(
+                    {
+                        "reason": "segment_repeat" if not looping else "segment_compression",
+                        "start": round(self.offset + segment.get("start", 0.0), 3),
+                        "end": round(self.offset + segment.get("end", 0.0), 3),
+                        "tokens": len(segment.get("tokens", [])),
+                    }
+                )
+                continue
+
+            kept.append(segment)
+
+        return kept
+
+    def fork(self, offset: float) -> "RepetitionGuard":
+        """Empty guard for a part of the job decoded elsewhere."""
+        forked = RepetitionGuard()
+        forked.offset = self.offset + offset
+        return forked
+
+    def merge(self, other: "RepetitionGuard") -> None:
+        self.events.extend(other.events)
+
+    def summary(self) -> Dict[str, Any]:
+        return {"aborted": len(self.events), "events": self.events}
+
+
+class _RepetitionFilter(LogitFilter):
+    """Forces <|endoftext|> on rows whose sampled text tokens are looping."""
+
+    def __init__(self, guard: RepetitionGuard, sample_begin: int, eot: int, n_group: int):
+        self.guard = guard
+        self.sample_begin = sample_begin
+        self.eot = eot
+        self.n_group = n_group  # Rows per audio window (beam size / best_of)
+
+    def apply(self, logits: Tensor, tokens: Tensor) -> None:
+        for row in range(tokens.shape[0]):
+            sampled = tokens[row, self.sample_begin :].tolist()
+            if sampled and sampled[-1] == self.eot:
+                continue  # Row already finished
+
+            text_tokens = [t for t in sampled if t < self.eot]  # Timestamps ignored
+            reason = self.guard.loop_reason(text_tokens)
+            if reason:
+                logits[row, :] = -np.inf
+                logits[row, self.eot] = 0
+                self.guard.record(reason, row // self.n_group, len(text_tokens))
@@ -1,4 +1,5 @@
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 from src.utils.text.content_type import ContentType
@@ -6,6 +7,17 @@ from src.errors.debug import debug
 
 
 
+@dataclass
+class PromptFit:
+    """Encoded prompt for one vocabulary and the terms left out of it."""
+
+    text: str = ""
+    tokens: List[int] = field(default_factory=list)
+    kept: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+    budget: int = 0
+
+
 class SanitizePrompt:
     """
     Converts a ContentType configuration into a prompt string for AI models.
@@ -13,11 +25,22 @@ class SanitizePrompt:
     Summary:
         SanitizePrompt acts as a bridge between the custom vocabulary/settings
         and the AI model. It ensures that the transcription respects the content
-        configuration without altering audio or output text.
+        configuration without altering audio or output text. Whisper only
+        keeps the last 223 prompt tokens and every prompt token is paid for
+        at each decode step, so the terms are deduplicated, ranked and fitted
+        into `token_budget` tokens of the model's tokenizer.
     """
 
     PREFIX = "[INFO]"
     PROMPT_DOMAIN_PREFIX = "Domains:"
+    TERM_SEPARATOR = ", "
+    DEFAULT_TOKEN_BUDGET = 150  # Of Whisper's 223; the rest is left for the previous text
+
+    def __init__(self, token_budget: int = DEFAULT_TOKEN_BUDGET, multilingual: bool = True):
+        self.token_budget = token_budget
+        self.multilingual = multilingual  # False for English-only (".en") models
+        self.last_fit = PromptFit(budget=token_budget)
+        self._fits: Dict[Tuple[int, bool, Tuple[str, ...]], PromptFit] = {}  # Encoded prompt per vocabulary
 
     def generate_content_prompt(self, content_config: ContentType) -> str:
         """
@@ -25,6 +48,7 @@ class SanitizePrompt:
 
         Notes:
             - Debug info is logged via debug.dprint.
+            - Terms that do not fit the token budget are listed in `last_fit.dropped`.
 
         Returns:
             A string containing the prompt fragment or an empty string if no keywords exist.
@@ -32,10 +56,85 @@ class SanitizePrompt:
         # Compute display string once to avoid repeated work
         display_words = self._debug_content_features(content_config)
 
-        if display_words:
-            return f"{self.PROMPT_DOMAIN_PREFIX} {display_words}"
-        
-        return ""
+        if not display_words:
+            self.last_fit = PromptFit(budget=self.token_budget)
+            return ""
+
+        self.last_fit = self.fit_terms(content_config.words.keys())
+        return self.last_fit.text
+
+    def fit_terms(self, terms: Iterable[str]) -> PromptFit:
+        """
+        Build the domain prompt from the best-ranked terms within the token budget.
+
+        Args:
+            terms: Custom vocabulary, most important first
+
+        Returns:
+            PromptFit with the prompt text, its tokens and the kept/dropped terms
+        """
+        unique = self._dedupe(terms)
+        key = (self.token_budget, self.multilingual, tuple(unique))
+        if key in self._fits:
+            return self._fits[key]
+
+        from whisper.tokenizer import get_tokenizer  # Keeps whisper out of the GUI process
+
+        tokenizer = get_tokenizer(self.multilingual)
+        prefix = len(tokenizer.encode(self.PROMPT_DOMAIN_PREFIX))
+        separator = len(tokenizer.encode(self.TERM_SEPARATOR.rstrip()))
+        costs = {term: len(tokenizer.encode(" " + term)) for term in unique}
+
+        # Terms the tokenizer splits the most are the ones Whisper is least
+        # likely to spell right unprompted; ties keep the caller's order
+        ranked = sorted(unique, key=lambda t: -costs[t] / max(1, len(t.split())))
+
+        kept: List[str] = []
+        used = prefix
+        for term in ranked:
+            cost = costs[term] + (separator if kept else 0)
+            if used + cost <= self.token_budget:
+                kept.append(term)
+                used += cost
+
+        kept.sort(key=unique.index)  # Back to the caller's order
+        text = f"{self.PROMPT_DOMAIN_PREFIX} {self.TERM_SEPARATOR.join(kept)}" if kept else ""
+        tokens = tokenizer.encode(text) if text else []
+
+        # BPE can merge across separators; trim if the estimate was short
+        while len(tokens) > self.token_budget and kept:
+            kept.pop()
+            text = f"{self.PROMPT_DOMAIN_PREFIX} {self.TERM_SEPARATOR.join(kept)}" if kept else ""
+            tokens = tokenizer.encode(text) if text else []
+
+        fit = PromptFit(
+            text=text,
+            tokens=tokens,
+            kept=kept,
+            dropped=[term for term in unique if term not in kept],
+            budget=self.token_budget,
+        )
+        if fit.dropped:
+            debug.dprint(
+                f"{self.PREFIX} Prompt budget {self.token_budget} tokens: "
+                f"kept {len(kept)}, dropped {len(fit.dropped)} terms: {fit.dropped}"
+            )
+
+        self._fits[key] = fit
+        return fit
+
+    @staticmethod
+    def _dedupe(terms: Iterable[str]) -> List[str]:
+        """Strip, collapse whitespace and drop case-insensitive duplicates."""
+        seen = set()
+        unique: List[str] = []
+        for term in terms:
+            cleaned = " ".join(str(term).split())
+            if cleaned and cleaned.casefold() not in seen:
+                seen.add(cleaned.casefold())
+                unique.append(cleaned)
+
+        return unique
 
     def _debug_content_features(self, content_config: ContentType) -> Optional[str]:
         """
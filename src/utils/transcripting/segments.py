@@ -0,0 +1,145 @@
+import re
+import zlib
+from typing import Any, Dict, List, Sequence, Tuple
+
+
+Segment = Dict[str, Any]
+FRAMES_PER_SECOND = 100  # Mel frames per second, used by the "seek" field
+TIME_PRECISION = 0.02  # Seconds per Whisper timestamp token
+
+
+
+def offset_segments(segments: Sequence[Segment], offset: float) -> List[Segment]:
+    """Copies of `segments` shifted by `offset` seconds (start, end, seek)."""
+    shifted = []
+    for segment in segments:
+        moved = dict(segment)
+        moved["start"] = round(segment.get("start", 0.0) + offset, 3)
+        moved["end"] = round(segment.get("end", 0.0) + offset, 3)
+        moved["seek"] = segment.get("seek", 0) + int(offset * FRAMES_PER_SECOND)
+        shifted.append(moved)
+
+    return shifted
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase words only, for duplicate checks across chunk boundaries."""
+    return " ".join(re.findall(r"\w+", text.lower()))
+
+
+def merge_chunks(chunks: Sequence[Tuple[float, float, Sequence[Segment]]]) -> List[Segment]:
+    """
+    Merge per-chunk segments (already in absolute time) into one ordered list.
+
+    Args:
+        chunks: (owned_start, owned_end, segments) per chunk, in order. Chunks
+            are decoded with some overlap; each one only keeps the segments
+            whose midpoint falls inside the span it owns.
+
+    Notes:
+        A segment repeated on both sides of a boundary (same words, touching
+        or overlapping times) is kept once.
+    """
+    merged: List[Segment] = []
+    for owned_start, owned_end, segments in chunks:
+        for segment in segments:
+            middle = (segment["start"] + segment["end"]) / 2
+            if not owned_start <= middle < owned_end:
+                continue
+
+            if merged and _is_duplicate(merged[-1], segment):
+                merged[-1]["end"] = max(merged[-1]["end"], segment["end"])
+                continue
+
+            merged.append(segment)
+
+    return merged
+
+
+def _is_duplicate(previous: Segment, current: Segment) -> bool:
+    same_text = normalize_text(previous.get("text", "")) == normalize_text(
+        current.get("text", "")
+    )
+    return same_text and current["start"] <= previous["end"] + 1.0
+
+
+def compression_ratio(text: str) -> float:
+    """zlib compression ratio Whisper uses to spot repetitive output"""
+    encoded = text.encode("utf-8")
+    return len(encoded) / max(1, len(zlib.compress(encoded)))
+
+
+def split_timestamped_tokens(
+    tokens: Sequence[int],
+    tokenizer: Any,
+    offset: float,
+    window_seconds: float,
+    keep_tail: bool = False,
+) -> Tuple[List[Segment], float]:
+    """
+    Cut one window's sampled tokens into timed segments, like whisper.transcribe.
+
+    Args:
+        tokens: Sampled tokens (no SOT sequence, no EOT), timestamps included
+        tokenizer: whisper.tokenizer.Tokenizer used for decoding
+        offset: Window start in seconds (absolute)
+        window_seconds: Real audio length of the window
+        keep_tail: Text after the last timestamp pair becomes a segment ending
+            at the window end (decoders that never re-decode the rest)
+
+    Returns:
+        (segments, covered_seconds) where covered_seconds is how much of the
+        window the segments fully account for; a sequential decoder resumes
+        from there.
+    """
+    begin = tokenizer.timestamp_begin
+    is_ts = [t >= begin for t in tokens]
+    single_ending = len(tokens) >= 2 and is_ts[-1] and not is_ts[-2]
+    consecutive = [i for i in range(1, len(tokens)) if is_ts[i] and is_ts[i - 1]]
+
+    pieces: List[Tuple[Sequence[int], float, float]] = []
+    covered = window_seconds
+
+    if consecutive:
+        last = 0
+        for current in consecutive + ([len(tokens)] if single_ending else []):
+            sliced = tokens[last:current]
+            pieces.append(
+                (
+                    sliced,
+                    (sliced[0] - begin) * TIME_PRECISION,
+                    (sliced[-1] - begin) * TIME_PRECISION,
+                )
+            )
+            last = current
+
+        if not single_ending and keep_tail:
+            pieces.append((tokens[last:], (tokens[last] - begin) * TIME_PRECISION, window_seconds))
+        elif not single_ending:  # Trailing text is cut off, resume from last timestamp
+            covered = (tokens[last - 1] - begin) * TIME_PRECISION
+
+    else:
+        duration = window_seconds
+        stamps = [t for t in tokens if t >= begin]
+        if stamps and stamps[-1] != begin:
+            duration = (stamps[-1] - begin) * TIME_PRECISION
+        pieces.append((tokens, 0.0, duration))
+
+    segments = []
+    for sliced, start, end in pieces:
+        text = tokenizer.decode([t for t in sliced if t < tokenizer.eot])
+        if not text.strip():
+            continue
+
+        segments.append(
+            {
+                "seek": int(offset * FRAMES_PER_SECOND),
+                "start": round(offset + start, 3),
+                "end": round(offset + min(end, window_seconds), 3),
+                "text": text,
+                "tokens": list(sliced),
+                "compression_ratio": compression_ratio(text),
+            }
+        )
+
+    return segments, covered if covered > 0 else window_seconds
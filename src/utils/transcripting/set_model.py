@@ -1,19 +1,88 @@
+import os
+import sys
 import whisper
+from typing import Optional
 
 
-from src.utils.models import MODELS
+from .encoder_compiler import EncoderCompiler
+from .model_verifier import ModelVerifier
+from src.utils.models import MODELS, MODEL_DIR
 from src.errors.handlers import TranscriptionError
 
 
 
 class SetModel:
     """Manages Whisper model loading"""
-    def load(self, model_size: str):
+    def __init__(self, model_dir: Optional[str] = None):
+        self.encoder_mode = "eager"  # Mode actually applied on the last load
+        self.model_dir = model_dir or MODEL_DIR or self._whisper_cache_dir()
+        self.verifier = ModelVerifier()
+
+    def load(self, model_size: str, encoder_mode: str = "eager"):
         if model_size not in MODELS:
             raise TranscriptionError.invalid_model()
-            
+
         try:
-            return whisper.load_model(model_size)
-        
+            model = self._load_checkpoint(model_size)
+
         except Exception as e:
-            raise TranscriptionError.load_failed() from e
\ No newline at end of file
+            raise TranscriptionError.load_failed() from e
+
+        # Falls back to eager on its own, never fails the load
+        self.encoder_mode = EncoderCompiler().apply(
+            model, model_size, encoder_mode, self._expected_sha256(model_size)
+        )
+        return model
+
+    def checkpoint_path(self, model_size: str) -> str:
+        """Where whisper keeps (or downloads) the checkpoint for `model_size`."""
+        return os.path.join(self.model_dir, os.path.basename(whisper._MODELS[model_size]))
+
+    def reverify(self, model_size: str) -> bool:
+        """Force a full SHA-256 check of a local checkpoint, refreshing the cache."""
+        path = self.checkpoint_path(model_size)
+        if not os.path.isfile(path):
+            self.verifier.forget(path)
+            return False
+
+        return self.verifier.verify(path, self._expected_sha256(model_size))
+
+    def _load_checkpoint(self, model_size: str):
+        """
+        Load a checkpoint, hashing it only when it is new or has changed.
+
+        Verified files are loaded by path, which skips whisper's own checksum
+        pass and never touches the network. Anything else goes through
+        whisper.load_model, which downloads and verifies as usual.
+        """
+        path = self.checkpoint_path(model_size)
+        expected = self._expected_sha256(model_size)
+
+        if os.path.isfile(path) and (
+            self.verifier.is_verified(path, expected) or self.verifier.verify(path, expected)
+        ):
+            model = whisper.load_model(path)
+            model.set_alignment_heads(whisper._ALIGNMENT_HEADS[model_size])
+            return model
+
+        model = whisper.load_model(model_size, download_root=self.model_dir)
+        if os.path.isfile(path):  # whisper raised if the download was corrupt
+            self.verifier.record(path, expected)
+        return model
+
+    @staticmethod
+    def _expected_sha256(model_size: str) -> str:
+        return whisper._MODELS[model_size].split("/")[-2]
+
+    @staticmethod
+    def _whisper_cache_dir() -> str:
+        default = os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(os.getenv("XDG_CACHE_HOME", default), "whisper")
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.utils.transcripting.set_model [model sizes...]
+    loader = SetModel()
+    for size in sys.argv[1:] or MODELS:
+        status = "verified" if loader.reverify(size) else "missing or corrupt"
+        print(f"{size}: {status} ({loader.checkpoint_path(size)})")
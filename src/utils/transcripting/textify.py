@@ -1,41 +1,525 @@
 import time
-import inspect
-from typing import Dict, Optional, Callable, Any
+from contextlib import nullcontext
+from dataclasses import asdict
+from typing import Dict, Iterator, List, Optional, Callable, Any, Tuple
 
 from .loader import Loader
-from .set_model import SetModel
+from .backends import OnnxBackend, TranscriptionBackend, WhisperBackend, get_backend
+from .audio_windows import SAMPLE_RATE, first_speech_offset, split_on_silence
+from .segments import offset_segments
+from .fingerprint import audio_fingerprint, job_key
+from .transcript_cache import TranscriptCache
+from .transcript_checkpoint import TranscriptCheckpoint
+from .feature_cache import FeatureCache
+from .parallel_transcriber import ParallelTranscriber
+from .window_decoder import WindowDecoder
+from .model_server import ModelServer
+from .cascade import CascadeTranscriber
+from .fallback import FallbackTracker
+from .repetition_guard import RepetitionGuard
+from .adaptive_beam import AdaptiveBeam
 from .info_dump import InfoDump
 from .estimator import TimeEstimator
 from .convert_audio import ConvertAudio
+from .thread_settings import ThreadScope, ThreadSettings
 from src.utils.text.content_type import ContentType
+from src.utils.models import DEFAULT_BACKEND, MODELS
+from src.errors.exceptions import TranscriptionError
 from src.errors.debug import debug
 
 
 
 class Textify:
     """Main transcription controller coordinating all components"""
-    def __init__(self, model_size: str):
+    # Whisper decode options forwarded to the backend
+    SUPPORTED_ARGS = [
+        "task",
+        "language",
+        "best_of",
+        "beam_size",
+        "patience",
+        "length_penalty",
+        "suppress_tokens",
+        "condition_on_previous_text",
+    ]
+
+    STREAM_WINDOW_SECONDS = 30.0  # One decoder window per streamed step
+    DETECT_WINDOW_SECONDS = 30.0  # Speech looked at by the language detection pass
+    CHECKPOINT_MIN_SECONDS = 600.0  # Shorter audio is decoded in one go, no checkpoints
+    CHECKPOINT_SPAN_SECONDS = 300.0  # Audio decoded between two checkpoint opportunities
+    CHECKPOINT_INTERVAL_SECONDS = 30.0  # Minimum wall-clock time between checkpoint writes
+    # Runner metadata counters added up across spans (the rest is kept from the last span)
+    SUMMED_METADATA = ("windows", "cached_windows", "encode_time", "decode_time", "chunks")
+    PROMPT_TAIL_CHARS = 200  # Previous text carried into the next window's prompt
+    JOB_STATE_OPTIONS = ("fallback", "repetition", "beam")  # Per-job trackers, not decode options
+
+    def __init__(
+        self,
+        model_size: str,
+        encoder_mode: str = "eager",
+        backend: str = DEFAULT_BACKEND,
+        backend_options: Optional[Dict[str, Any]] = None,
+        thread_settings: Optional[ThreadSettings] = None,
+        cache: bool = True,
+        refine_model: Optional[str] = None,
+        feature_cache: bool = False,
+        mel_cache: bool = False,
+        model_server: Optional[ModelServer] = None,
+    ):
+        if refine_model is not None and refine_model not in MODELS:
+            raise TranscriptionError.invalid_model()
+
         self.model_size = model_size
+        self.refine_model = refine_model  # Cascade: re-decode weak segments with it
+        self._refiner: Optional[TranscriptionBackend] = None  # Loaded on first use
+        self.thread_settings = thread_settings  # Default for every job
+        self.cache = TranscriptCache() if cache else None
+        self.checkpoints = TranscriptCheckpoint()
+        self.feature_cache = FeatureCache() if feature_cache else None  # Encoder reuse
+        self.checkpoints.prune()  # Drop checkpoints of jobs that were never resumed
         self.progress = Loader()
         self.audio_processor = ConvertAudio()
+        self._last_audio: Optional[Any] = None  # Converted array of the last job, for align_words
         self.logger = InfoDump(model_size)
-        self.model = SetModel().load(model_size)
+        self.backend_name = backend
+        self.backend_options = self._backend_options(
+            backend, encoder_mode, backend_options, mel_cache
+        )
+        # Shared server: one model copy per size for every job of the process
+        self.model_server = model_server if backend == WhisperBackend.name else None
+        self._model_lock = self.model_server.lock if self.model_server else nullcontext()
+        if self.model_server is not None:
+            self.backend = self.model_server.backend(model_size, **self.backend_options)
+        else:
+            self.backend = get_backend(backend, **self.backend_options)
+            self.backend.load(model_size)
+        self._parallel: Optional[ParallelTranscriber] = None  # Created on first use
+        self.model = self.backend.model
+        self.encoder_mode = getattr(self.backend, "encoder_mode", "eager")
         self.estimator = TimeEstimator(model_size)
 
-        # Detect Whisper version parameters
-        self._detect_whisper_params()
-
         debug.dprint(
             f"Initialized Textify with model={self.model_size}, "
-            f"use_on_progress={self.use_on_progress}, "
-            f"use_progress_callback={self.use_progress_callback}"
+            f"backend={self.backend.name}, encoder_mode={self.encoder_mode}, "
+            f"supports_progress={self.backend.supports_progress}"
+        )
+
+    def _backend_options(
+        self,
+        name: str,
+        encoder_mode: str,
+        options: Optional[Dict[str, Any]],
+        mel_cache: bool = False,
+    ) -> Dict[str, Any]:
+        """Backend constructor options; encoder compilation only applies to Whisper"""
+        options = dict(options or {})
+        if name == WhisperBackend.name:
+            options.setdefault("encoder_mode", encoder_mode)
+
+        if name in (WhisperBackend.name, OnnxBackend.name):  # Backends computing a spectrogram
+            options.setdefault("persist_mel", mel_cache)
+
+        return options
+
+    def _select_runner(
+        self,
+        duration: float,
+        workers: Optional[int],
+        batch_size: Optional[int] = None,
+        thread_settings: Optional[ThreadSettings] = None,
+    ) -> Any:
+        """Pick the worker pool, the batched window decoder or the plain backend"""
+        if self.model_server is not None and (not workers or workers < 2):
+            return self.model_server.decoder(self.model_size, **self.backend_options)
+
+        batched = bool(batch_size and batch_size > 1)
+        if (not workers or workers < 2) and (batched or self.feature_cache):
+            if isinstance(self.backend, WhisperBackend):
+                return WindowDecoder(
+                    self.model,
+                    batch_size or 1,
+                    feature_cache=self.feature_cache,
+                    model_key=f"{self.model_size}-{self.backend.precision}",
+                )
+
+            debug.dprint(f"Window decoding needs the whisper backend, got {self.backend.name}")
+
+        if not workers or workers < 2:
+            return self.backend
+
+        if duration < 2 * ParallelTranscriber.CHUNK_SECONDS:
+            debug.dprint("Audio too short for parallel mode, using a single backend")
+            return self.backend
+
+        if (
+            self._parallel is None
+            or self._parallel.workers != workers
+            or self._parallel.job_threads != thread_settings
+        ):
+            self.shutdown()
+            self._parallel = ParallelTranscriber(
+                self.model_size,
+                workers=workers,
+                backend=self.backend_name,
+                backend_options=self.backend_options,
+                thread_settings=thread_settings,
+            )
+
+        return self._parallel
+
+    def _windowed(self, kwargs: Dict[str, Any]) -> bool:
+        """Whether `_select_runner` decodes this job as independent windows"""
+        workers = kwargs.get("parallel_workers")
+        batch_size = kwargs.get("batch_size")
+        if workers and workers >= 2:
+            return False
+
+        batched = bool(batch_size and batch_size > 1)
+        return self.model_server is not None or (
+            isinstance(self.backend, WhisperBackend) and (batched or self.feature_cache is not None)
+        )
+
+    def shutdown(self) -> None:
+        """Stop parallel workers, if any were started"""
+        if self._parallel is not None:
+            self._parallel.shutdown()
+            self._parallel = None
+
+    def _build_options(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Create version-safe transcription parameters"""
+        whisper_args: Dict[str, Any] = {
+            "temperature": kwargs.get("temperature", 0.2),
+        }
+
+        # Handle initial prompt
+        if "initial_prompt" in kwargs:
+            whisper_args["initial_prompt"] = kwargs.pop("initial_prompt")
+
+        # Explicit temperature ladder / retry budget replaces the single temperature
+        if kwargs.get("fallback_policy") is not None:
+            whisper_args.pop("temperature")
+            whisper_args["fallback"] = FallbackTracker(kwargs["fallback_policy"])
+
+        # Stop looping windows early and drop repeated segments
+        if kwargs.get("repetition_guard"):
+            whisper_args["repetition"] = RepetitionGuard()
+
+        # Greedy first; beam_size/patience only for windows that fail the checks
+        if kwargs.get("adaptive_beam") and kwargs.get("beam_size"):
+            beam = AdaptiveBeam(kwargs["beam_size"], kwargs.get("patience"))
+            if kwargs.get("fallback_policy") is not None:
+                beam.use_options(asdict(kwargs["fallback_policy"]))
+            beam.use_options(kwargs)  # Caller thresholds win
+            whisper_args["beam"] = beam
+
+        # Filter out unsupported arguments
+        filtered_kwargs = {k: v for k, v in kwargs.items() if k in self.SUPPORTED_ARGS}
+
+        debug.dprint(f"Calling transcribe with args={whisper_args}, extra_kwargs={filtered_kwargs}")
+        return {**whisper_args, **filtered_kwargs}
+
+    def detect_language(self, audio_array: Any) -> Optional[str]:
+        """
+        One language detection pass on the first 30 seconds of speech.
+
+        Returns:
+            Whisper language code, or None if the backend cannot detect it
+            (the backend then detects on its own)
+        """
+        start = first_speech_offset(audio_array)
+        window = audio_array[start : start + int(self.DETECT_WINDOW_SECONDS * SAMPLE_RATE)]
+        with self._model_lock:
+            language = self.backend.detect_language(window)
+
+        debug.dprint(f"Language detected: {language} (speech starts at {start / SAMPLE_RATE:.1f}s)")
+        return language
+
+    def _pin_language(self, audio_array: Any, options: Dict[str, Any]) -> None:
+        """Detect once and pass `language=` on every call (a caller hint wins)"""
+        if not options.get("language"):
+            language = self.detect_language(audio_array)
+            if language:
+                options["language"] = language
+
+    def _job_params(self, options: Dict[str, Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Everything that changes the output, for cache and checkpoint keys"""
+        # language, temperature, initial_prompt, decode kwargs
+        decode_options = {k: v for k, v in options.items() if k not in self.JOB_STATE_OPTIONS}
+        if self._windowed(kwargs):
+            for name in WindowDecoder.IGNORED_OPTIONS:
+                decode_options.pop(name, None)
+
+        return {
+            "model_size": self.model_size,
+            "backend": self.backend_name,
+            "precision": self.backend.precision,
+            "options": decode_options,
+            "fallback_policy": kwargs.get("fallback_policy"),
+            "repetition_guard": bool(kwargs.get("repetition_guard")),
+            "adaptive_beam": bool(kwargs.get("adaptive_beam")),
+            "batch_size": kwargs.get("batch_size") or 1,
+            "windowed": self.feature_cache is not None,
+            "shared_model": self.model_server is not None,
+            "parallel_workers": kwargs.get("parallel_workers") or 1,
+            "streamed": bool(kwargs.get("segment_handler")),
+            "checkpointed": bool(kwargs.get("checkpoint")),  # Span-by-span decoding
+            "refine_model": self.refine_model if kwargs.get("cascade", True) else None,
+        }
+
+    def transcribe_stream(
+        self,
+        audio_input: Optional[Any] = None,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        **kwargs: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield segments (text, start, end, avg_logprob, ...) as each window is decoded.
+
+        The audio is split at pauses into windows of up to 30 seconds. Each
+        window is decoded on its own with the tail of the previous text as
+        prompt, so the first segments arrive after one window instead of
+        after the whole file. Times are absolute.
+        """
+        audio = self.audio_processor.validate_input(audio_input)
+        audio_array, _ = self.audio_processor.convert(audio)
+        options = self._build_options(kwargs)
+
+        thread_settings = kwargs.get("thread_settings") or self.thread_settings
+        with ThreadScope(thread_settings):
+            self._pin_language(audio_array, options)
+            spans = split_on_silence(audio_array, self.STREAM_WINDOW_SECONDS)
+            for _, segments, _, _ in self._decode_spans(
+                audio_array, options, spans, self._stream_runner(), progress_handler
+            ):
+                yield from segments
+
+    def _stream_runner(self) -> Any:
+        """Runner for window-by-window decoding; shared passes with a model server"""
+        if self.model_server is not None:
+            return self.model_server.decoder(self.model_size, **self.backend_options)
+        return self.backend
+
+    def _decode_spans(
+        self,
+        audio_array: Any,
+        options: Dict[str, Any],
+        spans: List[Tuple[int, int]],
+        runner: Any,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        previous_text: str = "",
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]], Optional[str], Dict[str, Any]]]:
+        """Decode spans in order, yielding (end_sample, segments, language, metadata) per span"""
+        span_options = dict(options)
+        base_prompt = span_options.pop("initial_prompt", None) or ""
+        condition = span_options.get("condition_on_previous_text", True)
+        total = max(1, len(audio_array))
+
+        for begin, end in spans:
+            for name in self.JOB_STATE_OPTIONS:
+                if span_options.get(name) is not None:
+                    span_options[name].offset = begin / SAMPLE_RATE
+
+            prompt = " ".join(
+                p for p in (base_prompt, previous_text[-self.PROMPT_TAIL_CHARS:].strip()) if p
+            )
+            call_options = {**span_options, "initial_prompt": prompt} if prompt else span_options
+
+            # Position inside the span -> position in the whole file
+            span_progress = None
+            if progress_handler:
+                def span_progress(pct: float, b: int = begin, e: int = end) -> None:
+                    progress_handler(100.0 * (b + (e - b) * pct / 100) / total)
+
+            result = runner.transcribe(
+                audio_array[begin:end], progress_handler=span_progress, **call_options
+            )
+            segments = offset_segments(result.get("segments", []), begin / SAMPLE_RATE)
+
+            # Keep the first detected language for every following span
+            if segments and not span_options.get("language") and result.get("language"):
+                span_options["language"] = result["language"]
+
+            if condition:
+                text = "".join(segment.get("text", "") for segment in segments)
+                previous_text = (previous_text + text)[-self.PROMPT_TAIL_CHARS:]
+
+            if progress_handler:
+                progress_handler(100.0 * end / total)
+
+            yield end, segments, span_options.get("language"), result.get("metadata", {})
+
+    def _collect_spans(
+        self,
+        audio_array: Any,
+        options: Dict[str, Any],
+        spans: List[Tuple[int, int]],
+        runner: Any,
+        segment_handler: Optional[Callable[[Dict[str, Any]], None]] = None,
+        job: Optional[Tuple[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Decode spans to completion, reporting segments and checkpointing.
+
+        Args:
+            segment_handler: Receives every segment (restored ones first)
+            job: (key, params) to checkpoint under; resumes from an existing
+                checkpoint for the same key
+        """
+        state = self.checkpoints.load(job[0]) if job else None
+        segments: List[Dict[str, Any]] = list(state["segments"]) if state else []
+        resume = int(state["offset"] * SAMPLE_RATE) if state else 0
+        language = (state or {}).get("language") or options.get("language")
+        if language:
+            options = {**options, "language": language}
+
+        for segment in segments if segment_handler else []:
+            segment_handler(segment)
+
+        previous_text = "".join(segment.get("text", "") for segment in segments)
+        last_saved = time.time()
+
+        metadata: Dict[str, Any] = {}
+        for end, new_segments, language, span_metadata in self._decode_spans(
+            audio_array,
+            options,
+            [(begin, end) for begin, end in spans if end > resume],
+            runner,
+            self.progress.report,
+            previous_text[-self.PROMPT_TAIL_CHARS:],
+        ):
+            segments.extend(new_segments)
+            self._merge_metadata(metadata, span_metadata)
+            for segment in new_segments if segment_handler else []:
+                segment_handler(segment)
+
+            if job and time.time() - last_saved >= self.CHECKPOINT_INTERVAL_SECONDS:
+                self.checkpoints.save(job[0], end / SAMPLE_RATE, segments, language, job[1])
+                last_saved = time.time()
+
+        result = TranscriptionBackend.build_result(segments, language)
+        result["metadata"] = metadata
+        if state:
+            metadata["resumed_from"] = resume / SAMPLE_RATE
+        return result
+
+    def _merge_metadata(self, total: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+        """Fold one span's runner metadata (batched/parallel stats) into the job's"""
+        for name, value in metadata.items():
+            if isinstance(value, dict):
+                self._merge_metadata(total.setdefault(name, {}), value)
+            elif name in self.SUMMED_METADATA and name in total:
+                total[name] += value
+            else:
+                total[name] = value
+
+    def _checkpoint_spans(self, audio_array: Any, runner: Any) -> List[Tuple[int, int]]:
+        """Spans decoded between checkpoints; a whole pool round in parallel mode"""
+        seconds = self.CHECKPOINT_SPAN_SECONDS
+        if isinstance(runner, ParallelTranscriber):
+            seconds = max(seconds, runner.workers * runner.CHUNK_SECONDS)
+
+        return split_on_silence(audio_array, seconds, ParallelTranscriber.SEARCH_SECONDS)
+
+    def _decode(
+        self,
+        audio_array: Any,
+        duration: float,
+        options: Dict[str, Any],
+        kwargs: Dict[str, Any],
+        job: Optional[Tuple[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Language pass, then streamed, batched, parallel or plain decoding"""
+        self._pin_language(audio_array, options)
+
+        # Opt-in: long jobs decoded span by span so they can be checkpointed
+        if duration < self.CHECKPOINT_MIN_SECONDS or not kwargs.get("checkpoint", False):
+            job = None
+
+        # Chunk-parallel long-form mode when parallel_workers > 1
+        runner = self._select_runner(
+            duration,
+            kwargs.get("parallel_workers"),
+            kwargs.get("batch_size"),
+            kwargs.get("thread_settings") or self.thread_settings,
         )
-            
-    def _detect_whisper_params(self) -> None:
-        """Determine correct progress parameter name for Whisper version"""
-        transcribe_params = inspect.signature(self.model.transcribe).parameters
-        self.use_on_progress = "on_progress" in transcribe_params
-        self.use_progress_callback = "progress_callback" in transcribe_params
+
+        cascade = None
+        if self.refine_model and kwargs.get("cascade", True):
+            runner = cascade = CascadeTranscriber(runner, self._get_refiner(), self.model_size)
+
+        segment_handler = kwargs.get("segment_handler")
+        if segment_handler and runner is self.backend:
+            # Plain backend: window by window, so segments arrive as they are decoded
+            spans = split_on_silence(audio_array, self.STREAM_WINDOW_SECONDS)
+        elif job:
+            spans = self._checkpoint_spans(audio_array, runner)
+        else:
+            # Batched/parallel/cascade runners report their segments once they return
+            spans = [(0, len(audio_array))] if segment_handler else []
+
+        if spans:
+            result = self._collect_spans(audio_array, options, spans, runner, segment_handler, job)
+        else:
+            result = runner.transcribe(
+                audio_array,
+                progress_handler=self.progress.report,
+                **options,
+            )
+
+        if cascade is not None:
+            full_estimate, _, _ = TimeEstimator(self.refine_model).estimate(duration)
+            report = cascade.summary(duration, self.refine_model, full_estimate)
+            result.setdefault("metadata", {})["cascade"] = report
+            self.logger.log_cascade(report)
+
+        return result
+
+    def align_words(
+        self,
+        segments: List[Dict[str, Any]],
+        audio_input: Optional[Any] = None,
+        language: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Word timestamps for a few segments, after the main transcription.
+
+        Args:
+            segments: Segments of a previous `transcribe` result (absolute times)
+            audio_input: Source audio; defaults to the array of the last job
+            language: Language of the segments (result["language"])
+
+        Returns:
+            Copies of `segments`, with a "words" list when the backend can align
+        """
+        if not segments:
+            return []
+
+        if audio_input is not None:
+            audio_array, _ = self.audio_processor.convert(
+                self.audio_processor.validate_input(audio_input)
+            )
+        elif self._last_audio is not None:
+            audio_array = self._last_audio
+        else:
+            raise TranscriptionError.no_result()
+
+        start = time.time()
+        with self._model_lock:
+            aligned = self.backend.align_words(audio_array, segments, language)
+        if aligned is None:
+            debug.dprint(f"Backend {self.backend.name} cannot align words, times unchanged")
+            return [dict(segment) for segment in segments]
+
+        debug.dprint(f"Aligned {len(aligned)} segments in {time.time() - start:.2f}s")
+        return aligned
+
+    def _get_refiner(self) -> TranscriptionBackend:
+        """Larger model used by the cascade, same backend and options as the draft"""
+        if self._refiner is None:
+            self._refiner = get_backend(self.backend_name, **self.backend_options)
+            self._refiner.load(self.refine_model)
+
+        return self._refiner
 
     def transcribe(
         self,
@@ -50,6 +534,7 @@ class Textify:
         # Audio processing
         audio = self.audio_processor.validate_input(audio_input)
         audio_array, duration = self.audio_processor.convert(audio)
+        self._last_audio = audio_array
 
         debug.dprint(
             f"Audio validated. Duration={duration:.2f}s, "
@@ -60,61 +545,61 @@ class Textify:
         content_config = kwargs.get("content_config", ContentType())
         custom_words = len(content_config.words) if content_config.words else 0
         setup_time = self.estimator.get_setup_time()
+        transcribe_estimate, _, _ = self.estimator.estimate(duration, custom_words)
 
         debug.dprint(
             f"Estimation setup. Duration={duration:.2f}s, custom_words={custom_words}, "
-            f"setup_time={setup_time:.2f}s"
+            f"setup_time={setup_time:.2f}s, transcribe_estimate={transcribe_estimate:.2f}s"
         )
 
-        # Progress setup
-        pipeline_start = self.progress.setup(setup_time)
+        # Progress setup (the estimate only drives the bar until the decoder reports)
+        pipeline_start = self.progress.setup(transcribe_estimate)
         if pipeline_start is None:
             pipeline_start = time.time()
 
         # Start transcription
-        self.progress.start_transcription_progress(progress_handler)
+        self.progress.start_transcription_progress(
+            progress_handler,
+            duration=duration,
+            update_handler=kwargs.get("progress_update_handler"),
+        )
 
         try:
-            # Create version-safe transcription parameters
-            whisper_args: Dict[str, Any] = {
-                "audio": audio_array,
-                "temperature": kwargs.get("temperature", 0.2),
-            }
-
-            # Safe callback assignment with handler capture
-            if self.progress.handler:
-                current_handler = self.progress.handler
-
-                if self.use_on_progress:
-                    whisper_args["on_progress"] = lambda pct: current_handler(pct)
-
-                elif self.use_progress_callback:
-                    whisper_args["progress_callback"] = lambda pct: current_handler(pct)
-
-            # Handle initial prompt
-            if "initial_prompt" in kwargs:
-                whisper_args["initial_prompt"] = kwargs.pop("initial_prompt")
+            options = self._build_options(kwargs)
+            segment_handler = kwargs.get("segment_handler")
 
-            # Filter out unsupported arguments
-            supported_args = [
-                "task",
-                "language",
-                "best_of",
-                "beam_size",
-                "patience",
-                "length_penalty",
-                "suppress_tokens",
-                "condition_on_previous_text",
-            ]
-            filtered_kwargs = {k: v for k, v in kwargs.items() if k in supported_args}
-            safe_args = {k: v for k, v in whisper_args.items() if k != "audio"}
+            # Same audio + same decode parameters -> reuse the stored result
+            params = self._job_params(options, kwargs)
+            key = job_key(audio_fingerprint(audio_array), params)
+            use_cache = self.cache is not None and kwargs.get("use_cache", True)
+            result = self.cache.get(key) if use_cache else None
+            cache_status = "off" if not use_cache else "hit" if result is not None else "miss"
 
-            debug.dprint(f"Calling transcribe with args={safe_args}, extra_kwargs={filtered_kwargs}")
+            # Per-job thread pool / affinity, restored once the call returns
+            thread_settings = kwargs.get("thread_settings") or self.thread_settings
+            with ThreadScope(thread_settings) as threads:
+                if result is not None:
+                    for segment in result.get("segments", []) if segment_handler else []:
+                        segment_handler(segment)
+                else:
+                    result = self._decode(audio_array, duration, options, kwargs, (key, params))
+                    self.checkpoints.clear(key)
+                thread_report = threads.effective()
 
-            result = self.model.transcribe(**whisper_args, **filtered_kwargs)
+            if cache_status == "miss":
+                self.cache.put(key, result)
 
             # Finalize
-            return self.progress.complete(result, duration)
+            result = self.progress.complete(result, duration)
+            result["metadata"]["threads"] = thread_report
+            result["metadata"]["cache"] = cache_status
+            if options.get("fallback") is not None and cache_status != "hit":
+                result["metadata"]["fallback"] = options["fallback"].summary()
+            if options.get("repetition") is not None and cache_status != "hit":
+                result["metadata"]["repetition"] = options["repetition"].summary()
+            if options.get("beam") is not None and cache_status != "hit":
+                result["metadata"]["beam"] = options["beam"].summary()
+            return result
 
         finally:
             self.progress.active = False
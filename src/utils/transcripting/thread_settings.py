@@ -0,0 +1,100 @@
+import os
+import torch
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+
+from src.errors.debug import debug
+
+
+
+@dataclass
+class ThreadSettings:
+    """Per-job CPU settings applied around a transcription call"""
+    num_threads: Optional[int] = None  # torch intra-op threads
+    interop_threads: Optional[int] = None  # torch inter-op threads (once per process)
+    cpu_affinity: Optional[List[int]] = None  # CPU ids the process may run on
+
+
+class ThreadScope:
+    """
+    Context manager applying ThreadSettings and restoring the previous state.
+
+    Notes:
+        - torch thread pools are process-wide, so concurrent jobs should run in
+          separate worker processes, each with its own settings.
+        - torch only accepts an inter-op thread count before any inter-op work
+          has run; later requests are reported as not applied.
+        - CPU affinity uses os.sched_setaffinity (Linux). It is applied to every
+          thread of the process so already-running OpenMP workers follow it.
+    """
+
+    def __init__(self, settings: Optional[ThreadSettings] = None):
+        self.settings = settings or ThreadSettings()
+        self._previous_threads: Optional[int] = None
+        self._previous_affinity: Optional[Set[int]] = None
+        self.interop_applied = False
+        self.affinity_applied = False
+
+    def __enter__(self) -> "ThreadScope":
+        settings = self.settings
+
+        if settings.num_threads:
+            self._previous_threads = torch.get_num_threads()
+            torch.set_num_threads(settings.num_threads)
+
+        if settings.interop_threads:
+            try:
+                torch.set_num_interop_threads(settings.interop_threads)
+                self.interop_applied = True
+
+            except RuntimeError as e:  # Already set or inter-op pool started
+                debug.dprint(f"Inter-op threads not applied: {e}")
+
+        if settings.cpu_affinity and hasattr(os, "sched_setaffinity"):
+            self._previous_affinity = os.sched_getaffinity(0)
+            self.affinity_applied = self._set_affinity(set(settings.cpu_affinity))
+
+        debug.dprint(f"ThreadScope entered: {self.effective()}")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._previous_threads is not None:
+            torch.set_num_threads(self._previous_threads)
+
+        if self._previous_affinity is not None:
+            self._set_affinity(self._previous_affinity)
+
+    def effective(self) -> Dict[str, Any]:
+        """Settings actually in force, for the job metadata."""
+        affinity = (
+            sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+        )
+
+        return {
+            "num_threads": torch.get_num_threads(),
+            "interop_threads": torch.get_num_interop_threads(),
+            "cpu_affinity": affinity,
+            "cpu_count": os.cpu_count(),
+            "requested": {
+                "num_threads": self.settings.num_threads,
+                "interop_threads": self.settings.interop_threads,
+                "cpu_affinity": self.settings.cpu_affinity,
+            },
+            "interop_applied": self.interop_applied,
+            "affinity_applied": self.affinity_applied,
+        }
+
+    @staticmethod
+    def _set_affinity(cpus: Set[int]) -> bool:
+        """Pin every thread of this process (falls back to the calling thread)."""
+        task_dir = "/proc/self/task"
+        try:
+            thread_ids = [int(t) for t in os.listdir(task_dir)] if os.path.isdir(task_dir) else [0]
+            for thread_id in thread_ids:
+                os.sched_setaffinity(thread_id, cpus)
+            return True
+
+        except (OSError, ValueError) as e:
+            debug.dprint(f"CPU affinity not applied: {e}")
+            return False
@@ -0,0 +1,107 @@
+import os
+import glob
+import gzip
+import json
+from typing import Any, Dict, Optional
+
+
+from .fingerprint import job_key, json_default
+from src.utils.models import CACHE_DIR
+from src.errors.debug import debug
+
+
+
+class TranscriptCache:
+    """
+    Persistent cache of full transcription results.
+
+    Summary:
+        Entries are gzip-compressed JSON files named
+        "<audio fingerprint>-<parameter hash>.json.gz". The parameter hash
+        covers everything that changes the output (model size, backend,
+        precision, language, temperature, initial prompt, decode options),
+        so re-exporting the same recording, or re-running after an unrelated
+        change, skips the model entirely. Least recently used files are
+        evicted once the folder grows past `max_bytes`.
+    """
+
+    CACHE_SUBDIR = "transcripts"
+    EXTENSION = ".json.gz"
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MiB
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = os.path.join(cache_dir or CACHE_DIR, self.CACHE_SUBDIR)
+        self.max_bytes = max_bytes
+
+    def make_key(self, audio_fingerprint: str, params: Dict[str, Any]) -> str:
+        return job_key(audio_fingerprint, params)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                result = json.load(f)
+
+        except (OSError, ValueError):
+            return None
+
+        os.utime(path)  # Mark as recently used for eviction
+        debug.dprint(f"Transcript cache hit: {key[:16]}…")
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result; a full disk or read-only cache never fails the job."""
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(result, f, separators=(",", ":"), default=json_default)
+            os.replace(tmp_path, path)
+
+        except OSError as e:
+            debug.dprint(f"Transcript cache write failed: {e}")
+            return
+
+        debug.dprint(f"Transcript cached: {key[:16]}… ({os.path.getsize(path)} bytes)")
+        self.evict()
+
+    def invalidate(self, key: Optional[str] = None, audio_fingerprint: Optional[str] = None) -> int:
+        """
+        Remove entries: one key, every entry for one recording, or everything.
+
+        Returns:
+            Number of files removed
+        """
+        if key:
+            pattern = self._path(key)
+        elif audio_fingerprint:
+            pattern = os.path.join(self.cache_dir, f"{audio_fingerprint}-*{self.EXTENSION}")
+        else:
+            pattern = os.path.join(self.cache_dir, f"*{self.EXTENSION}")
+
+        removed = 0
+        for path in glob.glob(pattern):
+            os.remove(path)
+            removed += 1
+
+        return removed
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the folder fits `max_bytes`."""
+        entries = [
+            (os.path.getmtime(p), os.path.getsize(p), p)
+            for p in glob.glob(os.path.join(self.cache_dir, f"*{self.EXTENSION}"))
+        ]
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            debug.dprint(f"Transcript cache evicted: {os.path.basename(path)}")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{self.EXTENSION}")
+
@@ -0,0 +1,106 @@
+import os
+import glob
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+
+from .fingerprint import json_default
+from src.utils.models import CACHE_DIR
+from src.errors.debug import debug
+
+
+
+class TranscriptCheckpoint:
+    """
+    On-disk progress of long transcriptions, so a restarted job can resume.
+
+    Summary:
+        One JSON file per job, named after the job key (audio fingerprint +
+        decode parameter hash), holding the segments decoded so far, the
+        audio offset they cover and the parameters. A job with the same
+        input and settings picks it up and only decodes what is left. The
+        file is removed once the job completes; abandoned ones expire.
+    """
+
+    CHECKPOINT_SUBDIR = "checkpoints"
+    EXTENSION = ".json"
+    MAX_AGE_SECONDS = 7 * 24 * 3600  # Abandoned checkpoints are dropped after a week
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.checkpoint_dir = os.path.join(cache_dir or CACHE_DIR, self.CHECKPOINT_SUBDIR)
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Saved state for `key` ({"offset", "segments", "language", "params"}), if any."""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                state = json.load(f)
+
+        except (OSError, ValueError):
+            return None
+
+        if state.get("key") != key:
+            return None
+
+        debug.dprint(
+            f"Checkpoint found: {key[:16]}… at {state['offset']:.1f}s, "
+            f"{len(state['segments'])} segments"
+        )
+        return state
+
+    def save(
+        self,
+        key: str,
+        offset: float,
+        segments: List[Dict[str, Any]],
+        language: Optional[str],
+        params: Dict[str, Any],
+    ) -> None:
+        """Atomically replace the checkpoint; failures only cost the resume."""
+        state = {
+            "key": key,
+            "offset": offset,
+            "segments": segments,
+            "language": language,
+            "params": params,
+            "saved_at": time.time(),
+        }
+
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, separators=(",", ":"), default=json_default)
+            os.replace(tmp_path, path)
+
+        except OSError as e:
+            debug.dprint(f"Checkpoint write failed: {e}")
+            return
+
+        debug.dprint(f"Checkpoint saved: {key[:16]}… at {offset:.1f}s")
+
+    def clear(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def prune(self) -> int:
+        """
+        Remove checkpoints older than MAX_AGE_SECONDS.
+
+        Returns:
+            Number of files removed
+        """
+        cutoff = time.time() - self.MAX_AGE_SECONDS
+        removed = 0
+        for path in glob.glob(os.path.join(self.checkpoint_dir, f"*{self.EXTENSION}")):
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+
+        return removed
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.checkpoint_dir, f"{key}{self.EXTENSION}")
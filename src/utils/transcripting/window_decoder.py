@@ -0,0 +1,383 @@
+import time
+import torch
+import whisper
+import numpy as np
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from whisper.decoding import DecodingOptions, DecodingResult, DecodingTask
+from whisper.tokenizer import get_tokenizer
+
+
+from .audio_windows import SAMPLE_RATE, split_on_silence
+from .adaptive_beam import AdaptiveBeam
+from .backends.base import TranscriptionBackend
+from .feature_cache import FeatureCache
+from .fallback import FallbackTracker
+from .fingerprint import audio_fingerprint
+from .mel_frontend import MelFrontend
+from .repetition_guard import RepetitionGuard
+from .segments import split_timestamped_tokens
+from src.errors.debug import debug
+
+
+
+class WindowDecoder:
+    """
+    Batched decoding of independent 30-second windows on a Whisper model.
+
+    Summary:
+        openai-whisper encodes and decodes one window at a time. Here the
+        audio is split at pauses into windows of up to 30 seconds, B windows
+        are stacked into one encoder forward pass and decoded together with
+        batched greedy search. Windows do not condition on each other, which
+        is what makes the batching possible.
+    """
+
+    WINDOW_SECONDS = 30.0
+    NO_SPEECH_THRESHOLD = 0.6  # Same silence rule as whisper.transcribe
+    LOGPROB_THRESHOLD = -1.0
+    IGNORED_OPTIONS = ("condition_on_previous_text",)  # Windows never see earlier text
+
+    def __init__(
+        self,
+        model: Any,
+        batch_size: int = 8,
+        feature_cache: Optional[FeatureCache] = None,
+        model_key: str = "",
+    ):
+        self.model = model
+        self.batch_size = max(1, batch_size)
+        self.feature_cache = feature_cache
+        self.model_key = model_key  # Model size + precision, part of feature cache keys
+        self.mel = MelFrontend(model.dims.n_mels)
+        self.cached_windows = 0  # Windows of the last call served from the cache
+        self.best_of = None  # Caller's best_of, used by sampling passes
+        self.stats: Dict[str, Any] = {}
+
+    # --------------------- Public API ---------------------
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        progress_handler: Optional[Callable[[float], None]] = None,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        spans = split_on_silence(audio, self.WINDOW_SECONDS)
+        task = options.get("task", "transcribe")
+        language = options.get("language") or self.detect_language(
+            audio[spans[0][0] : spans[0][1]]
+        )
+
+        tokenizer = get_tokenizer(
+            self.model.is_multilingual,
+            num_languages=self.model.num_languages,
+            language=language,
+            task=task,
+        )
+        tracker: Optional[FallbackTracker] = options.get("fallback")
+        guard: Optional[RepetitionGuard] = options.get("repetition")
+        beam: Optional[AdaptiveBeam] = options.get("beam")
+        decode_options = self.decoding_options(
+            options, language, task, tracker.policy.ladder()[0] if tracker is not None else None
+        )
+
+        segments: List[Dict[str, Any]] = []
+        encode_time = decode_time = 0.0
+        cache_key = (
+            f"{self.model_key}-{audio_fingerprint(audio)}" if self.feature_cache else None
+        )
+        self.cached_windows = 0
+
+        for first in range(0, len(spans), self.batch_size):
+            batch = spans[first : first + self.batch_size]
+
+            if guard is not None:
+                guard.windows = [(b / SAMPLE_RATE, e / SAMPLE_RATE) for b, e in batch]
+            features, results, encode_seconds, first_decode = self.encode_decode(
+                audio, batch, cache_key, decode_options, guard
+            )
+            encode_time += encode_seconds
+
+            start = time.time()
+            if beam is not None and decode_options.temperature == 0:
+                beam.record_greedy(len(batch), first_decode)
+                results = self.escalate_beam(features, results, batch, decode_options, beam, guard)
+            if tracker is not None:
+                results = self.retry_weak(
+                    features,
+                    results,
+                    batch,
+                    decode_options,
+                    tracker,
+                    first_decode + time.time() - start,
+                    guard,
+                )
+            decode_time += first_decode + time.time() - start
+
+            for span, result in zip(batch, results):
+                window_segments = self.result_segments(span, result, tokenizer)
+                if guard is not None:
+                    window_segments = guard.filter_segments(window_segments)
+                segments.extend(window_segments)
+
+            if progress_handler:
+                progress_handler(100.0 * batch[-1][1] / max(1, len(audio)))
+
+        self.stats = {
+            "windows": len(spans),
+            "cached_windows": self.cached_windows,
+            "batch_size": self.batch_size,
+            "encode_time": encode_time,
+            "decode_time": decode_time,
+        }
+        debug.dprint(f"WindowDecoder stats: {self.stats}")
+
+        result = TranscriptionBackend.build_result(segments, language)
+        result["metadata"] = {"batched": dict(self.stats)}
+        return result
+
+    def detect_language(self, window: np.ndarray) -> str:
+        """Most likely language of one window (English-only models return "en")."""
+        if not self.model.is_multilingual:
+            return "en"
+
+        mel = self.mel_batch(window, [(0, len(window))])[0]
+        _, probs = self.model.detect_language(mel)
+        return max(probs, key=probs.get)
+
+    # --------------------- Building Blocks ---------------------
+    def mel_batch(self, audio: np.ndarray, spans: List[Tuple[int, int]]) -> torch.Tensor:
+        """Log-mel of each span, padded to 30 s and stacked: (B, n_mels, 3000)."""
+        mels = [self.mel.window(audio[begin:end]) for begin, end in spans]
+        return torch.stack(mels).to(self.model.device, dtype=self._dtype())
+
+    def encode(self, mel: torch.Tensor) -> torch.Tensor:
+        """One encoder forward pass for the whole batch."""
+        with torch.no_grad():
+            return self.model.embed_audio(mel)
+
+    def encode_cached(
+        self, audio: np.ndarray, spans: List[Tuple[int, int]], cache_key: Optional[str]
+    ) -> torch.Tensor:
+        """Encoder output for `spans`, running the encoder only on uncached windows."""
+        if cache_key is None:
+            return self.encode(self.mel_batch(audio, spans))
+
+        device, dtype = self.model.device, self._dtype()
+        cached = [self.feature_cache.get(cache_key, span, device, dtype) for span in spans]
+        missing = [span for span, features in zip(spans, cached) if features is None]
+        self.cached_windows += len(spans) - len(missing)
+
+        if missing:
+            computed = iter(self.encode(self.mel_batch(audio, missing)))
+            for index, span in enumerate(spans):
+                if cached[index] is None:
+                    cached[index] = next(computed)
+                    self.feature_cache.put(cache_key, span, cached[index])
+
+        return torch.stack(cached)
+
+    def encode_decode(
+        self,
+        audio: np.ndarray,
+        spans: List[Tuple[int, int]],
+        cache_key: Optional[str],
+        options: DecodingOptions,
+        guard: Optional[RepetitionGuard] = None,
+    ) -> Tuple[torch.Tensor, List[DecodingResult], float, float]:
+        """
+        Encoder pass and first decode of one batch.
+
+        Returns:
+            (features, results, encode seconds, decode seconds)
+        """
+        start = time.time()
+        features = self.encode_cached(audio, spans, cache_key)
+        encode_seconds = time.time() - start
+
+        start = time.time()
+        results = self.decode(features, options, guard)
+        return features, results, encode_seconds, time.time() - start
+
+    def decode(
+        self,
+        features: torch.Tensor,
+        options: DecodingOptions,
+        guard: Optional[RepetitionGuard] = None,
+    ) -> List[DecodingResult]:
+        """Batched decode; whisper skips the encoder when given audio features.
+
+        Whisper repeats the tokens per beam or sample but not the features,
+        so beam search and best-of sampling decode one window at a time.
+        """
+        if (options.beam_size or options.best_of or 1) > 1 and features.shape[0] > 1:
+            windows = guard.windows if guard is not None else []
+            results = []
+            for row in range(features.shape[0]):
+                if guard is not None:
+                    guard.windows = windows[row : row + 1]
+                results.extend(self.decode(features[row : row + 1], options, guard))
+            if guard is not None:
+                guard.windows = windows
+            return results
+
+        with torch.no_grad():
+            if guard is None:
+                return whisper.decode(self.model, features, options)
+            return guard.attach(DecodingTask(self.model, options)).run(features)
+
+    def escalate_beam(
+        self,
+        features: torch.Tensor,
+        results: List[DecodingResult],
+        spans: List[Tuple[int, int]],
+        options: DecodingOptions,
+        beam: AdaptiveBeam,
+        guard: Optional[RepetitionGuard] = None,
+    ) -> List[DecodingResult]:
+        """Re-decode the windows greedy search got wrong with batched beam search."""
+        weak = [index for index, result in enumerate(results) if beam.needs_beam(result)]
+        if not weak:
+            return results
+
+        if guard is not None:
+            guard.windows = [(spans[i][0] / SAMPLE_RATE, spans[i][1] / SAMPLE_RATE) for i in weak]
+
+        start = time.time()
+        beamed = self.decode(
+            features[weak],
+            replace(options, beam_size=beam.beam_size, patience=beam.patience),
+            guard,
+        )
+        elapsed = time.time() - start
+
+        results = list(results)
+        for index, result in zip(weak, beamed):
+            results[index] = result
+            begin, end = spans[index]
+            beam.record_beam(elapsed / len(weak), begin / SAMPLE_RATE, end / SAMPLE_RATE)
+
+        return results
+
+    def retry_weak(
+        self,
+        features: torch.Tensor,
+        results: List[DecodingResult],
+        spans: List[Tuple[int, int]],
+        options: DecodingOptions,
+        tracker: FallbackTracker,
+        first_time: float,
+        guard: Optional[RepetitionGuard] = None,
+    ) -> List[DecodingResult]:
+        """
+        Re-decode weak windows up the temperature ladder, within the policy limits.
+
+        Retried windows are decoded together from the features already in
+        memory, so a retry costs one decoder pass, never the encoder.
+        """
+        windows = [tracker.open_window(b / SAMPLE_RATE, e / SAMPLE_RATE) for b, e in spans]
+        for window in windows:
+            tracker.record(window, options.temperature, first_time / len(windows))
+
+        results = list(results)
+        while True:
+            weak = [
+                index
+                for index, (window, result) in enumerate(zip(windows, results))
+                if tracker.can_retry(window)
+                and tracker.policy.needs_fallback(
+                    result.compression_ratio, result.avg_logprob, result.no_speech_prob
+                )
+            ][: tracker.budget_left]
+            if not weak:
+                return results
+
+            temperature = tracker.next_temperature(windows[weak[0]])
+            start = time.time()
+            if guard is not None:
+                guard.windows = [(spans[i][0] / SAMPLE_RATE, spans[i][1] / SAMPLE_RATE) for i in weak]
+            retried = self.decode(features[weak], self.at_temperature(options, temperature), guard)
+            elapsed = time.time() - start
+
+            for index, result in zip(weak, retried):
+                results[index] = result
+                tracker.record(windows[index], temperature, elapsed / len(weak))
+
+    def decoding_options(
+        self,
+        options: Dict[str, Any],
+        language: Optional[str],
+        task: str,
+        temperature: Optional[float] = None,
+    ) -> DecodingOptions:
+        """
+        Decode options shared by every window of the batch.
+
+        Takes the caller's whisper.transcribe options: temperature (the
+        first one of a tuple), beam_size/patience at temperature 0,
+        best_of above it (whisper rejects the other combinations),
+        length_penalty and suppress_tokens. With an AdaptiveBeam the first
+        pass stays greedy and beam_size is only used for its retries.
+        """
+        if temperature is None:
+            temperature = options.get("temperature", 0.0)
+            if isinstance(temperature, (list, tuple)):
+                temperature = temperature[0]
+
+        self.best_of = options.get("best_of")  # Sampling retries may need it later
+        decode_options = DecodingOptions(
+            task=task,
+            language=language,
+            temperature=temperature,
+            length_penalty=options.get("length_penalty"),
+            prompt=options.get("initial_prompt") or None,
+            without_timestamps=False,
+            fp16=self._dtype() == torch.float16,
+        )
+        if options.get("beam") is None and temperature == 0:
+            decode_options = replace(
+                decode_options, beam_size=options.get("beam_size"), patience=options.get("patience")
+            )
+        decode_options = self.at_temperature(decode_options, temperature)
+
+        if "suppress_tokens" in options:
+            decode_options = replace(decode_options, suppress_tokens=options["suppress_tokens"])
+
+        return decode_options
+
+    def at_temperature(self, options: DecodingOptions, temperature: float) -> DecodingOptions:
+        """`options` at another temperature, with the search settings whisper allows there."""
+        if temperature > 0:
+            return replace(
+                options, temperature=temperature, beam_size=None, patience=None, best_of=self.best_of
+            )
+        return replace(options, temperature=temperature, best_of=None)
+
+    def result_segments(
+        self, span: Tuple[int, int], result: DecodingResult, tokenizer: Any
+    ) -> List[Dict[str, Any]]:
+        """Timed segments for one decoded window (empty for silent windows)."""
+        if (
+            result.no_speech_prob > self.NO_SPEECH_THRESHOLD
+            and result.avg_logprob < self.LOGPROB_THRESHOLD
+        ):
+            return []
+
+        begin, end = span
+        # Windows are decoded once: text after the last timestamp pair is kept, not re-queued
+        segments, _ = split_timestamped_tokens(
+            result.tokens,
+            tokenizer,
+            begin / SAMPLE_RATE,
+            (end - begin) / SAMPLE_RATE,
+            keep_tail=True,
+        )
+        for segment in segments:
+            segment.update(
+                temperature=result.temperature,
+                avg_logprob=result.avg_logprob,
+                no_speech_prob=result.no_speech_prob,
+            )
+        return segments
+
+    def _dtype(self) -> torch.dtype:
+        return next(self.model.parameters()).dtype
@@ -0,0 +1,7 @@
+import os
+import tempfile
+
+# Caches, checkpoints and speed profiles go to a throwaway folder; CACHE_DIR
+# is read once when src.utils.models is imported, so this runs first
+os.environ["XDG_CACHE_HOME"] = tempfile.mkdtemp(prefix="transcriptor-tests-")
+os.environ.pop("TRANSCRIPTOR_HOST_PROFILE", None)
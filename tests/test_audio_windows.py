@@ -0,0 +1,35 @@
+import numpy as np
+
+from src.utils.transcripting.audio_windows import SAMPLE_RATE, split_on_silence
+
+
+def _tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+def test_spans_cover_the_audio_without_gaps():
+    audio = _tone(95.0)
+    spans = split_on_silence(audio, max_seconds=30.0)
+
+    assert spans[0][0] == 0
+    assert spans[-1][1] == len(audio)
+    assert all(end == next_begin for (_, end), (next_begin, _) in zip(spans, spans[1:]))
+    assert all(end - begin <= 30.0 * SAMPLE_RATE for begin, end in spans)
+
+
+def test_cut_moves_to_the_pause():
+    audio = np.concatenate([_tone(27.0), _silence(1.0), _tone(20.0)])
+    spans = split_on_silence(audio, max_seconds=30.0, search_seconds=5.0)
+
+    cut = spans[0][1] / SAMPLE_RATE
+    assert 27.0 <= cut <= 28.0
+
+
+def test_short_audio_is_one_span():
+    audio = _tone(12.0)
+    assert split_on_silence(audio) == [(0, len(audio))]
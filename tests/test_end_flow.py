@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+import src.utils.end_flow as end_flow
+from src.utils.end_flow import EndFlow
+from src.utils.transcripting.backends import StandInBackend
+
+
+def _recording(seconds: float) -> AudioSegment:
+    t = np.arange(int(seconds * 16000)) / 16000
+    samples = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+    return AudioSegment(samples.tobytes(), frame_rate=16000, sample_width=2, channels=1)
+
+
+@pytest.fixture
+def flow(monkeypatch, tmp_path):
+    monkeypatch.setattr(EndFlow, "backend", StandInBackend.name)
+    monkeypatch.setattr(EndFlow, "transcript_cache", False)
+    monkeypatch.setattr(end_flow, "extract_audio", lambda path: _recording(40.0))  # No ffmpeg
+
+    flow = EndFlow()
+    flow.ask_save_path = lambda initial_file, extension: str(tmp_path / f"out{extension}")
+    return flow
+
+
+def test_video_to_text_file(flow, tmp_path):
+    path = flow.process_video(
+        "lecture.mp4", {"words": ["Kernel", "Bayesian"]}, quick_script=True
+    )
+
+    assert path == str(tmp_path / "out.txt")
+    with open(path, encoding="utf-8") as f:
+        assert f.read().strip()
+    assert flow.sanitized.last_fit.kept == ["Kernel", "Bayesian"]
+
+
+def test_default_run_keeps_the_content_type_temperature(flow, monkeypatch):
+    calls = []
+    transcribe = flow.transcriber.transcribe
+
+    def spy(audio, **kwargs):
+        calls.append(kwargs)
+        return transcribe(audio, **kwargs)
+
+    monkeypatch.setattr(flow.transcriber, "transcribe", spy)
+    flow.process_video("lecture.mp4", quick_script=True)
+
+    assert calls[0]["temperature"] == 0.5  # No content types configured
+    assert "fallback_policy" not in calls[0]
+    assert not calls[0]["repetition_guard"]
@@ -0,0 +1,72 @@
+from src.utils.transcripting.fallback import FallbackPolicy, FallbackTracker
+
+
+def test_ladder_is_bounded_by_retries_per_window():
+    policy = FallbackPolicy(temperatures=(0.0, 0.2, 0.4, 0.6), max_retries_per_window=2)
+    assert policy.ladder() == (0.0, 0.2, 0.4)
+
+
+def test_needs_fallback_skips_silent_windows():
+    policy = FallbackPolicy()
+    assert policy.needs_fallback(3.0, -0.5, 0.0)  # Repetitive
+    assert policy.needs_fallback(1.5, -1.5, 0.0)  # Unsure
+    assert not policy.needs_fallback(1.5, -1.5, 0.9)  # Silent, dropped anyway
+    assert not policy.needs_fallback(1.5, -0.5, 0.0)
+
+
+def test_window_retries_stop_at_the_end_of_the_ladder():
+    tracker = FallbackTracker(FallbackPolicy(max_retries_per_window=2, job_retry_budget=10))
+    window = tracker.open_window(0.0, 30.0)
+
+    temperatures = []
+    while tracker.can_retry(window):
+        temperature = tracker.next_temperature(window)
+        temperatures.append(temperature)
+        tracker.record(window, temperature, 1.0)
+
+    assert temperatures == [0.0, 0.2, 0.4]
+    assert tracker.retries == 2  # The first decode is not a retry
+    assert window["retry_time"] == 2.0
+    assert tracker.budget_left == 8
+
+
+def test_job_budget_is_shared_by_all_windows():
+    tracker = FallbackTracker(FallbackPolicy(max_retries_per_window=5, job_retry_budget=3))
+    first, second = tracker.open_window(0.0, 30.0), tracker.open_window(30.0, 60.0)
+    for window in (first, second):
+        tracker.record(window, 0.0, 0.5)
+
+    tracker.record(first, 0.2, 0.5)
+    tracker.record(first, 0.4, 0.5)
+    tracker.record(second, 0.2, 0.5)
+
+    assert tracker.budget_left == 0
+    assert not tracker.can_retry(first)
+    assert not tracker.can_retry(second)
+    assert tracker.summary()["retries"] == 3
+
+
+def test_unknown_window_times_are_left_out():
+    tracker = FallbackTracker(FallbackPolicy())
+    tracker.offset = 60.0
+    assert "start" not in tracker.open_window()
+    assert tracker.open_window(1.0, 2.5)["start"] == 61.0
+
+
+def test_fork_and_merge():
+    tracker = FallbackTracker(FallbackPolicy(job_retry_budget=10))
+    tracker.offset = 100.0
+    forked = tracker.fork(offset=30.0, budget=4)
+
+    assert forked.policy.job_retry_budget == 4
+    assert tracker.policy.job_retry_budget == 10
+    window = forked.open_window(0.0, 30.0)
+    assert window["start"] == 130.0
+
+    forked.record(window, 0.0, 1.0)
+    forked.record(window, 0.2, 1.0)
+    tracker.merge(forked)
+
+    assert tracker.retries == 1
+    assert tracker.windows == [window]
+    assert tracker.budget_left == 9
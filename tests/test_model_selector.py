@@ -0,0 +1,40 @@
+from src.utils.models import MODELS
+from src.utils.transcripting.model_selector import ModelSelector
+
+SPEEDS = {"tiny": 40.0, "base": 30.0, "small": 18.0, "medium": 10.0, "large": 5.0}
+SETUPS = {"tiny": 1.0, "base": 2.5, "small": 5.0, "medium": 12.0, "large": 20.0}
+
+
+def _selector():
+    return ModelSelector(confidence=0.9, model_speeds=SPEEDS, setup_times=SETUPS)
+
+
+def test_generous_budget_picks_the_most_accurate_model():
+    model, rationale = _selector().select(audio_duration=60.0, budget_seconds=10_000.0)
+
+    assert model == MODELS[-1]
+    assert rationale["meets_budget"]
+
+
+def test_impossible_budget_falls_back_to_the_fastest_model():
+    model, rationale = _selector().select(audio_duration=600.0, budget_seconds=0.1)
+
+    assert model == MODELS[0]
+    assert not rationale["meets_budget"]
+
+
+def test_picks_the_first_model_that_fits():
+    _, rationale = _selector().select(audio_duration=600.0, budget_seconds=10_000.0)
+    times = {c["model"]: c["expected_time"] for c in rationale["candidates"]}
+    budget = (times["small"] + times["medium"]) / 2  # Between small and medium
+
+    model, _ = _selector().select(audio_duration=600.0, budget_seconds=budget)
+    assert model == "small"
+
+
+def test_loaded_model_has_no_setup_time():
+    _, rationale = _selector().select(60.0, 10_000.0, loaded_model="medium")
+    setup = {c["model"]: c["setup_time"] for c in rationale["candidates"]}
+
+    assert setup["medium"] == 0.0
+    assert setup["large"] == SETUPS["large"]
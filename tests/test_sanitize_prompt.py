@@ -0,0 +1,58 @@
+import pytest
+import whisper.tokenizer
+
+from src.utils.transcripting.sanitize_prompt import SanitizePrompt
+
+
+class _Tokenizer:
+    """One token per character, so term costs are easy to count."""
+
+    def __init__(self, multilingual):
+        self.multilingual = multilingual
+
+    def encode(self, text):
+        return [ord(c) for c in text]
+
+
+@pytest.fixture
+def tokenizers(monkeypatch):
+    requested = []
+
+    def get_tokenizer(multilingual, *args, **kwargs):
+        requested.append(multilingual)
+        return _Tokenizer(multilingual)
+
+    monkeypatch.setattr(whisper.tokenizer, "get_tokenizer", get_tokenizer)
+    return requested
+
+
+def test_dedupe_strips_and_ignores_case():
+    terms = ["  Kernel ", "kernel", "Fourier   transform", "", "FOURIER transform", "Bayes"]
+    assert SanitizePrompt._dedupe(terms) == ["Kernel", "Fourier transform", "Bayes"]
+
+
+def test_all_terms_fit_a_large_budget(tokenizers):
+    fit = SanitizePrompt(token_budget=200).fit_terms(["Kernel", "Bayes"])
+
+    assert fit.text == "Domains: Kernel, Bayes"
+    assert fit.kept == ["Kernel", "Bayes"]
+    assert fit.dropped == []
+    assert len(fit.tokens) <= 200
+
+
+def test_budget_drops_terms_and_keeps_caller_order(tokenizers):
+    terms = ["ab", "Backpropagation", "cd", "Eigendecomposition"]
+    fit = SanitizePrompt(token_budget=44).fit_terms(terms)
+
+    # The terms costing the most tokens per word are ranked first
+    assert fit.kept == ["Backpropagation", "Eigendecomposition"]
+    assert fit.dropped == ["ab", "cd"]
+    assert len(fit.tokens) <= 44
+
+
+def test_fit_uses_the_model_tokenizer_and_is_memoized(tokenizers):
+    english = SanitizePrompt(multilingual=False)
+    first = english.fit_terms(["Kernel"])
+
+    assert english.fit_terms(["Kernel", " kernel"]) is first
+    assert tokenizers == [False]
@@ -0,0 +1,57 @@
+import pytest
+
+from src.utils.transcripting.segments import split_timestamped_tokens
+
+
+class _Tokenizer:
+    """Text tokens are < 100, eot is 100, timestamps start at 101 (0.02 s each)."""
+
+    eot = 100
+    timestamp_begin = 101
+
+    def decode(self, tokens):
+        return "".join(f" w{t}" for t in tokens)
+
+
+def ts(seconds: float) -> int:
+    return _Tokenizer.timestamp_begin + round(seconds / 0.02)
+
+
+def test_segments_between_timestamp_pairs():
+    tokens = [ts(0.0), 1, 2, ts(2.0), ts(2.0), 3, ts(4.0)]
+    segments, covered = split_timestamped_tokens(tokens, _Tokenizer(), 10.0, 30.0)
+
+    assert [(s["start"], s["end"], s["text"]) for s in segments] == [
+        (10.0, 12.0, " w1 w2"),
+        (12.0, 14.0, " w3"),
+    ]
+    assert covered == 30.0  # Single timestamp ending: the window is done
+
+
+def test_trailing_text_is_resumed_from_the_last_timestamp():
+    tokens = [ts(0.0), 1, ts(3.0), ts(3.0), 2, 3]
+    segments, covered = split_timestamped_tokens(tokens, _Tokenizer(), 0.0, 30.0)
+
+    assert [s["text"] for s in segments] == [" w1"]
+    assert covered == pytest.approx(3.0)
+
+
+def test_keep_tail_ends_trailing_text_at_the_window_end():
+    tokens = [ts(0.0), 1, ts(3.0), ts(3.0), 2, 3]
+    segments, covered = split_timestamped_tokens(
+        tokens, _Tokenizer(), 0.0, 25.0, keep_tail=True
+    )
+
+    assert [(s["start"], s["end"], s["text"]) for s in segments] == [
+        (0.0, 3.0, " w1"),
+        (3.0, 25.0, " w2 w3"),
+    ]
+    assert covered == 25.0
+
+
+def test_no_timestamp_pair_is_one_segment():
+    tokens = [ts(0.0), 1, 2, ts(5.0)]
+    segments, _ = split_timestamped_tokens(tokens, _Tokenizer(), 0.0, 30.0)
+
+    assert len(segments) == 1
+    assert (segments[0]["start"], segments[0]["end"]) == (0.0, 5.0)
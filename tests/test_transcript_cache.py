@@ -0,0 +1,45 @@
+import os
+import time
+
+from src.utils.transcripting.transcript_cache import TranscriptCache
+
+
+def _result(text):
+    return {"text": text, "segments": [{"start": 0.0, "end": 1.0, "text": text}]}
+
+
+def test_put_and_get(tmp_path):
+    cache = TranscriptCache(str(tmp_path))
+    key = cache.make_key("audio", {"model_size": "tiny", "temperature": 0.0})
+    cache.put(key, _result("hello"))
+
+    assert cache.get(key) == _result("hello")
+    assert cache.get(cache.make_key("audio", {"model_size": "base"})) is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = TranscriptCache(str(tmp_path))
+    keys = [cache.make_key(f"audio{i}", {}) for i in range(3)]
+    for age, key in zip((30, 20, 10), keys):
+        cache.put(key, _result(key * 50))
+        path = cache._path(key)
+        os.utime(path, (time.time() - age, time.time() - age))
+
+    cache.get(keys[0])  # Oldest entry used again
+    sizes = [os.path.getsize(cache._path(key)) for key in keys]
+    cache.max_bytes = sizes[0] + sizes[2]
+    cache.evict()
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_invalidate_one_recording(tmp_path):
+    cache = TranscriptCache(str(tmp_path))
+    cache.put(cache.make_key("a", {"t": 0}), _result("a0"))
+    cache.put(cache.make_key("a", {"t": 1}), _result("a1"))
+    cache.put(cache.make_key("b", {"t": 0}), _result("b0"))
+
+    assert cache.invalidate(audio_fingerprint="a") == 2
+    assert cache.get(cache.make_key("b", {"t": 0})) is not None
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from src.utils.transcripting.audio_windows import SAMPLE_RATE
+from src.utils.transcripting.backends import StandInBackend
+from src.utils.transcripting.textify import Textify
+from src.utils.transcripting.transcript_checkpoint import TranscriptCheckpoint
+
+
+class _RecordingRunner(StandInBackend):
+    """Stand-in backend that remembers the length of every span it decodes."""
+
+    def __init__(self):
+        super().__init__(realtime_factor=0.0, language="en")
+        self.calls = []
+
+    def transcribe(self, audio, progress_handler=None, **options):
+        self.calls.append(len(audio))
+        return super().transcribe(audio, progress_handler, **options)
+
+
+@pytest.fixture
+def textify():
+    return Textify("tiny", backend=StandInBackend.name, cache=False)
+
+
+def test_save_load_and_clear(tmp_path):
+    checkpoints = TranscriptCheckpoint(str(tmp_path))
+    segments = [{"start": 0.0, "end": 2.0, "text": " hello"}]
+    checkpoints.save("job", 300.0, segments, "en", {"model_size": "tiny"})
+
+    state = checkpoints.load("job")
+    assert state["offset"] == 300.0
+    assert state["segments"] == segments
+    assert state["language"] == "en"
+
+    checkpoints.clear("job")
+    assert checkpoints.load("job") is None
+
+
+def test_resume_decodes_only_the_remaining_spans(textify):
+    audio = np.zeros(30 * SAMPLE_RATE, dtype=np.float32)
+    spans = [
+        (0, 10 * SAMPLE_RATE),
+        (10 * SAMPLE_RATE, 20 * SAMPLE_RATE),
+        (20 * SAMPLE_RATE, len(audio)),
+    ]
+    restored = [{"start": 0.0, "end": 20.0, "text": " restored"}]
+    textify.checkpoints.save("job", 20.0, restored, "en", {})
+
+    runner = _RecordingRunner()
+    result = textify._collect_spans(audio, {}, spans, runner, job=("job", {}))
+
+    assert runner.calls == [10 * SAMPLE_RATE]
+    assert result["segments"][0]["text"] == " restored"
+    assert all(s["start"] >= 20.0 for s in result["segments"][1:])
+    assert result["metadata"]["resumed_from"] == 20.0